@@ -0,0 +1,72 @@
+"""Benchmark of loading messages models from gherkin parser and pickles compiler output.
+
+Compares validated loading by pydantic with trusted loading without validation on large outline:
+
+    python benchmarks/model_loading.py --rows 1000 --steps 10
+"""
+import argparse
+import timeit
+from functools import partial
+
+from gherkin.ast_builder import AstBuilder
+from gherkin.parser import Parser
+from gherkin.pickles.compiler import Compiler
+
+from pytest_bdd.model.loading import construct_model
+from pytest_bdd.model.messages import GherkinDocument, Pickle
+from pytest_bdd.utils import IdGenerator
+
+
+def build_outline(rows: int, steps: int) -> str:
+    step_lines = "\n".join(
+        f"        {'Given' if step == 0 else 'And'} I have <count> cukes in basket {step}\n"
+        f"            | basket | count   |\n"
+        f"            | {step}      | <count> |"
+        for step in range(steps)
+    )
+    rows_lines = "\n".join(f"        | {row} |" for row in range(rows))
+    return (
+        "Feature: Large outline\n"
+        "    Scenario Outline: Outline with <count> cukes\n"
+        f"{step_lines}\n\n"
+        "        Examples:\n"
+        "        | count |\n"
+        f"{rows_lines}\n"
+    )
+
+
+def validated_load(gherkin_document_data, pickles_data):
+    GherkinDocument.parse_obj(gherkin_document_data)
+    [*map(Pickle.parse_obj, pickles_data)]
+
+
+def trusted_load(gherkin_document_data, pickles_data):
+    construct_model(GherkinDocument, gherkin_document_data)
+    [*map(partial(construct_model, Pickle), pickles_data)]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--rows", type=int, default=1000, help="Examples rows of outline")
+    arg_parser.add_argument("--steps", type=int, default=10, help="Steps of outline")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Repeats of every measurement")
+    args = arg_parser.parse_args()
+
+    id_generator = IdGenerator()
+    gherkin_document_data = Parser(ast_builder=AstBuilder(id_generator=id_generator)).parse(
+        build_outline(args.rows, args.steps)
+    )
+    gherkin_document_data["uri"] = "large_outline.feature"
+    pickles_data = Compiler(id_generator=id_generator).compile(gherkin_document_data)
+
+    timings = {}
+    for name, load in [("validated", validated_load), ("trusted", trusted_load)]:
+        timings[name] = min(
+            timeit.repeat(partial(load, gherkin_document_data, pickles_data), number=1, repeat=args.repeat)
+        )
+        print(f"{name:>10}: {timings[name]:.4f}s")
+    print(f"   speedup: {timings['validated'] / timings['trusted']:.1f}x ({len(pickles_data)} pickles)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Benchmark of per-step overhead of resolving step function arguments and step parameters injected as fixtures,
+and of dispatching per-step hooks.
+
+Compares resolution done on every step execution with resolution cached by step definition, and hooks dispatched by
+pluggy or by hook callers revalidated on every call with hook callers built once:
+
+    python benchmarks/step_overhead.py --steps 100000 --args 5
+"""
+import argparse
+import timeit
+from contextlib import suppress
+from functools import partial
+from types import SimpleNamespace
+
+from pytest_bdd import hooks, parsers
+from pytest_bdd.compatibility.pluggy import is_hook_calling_monitored
+from pytest_bdd.compatibility.pytest import PytestPluginManager
+from pytest_bdd.model import StepType
+from pytest_bdd.runner import STEP_HOOKS, HookDispatcher
+from pytest_bdd.steps import StepHandler
+from pytest_bdd.utils import DefaultMapping, get_args
+
+
+def build_step_definition(args: int) -> StepHandler.Definition:
+    fixtures_args = ", ".join(f"fixture_{arg}" for arg in range(args))
+    namespace: dict = {}
+    exec(f"def step_func(step, count, {fixtures_args}): ...", namespace)
+    return StepHandler.Definition(  # type: ignore[call-arg]
+        func=namespace["step_func"],
+        type_=StepType.context,
+        parser=parsers.parse("I have {count} cucumbers"),
+        anonymous_group_names=None,
+        converters={},
+        params_fixtures_mapping=True,
+        param_defaults={},
+        target_fixtures=[],
+        liberal=None,
+    )
+
+
+def uncached_step_overhead(step, step_definition, step_params, fixtures):
+    params_fixtures_mapping = DefaultMapping.instantiate_from_collection_or_bool(
+        step_definition.params_fixtures_mapping or {}, warm_up_keys=step_params.keys()
+    )
+    for param, fixture_name in params_fixtures_mapping.items():
+        if fixture_name is not None:
+            with suppress(KeyError):
+                fixtures[fixture_name] = step_params[param]
+
+    kwargs = {}
+    for param in get_args(step_definition.func):
+        try:
+            kwargs[param] = step_params[param]
+        except KeyError:
+            try:
+                kwargs[param] = dict(step=step)[param]
+            except KeyError:
+                kwargs[param] = fixtures[param]
+    return kwargs
+
+
+def cached_step_overhead(step, step_definition, step_params, fixtures):
+    for param, fixture_name in step_definition.get_params_fixtures(step_params.keys()).items():
+        fixtures[fixture_name] = step_params[param]
+
+    kwargs = {}
+    special_args = step_definition.special_args
+    for param in step_definition.func_args:
+        if param in step_params:
+            kwargs[param] = step_params[param]
+        elif param in special_args:
+            kwargs[param] = step
+        else:
+            kwargs[param] = fixtures[param]
+    return kwargs
+
+
+class AfterStepPlugin:
+    def pytest_bdd_after_step(self, step):
+        ...
+
+
+def build_plugin_manager() -> PytestPluginManager:
+    plugin_manager = PytestPluginManager()
+    plugin_manager.add_hookspecs(hooks)
+    plugin_manager.register(AfterStepPlugin())
+    return plugin_manager
+
+
+def pluggy_hooks_overhead(plugin_manager, hook_kwargs):
+    for name in STEP_HOOKS:
+        getattr(plugin_manager.hook, name)(**hook_kwargs)
+
+
+def revalidated_hooks_overhead(plugin_manager, callers, hook_kwargs):
+    # Implementations and monitoring are inspected on every call and compared with ones caller was built for
+    for name in STEP_HOOKS:
+        hook_caller = getattr(plugin_manager.hook, name)
+        hookimpls = hook_caller.get_hookimpls()
+        is_monitored = is_hook_calling_monitored(plugin_manager)
+        cached = callers.get(name)
+        if cached is None or cached[1] is not is_monitored or cached[2] != hookimpls:
+            cached = callers[name] = (
+                HookDispatcher.build_caller(hook_caller, hookimpls, is_monitored),
+                is_monitored,
+                [*hookimpls],
+            )
+        cached[0](hook_kwargs)
+
+
+def cached_hooks_overhead(dispatcher, hook_kwargs):
+    for name in STEP_HOOKS:
+        dispatcher(name, hook_kwargs)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--steps", type=int, default=100000, help="Executed steps")
+    arg_parser.add_argument("--args", type=int, default=5, help="Fixtures arguments of step function")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Repeats of every measurement")
+    args = arg_parser.parse_args()
+
+    step_definition = build_step_definition(args.args)
+    step = SimpleNamespace(text="I have 5 cucumbers")
+    step_params = step_definition.get_parameters(step)
+    # Fixture values are looked up from dictionary, so only overhead of step function arguments resolution is measured
+    fixtures = {f"fixture_{arg}": arg for arg in range(args.args)}
+
+    timings = {}
+    for name, step_overhead in [("uncached", uncached_step_overhead), ("cached", cached_step_overhead)]:
+        timings[name] = min(
+            timeit.repeat(
+                partial(step_overhead, step, step_definition, step_params, fixtures),
+                number=args.steps,
+                repeat=args.repeat,
+            )
+        )
+        print(f"{name:>10}: {timings[name] / args.steps * 1e6:.2f}us per step")
+    print(f"   speedup: {timings['uncached'] / timings['cached']:.1f}x ({args.steps} steps)")
+
+    # Only after step hook has implementation, like in session without reporting plugins
+    plugin_manager = build_plugin_manager()
+    dispatcher = HookDispatcher(plugin_manager)
+    dispatcher.build()
+    hook_kwargs = dict(
+        request=None,
+        feature=None,
+        scenario=None,
+        step=step,
+        previous_step=None,
+        step_func=None,
+        step_func_args={},
+        step_definition=None,
+        exception=None,
+    )
+    hooks_timings = {}
+    for name, hooks_overhead in [
+        ("pluggy", partial(pluggy_hooks_overhead, plugin_manager, hook_kwargs)),
+        ("revalidated", partial(revalidated_hooks_overhead, plugin_manager, {}, hook_kwargs)),
+        ("built once", partial(cached_hooks_overhead, dispatcher, hook_kwargs)),
+    ]:
+        hooks_timings[name] = min(timeit.repeat(hooks_overhead, number=args.steps, repeat=args.repeat))
+        print(f"{name:>11}: {hooks_timings[name] / args.steps * 1e6:.2f}us per step hooks")
+    print(
+        f"    speedup: {hooks_timings['pluggy'] / hooks_timings['built once']:.1f}x over pluggy, "
+        f"{hooks_timings['revalidated'] / hooks_timings['built once']:.1f}x over revalidated ({args.steps} steps)"
+    )
+
+
+if __name__ == "__main__":
+    main()
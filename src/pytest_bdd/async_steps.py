@@ -0,0 +1,146 @@
+"""Async step definitions.
+
+Step functions defined by ``async def`` (also async generators) are awaited on the event loop provided by the
+``step_event_loop`` fixture. By default it is the single loop which lives for the whole session, so steps of scenarios
+could reuse connections and other loop-bound resources; Loop could be created for every scenario instead. If
+pytest-asyncio ``event_loop`` fixture is visible to scenario, its loop is used, so async steps and async fixtures share
+the same loop.
+"""
+import asyncio
+from functools import partial
+from inspect import isasyncgenfunction, iscoroutinefunction
+from typing import Any, Callable, Iterator, Optional, Union
+
+from attr import attrib, attrs
+
+from pytest_bdd.compatibility.pytest import Config, FixtureRequest, Parser, fail, get_item_fixturedefs
+from pytest_bdd.exceptions import AsyncStepError
+
+EVENT_LOOP_SCOPES = ("session", "scenario")
+
+
+def add_options(parser: Parser):
+    """Add pytest-bdd async steps options."""
+    group = parser.getgroup("bdd", "Async steps")
+    group.addoption(
+        "--bdd-event-loop-scope",
+        action="store",
+        dest="bdd_event_loop_scope",
+        choices=EVENT_LOOP_SCOPES,
+        default=None,
+        help="Scope of event loop which runs async step functions",
+    )
+    parser.addini(
+        "bdd_event_loop_scope",
+        default="session",
+        help="Scope of event loop which runs async step functions: session or scenario",
+    )
+
+
+@attrs
+class SessionEventLoop:
+    scope: str = attrib(default="session")
+    loop: Optional[asyncio.AbstractEventLoop] = attrib(default=None, init=False)
+
+    @classmethod
+    def build(cls, config: Config) -> "SessionEventLoop":
+        scope = config.option.bdd_event_loop_scope
+        scope = config.getini("bdd_event_loop_scope") if scope is None else scope
+        if scope not in EVENT_LOOP_SCOPES:
+            raise ValueError(f"Event loop scope has to be one of {EVENT_LOOP_SCOPES}, got {scope!r}")
+        return cls(scope=scope)  # type: ignore[call-arg]
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get session event loop; Sessions without async steps don't create it at all"""
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+        return self.loop
+
+    def close(self):
+        if self.loop is not None:
+            close_event_loop(self.loop)
+            self.loop = None
+
+
+def close_event_loop(loop: asyncio.AbstractEventLoop):
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+
+def get_session_event_loop(config: Union[Config, Any]) -> Optional[SessionEventLoop]:
+    return getattr(config, "pytest_bdd_session_event_loop", None)
+
+
+def configure(config: Config) -> None:
+    config.pytest_bdd_session_event_loop = SessionEventLoop.build(config)  # type: ignore[attr-defined]
+
+
+def unconfigure(config: Union[Config, Any]) -> None:
+    session_event_loop = get_session_event_loop(config)
+    if session_event_loop is not None:
+        session_event_loop.close()
+
+
+def iter_step_event_loop(request: FixtureRequest) -> Iterator[asyncio.AbstractEventLoop]:
+    """Provide event loop of ``step_event_loop`` fixture"""
+    if get_item_fixturedefs(request._pyfuncitem, "event_loop"):
+        # Share loop with async fixtures of pytest-asyncio
+        yield request.getfixturevalue("event_loop")
+        return
+
+    session_event_loop = get_session_event_loop(request.config)
+    if session_event_loop is not None and session_event_loop.scope == "session":
+        yield session_event_loop.get_loop()
+    else:
+        loop = asyncio.new_event_loop()
+        try:
+            yield loop
+        finally:
+            close_event_loop(loop)
+
+
+def is_async_step_func(func: Callable) -> bool:
+    return iscoroutinefunction(func) or isasyncgenfunction(func)
+
+
+def call_async_step_func(step_func: Callable, request: FixtureRequest, kwargs) -> Any:
+    """Await async step function the same way as pytest calls fixture function; Teardown of async generator step
+    function is awaited when scenario is finished"""
+    loop: asyncio.AbstractEventLoop = request.getfixturevalue("step_event_loop")
+    check_event_loop_is_not_running(step_func, loop)
+    if isasyncgenfunction(step_func):
+        generator = step_func(**kwargs)
+        try:
+            step_result = loop.run_until_complete(generator.__anext__())
+        except StopAsyncIteration:
+            raise ValueError(f"{step_func.__name__} did not yield a value") from None
+        request.addfinalizer(partial(_teardown_async_generator, step_func, generator, loop))
+        return step_result
+    else:
+        return loop.run_until_complete(step_func(**kwargs))
+
+
+def check_event_loop_is_not_running(step_func: Callable, loop: asyncio.AbstractEventLoop):
+    """Steps are awaited by running loop until step is complete, which is impossible for loop already running by
+    this or other thread, e.g. pytest-asyncio loop of async test"""
+    try:
+        running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if loop.is_running() or running_loop is not None:
+        raise AsyncStepError(
+            f'Async step function "{step_func.__name__}" could not be awaited: event loop is already running; '
+            "Scenarios with async steps have to be executed while their event loop is not running"
+        )
+
+
+def _teardown_async_generator(step_func: Callable, generator, loop: asyncio.AbstractEventLoop):
+    check_event_loop_is_not_running(step_func, loop)
+    try:
+        loop.run_until_complete(generator.__anext__())
+    except StopAsyncIteration:
+        pass
+    else:
+        fail(f"{step_func.__name__} step function has more than one 'yield'", pytrace=False)
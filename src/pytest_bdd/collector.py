@@ -15,6 +15,8 @@ from pytest_bdd.webloc import read as webloc_read
 
 class Module(PytestModule):
     def collect(self):
+        from pytest_bdd.plugin import prefetch_module_features
+
         StepHandler.Registry.inject_registry_fixture_and_register_steps(self.obj)
         try:
             registry = self.obj.step_registry.__registry__.registry
@@ -26,21 +28,24 @@ class Module(PytestModule):
                 config.hook.pytest_bdd_message(
                     config=config, message=Message(stepDefinition=step_definition.as_message(config=config))
                 )
+        prefetch_module_features(self.obj, config)
         return super().collect()
 
 
 class FeatureFileModule(Module):
     def _getobj(self):
-        path: Path = self.get_path()
+        return self._build_test_module(*self.get_feature_pathlike_and_base_dir(self.get_path()))
+
+    @classmethod
+    def get_feature_pathlike_and_base_dir(cls, path: Path):
         if ".url" == path.suffixes[-1]:
-            feature_pathlike, base_dir = self.get_feature_pathlike_from_url_file(path)
+            return cls.get_feature_pathlike_from_url_file(path)
         elif ".desktop" == path.suffixes[-1]:
-            feature_pathlike, base_dir = self.get_feature_pathlike_from_desktop_file(path), None
+            return cls.get_feature_pathlike_from_desktop_file(path), None
         elif ".webloc" == path.suffixes[-1]:
-            feature_pathlike, base_dir = self.get_feature_pathlike_from_weblock_file(path), None
+            return cls.get_feature_pathlike_from_weblock_file(path), None
         else:
-            feature_pathlike, base_dir = path, None
-        return self._build_test_module(feature_pathlike, base_dir)
+            return path, None
 
     def _build_test_module(self, path: Optional[Path], base_dir: Optional[Path]):
         module_name = convert_str_to_python_name(f"{path}_{uuid4()}")
@@ -1,5 +1,6 @@
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Sequence, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, Union
 
 from pytest_bdd.compatibility.pytest import Config
 from pytest_bdd.compatibility.typing import Protocol, runtime_checkable
@@ -9,6 +10,11 @@ if TYPE_CHECKING:  # pragma: no cover
     from pytest_bdd.model import Feature
 
 
+def decode_text(data: bytes, encoding: str = "utf-8") -> str:
+    """Decode content same way as file opened in text mode does, so newlines are translated"""
+    return TextIOWrapper(BytesIO(data), encoding=encoding).read()
+
+
 @runtime_checkable
 class ParserProtocol(Protocol):
     # Defines which files would be parsed
@@ -19,5 +25,39 @@ class ParserProtocol(Protocol):
 
     def parse(
         self, config: Union[Config, PytestBDDIdGeneratorHandler], path: Path, uri: str, *args, **kwargs
+    ) -> "Feature":
+        return self.parse_bytes(config, path.read_bytes(), uri, *args, path=path, **kwargs)
+
+    def parse_bytes(
+        self,
+        config: Union[Config, PytestBDDIdGeneratorHandler],
+        data: bytes,
+        uri: str,
+        *args,
+        path: Optional[Path] = None,
+        **kwargs,
+    ) -> "Feature":
+        encoding = kwargs.pop("encoding", "utf-8")
+        return self.parse_text(config, decode_text(data, encoding), uri, *args, path=path, **kwargs)
+
+    def parse_text(
+        self,
+        config: Union[Config, PytestBDDIdGeneratorHandler],
+        data: str,
+        uri: str,
+        *args,
+        path: Optional[Path] = None,
+        **kwargs,
     ) -> "Feature":  # pragma: no cover
+        """Parse feature from content already loaded to memory
+
+        :param path: Path of feature file if content was read from file; Used as feature filename instead of uri
+        """
         ...
+
+
+def is_content_parser(parser: Any) -> bool:
+    """Check if parser could parse content from memory; Parsers built before `parse_text` was introduced parse only
+    files"""
+    parse_text = getattr(type(parser), "parse_text", None)
+    return parse_text is not None and parse_text is not ParserProtocol.parse_text
@@ -0,0 +1,15 @@
+"""Compatibility module for pluggy"""
+from typing import Any
+
+try:
+    from pluggy._callers import _multicall
+except ImportError:  # pragma: no cover
+    _multicall = None
+
+
+def is_hook_calling_monitored(plugin_manager: Any) -> bool:
+    """Check if hook calls are traced, e.g. by pytester hook recorder or pytest ``--debug``
+
+    Hook calls are treated as monitored if it couldn't be checked for the installed pluggy version
+    """
+    return _multicall is None or getattr(plugin_manager, "_inner_hookexec", None) is not _multicall
@@ -0,0 +1,18 @@
+"""Compatibility module for pydantic"""
+try:
+    from pydantic.fields import SHAPE_LIST, SHAPE_SEQUENCE, SHAPE_SINGLETON, ModelField
+except ImportError:  # pragma: no cover
+    # Models of pydantic 2 don't expose fields shapes
+    MODEL_FIELDS_SHAPES_SUPPORTED = False
+    SHAPE_LIST = SHAPE_SEQUENCE = SHAPE_SINGLETON = None  # type: ignore[assignment]
+    ModelField = None  # type: ignore[assignment,misc]
+else:
+    MODEL_FIELDS_SHAPES_SUPPORTED = True
+
+__all__ = [
+    "MODEL_FIELDS_SHAPES_SUPPORTED",
+    "ModelField",
+    "SHAPE_LIST",
+    "SHAPE_SEQUENCE",
+    "SHAPE_SINGLETON",
+]
@@ -6,13 +6,14 @@ from __future__ import annotations
 import sys
 from operator import ge
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Sequence, cast
 
 from _pytest.config import Config, PytestPluginManager
 from _pytest.config.argparsing import Parser
 from _pytest.fixtures import FixtureDef, FixtureLookupError, call_fixture_func
 from _pytest.main import Session, wrap_session
 from _pytest.mark import Mark, MarkDecorator
+from _pytest.outcomes import OutcomeException
 from _pytest.python import Metafunc
 from _pytest.reports import TestReport
 from _pytest.runner import CallInfo
@@ -33,18 +34,20 @@ def is_pytest_version_greater(version: str):
     return compare_distribution_version("pytest", version, ge)
 
 
-PYTEST6, PYTEST61, PYTEST62, PYTEST7 = map(
+PYTEST6, PYTEST61, PYTEST62, PYTEST7, PYTEST81 = map(
     is_pytest_version_greater,
     [
         "6.0",
         "6.1",
         "6.2",
         "7.0",
+        "8.1",
     ],
 )
 
 if PYTEST6:
     from _pytest.config import ExitCode
+    from _pytest.skipping import evaluate_skip_marks, evaluate_xfail_marks
 else:
     ExitCode: TypeAlias = int  # type:ignore[no-redef]
 
@@ -132,6 +135,27 @@ def get_config_root_path(config: Config) -> Path:
     return Path(getattr(cast(Config, config), "rootpath" if PYTEST61 else "rootdir"))
 
 
+def get_item_fixturedefs(item: Item, argname: str) -> Sequence[FixtureDef]:
+    """Get definitions of fixture visible by item; Fixture could be not requested by item directly"""
+    fixturemanager = item.session._fixturemanager
+    fixturedefs = fixturemanager.getfixturedefs(argname, item if PYTEST81 else item.nodeid)  # type: ignore[arg-type]
+    return fixturedefs or ()
+
+
+def is_item_run_skipped(item: Item) -> bool:
+    """Check that item call is skipped by skip, skipif or xfail(run=False) markers; Such items are only set up and
+    reported by pytest itself, so errors of markers evaluation are left to it as well"""
+    if not PYTEST6:
+        return any(True for name in ("skip", "skipif", "xfail") for _ in item.iter_markers(name=name))
+    try:
+        if evaluate_skip_marks(item) is not None:
+            return True
+        xfailed = evaluate_xfail_marks(item)
+    except Exception:
+        return True
+    return xfailed is not None and not xfailed.run and not item.config.option.runxfail
+
+
 def fail(reason, pytrace=True):
     __tracebackhide__ = True
     if PYTEST7:
@@ -152,10 +176,13 @@ __all__ = [
     "FixtureLookupError",
     "FixtureRequest",
     "get_config_root_path",
+    "get_item_fixturedefs",
+    "is_item_run_skipped",
     "Mark",
     "MarkDecorator",
     "Metafunc",
     "Module",
+    "OutcomeException",
     "Parser",
     "PytestPluginManager",
     "PYTEST6",
@@ -0,0 +1,8 @@
+import sys
+
+if sys.version_info >= (3, 11):
+    from re import _parser as sre_parse
+else:
+    import sre_parse
+
+__all__ = ["sre_parse"]
@@ -0,0 +1,321 @@
+"""Concurrent execution of scenarios.
+
+Scenarios marked as ``thread_safe`` are executed by the pool of worker threads ahead of their pytest items: when item
+is called, it and following thread safe items of the same parent are dispatched to the pool. Pytest could hold only
+one item set up at once, so dispatched scenario is executed detached from its item: steps get step arguments, fixtures
+injected by previous steps and higher-scoped fixtures resolved in advance. Per-step hooks are recorded and replayed
+in order when the item itself is called, so reports look the same as if scenarios were executed one by one.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from attr import Factory, attrib, attrs
+
+from pytest_bdd.async_steps import is_async_step_func
+from pytest_bdd.compatibility.pytest import (
+    Config,
+    Item,
+    OutcomeException,
+    Parser,
+    get_item_fixturedefs,
+    is_item_run_skipped,
+)
+from pytest_bdd.execution_plan import get_item_registry, get_plan
+from pytest_bdd.model import Feature
+from pytest_bdd.model.messages import Pickle
+from pytest_bdd.utils import inject_fixture
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pytest_bdd.runner import ScenarioRunner
+
+THREAD_SAFE_MARKER = "thread_safe"
+
+# Hooks which are executed by worker threads; Only built-in implementations of them are known to be thread safe
+BUILTIN_ONLY_HOOKS = (
+    "pytest_bdd_run_scenario",
+    "pytest_bdd_get_step_dispatcher",
+    "pytest_bdd_run_step",
+    "pytest_bdd_get_step_caller",
+)
+UNIMPLEMENTED_HOOKS = ("pytest_bdd_before_step_call",)
+# Hooks which are recorded by worker threads and replayed when item is called
+RECORDED_HOOKS = frozenset(
+    {
+        "pytest_bdd_before_step",
+        "pytest_bdd_after_step",
+        "pytest_bdd_step_error",
+        "pytest_bdd_step_func_lookup_error",
+    }
+)
+
+
+def add_options(parser: Parser):
+    """Add pytest-bdd concurrency options."""
+    group = parser.getgroup("bdd", "Concurrency")
+    group.addoption(
+        "--bdd-concurrency",
+        action="store",
+        dest="bdd_concurrency",
+        type=int,
+        metavar="N",
+        default=None,
+        help="Execute up to N scenarios marked as thread_safe at once by worker threads",
+    )
+    parser.addini(
+        "bdd_concurrency",
+        default="1",
+        help="Execute up to N scenarios marked as thread_safe at once by worker threads",
+    )
+
+
+def get_concurrency(config: Config) -> int:
+    concurrency = config.option.bdd_concurrency
+    return int(config.getini("bdd_concurrency")) if concurrency is None else concurrency
+
+
+def is_enabled(config: Config) -> bool:
+    return get_concurrency(config) > 1
+
+
+@attrs
+class DetachedRequest:
+    """Stands for fixture request of scenario executed by worker thread"""
+
+    config: Config = attrib()
+    node: Item = attrib()
+    values: Dict[str, Any] = attrib(default=Factory(dict))
+    injected: Dict[str, Any] = attrib(default=Factory(dict))
+    finalizers: List[Callable[[], Any]] = attrib(default=Factory(list))
+    fixturename = None
+
+    def getfixturevalue(self, argname: str) -> Any:
+        try:
+            return self.injected[argname]
+        except KeyError:
+            try:
+                return self.values[argname]
+            except KeyError:
+                raise LookupError(f"Fixture {argname!r} is not available to concurrently executed scenario") from None
+
+    def inject_fixture(self, arg: str, value: Any):
+        self.injected[arg] = value
+
+    def addfinalizer(self, finalizer: Callable[[], Any]):
+        self.finalizers.append(finalizer)
+
+
+@attrs
+class HookRecorder:
+    """Records calls of per-step hooks made by worker thread; Other hooks are called by wrapped dispatcher"""
+
+    hook_dispatcher: Callable[[str, Dict[str, Any]], Any] = attrib()
+    calls: List[Tuple[str, Dict[str, Any]]] = attrib(default=Factory(list))
+
+    def __call__(self, name: str, kwargs: Dict[str, Any]):
+        if name in RECORDED_HOOKS:
+            self.calls.append((name, dict(kwargs)))
+            return None
+        return self.hook_dispatcher(name, kwargs)
+
+
+@attrs
+class DetachedRun:
+    request: DetachedRequest = attrib()
+    hook_recorder: HookRecorder = attrib()
+    future: "Future[Optional[BaseException]]" = attrib(default=None)
+
+    def replay(self, request, hook_dispatcher: Callable[[str, Dict[str, Any]], Any]):
+        """Wait for scenario and replay its per-step hooks for item request; Exception raised by steps is re-raised"""
+        exception = self.future.result()
+        for finalizer in self.request.finalizers:
+            request.addfinalizer(finalizer)
+        for arg, value in self.request.injected.items():
+            inject_fixture(request, arg, value)
+        for name, kwargs in self.hook_recorder.calls:
+            hook_dispatcher(name, {**kwargs, "request": request})
+        if exception is not None:
+            raise exception
+
+
+def _run_detached(runner: "ScenarioRunner", *args) -> Optional[BaseException]:
+    try:
+        runner.run_detached_scenario(*args)
+    except BaseException as exception:
+        # Outcome exceptions of pytest are re-raised by the main thread as well
+        return exception
+    return None
+
+
+@attrs(eq=False)
+class ConcurrentScenarios:
+    concurrency: int = attrib(default=1)
+    executor: Optional[ThreadPoolExecutor] = attrib(default=None, init=False)
+    runs: Dict[str, DetachedRun] = attrib(default=Factory(dict), init=False)
+    # Items which follow items on xdist workers, where the whole list of items isn't known in advance
+    next_items: Dict[str, Optional[Item]] = attrib(default=Factory(dict), init=False)
+    items_indexes: Optional[Dict[str, int]] = attrib(default=None, init=False)
+
+    @classmethod
+    def build(cls, config: Config) -> "ConcurrentScenarios":
+        return cls(concurrency=get_concurrency(config))  # type: ignore[call-arg]
+
+    def pytest_runtest_protocol(self, item: Item, nextitem: Optional[Item]):
+        if hasattr(item.config, "workerinput"):
+            self.next_items[item.nodeid] = nextitem
+
+    def get_detached_run(self, item: Item, runner: "ScenarioRunner") -> Optional[DetachedRun]:
+        if is_runner_thread_safe(item.config):
+            self.dispatch_upcoming(item, runner)
+        return self.runs.pop(item.nodeid, None)
+
+    def dispatch_upcoming(self, item: Item, runner: "ScenarioRunner"):
+        """Keep up to concurrency limit of item and following items of the same parent dispatched"""
+        dispatched = 0
+        for candidate in self.iter_upcoming_items(item):
+            if dispatched == self.concurrency or candidate.parent is not item.parent:
+                break
+            if candidate.nodeid in self.runs:
+                dispatched += 1
+                continue
+            candidate_run = self.dispatch(candidate, runner)
+            if candidate_run is None:
+                break
+            self.runs[candidate.nodeid] = candidate_run
+            dispatched += 1
+
+    def iter_upcoming_items(self, item: Item) -> Iterator[Item]:
+        if hasattr(item.config, "workerinput"):
+            yield item
+            next_item = self.next_items.pop(item.nodeid, None)
+            if next_item is not None:
+                yield next_item
+            return
+
+        items = item.session.items
+        if self.items_indexes is None:
+            self.items_indexes = {candidate.nodeid: index for index, candidate in enumerate(items)}
+        index = self.items_indexes.get(item.nodeid)
+        if index is None or items[index] is not item:
+            yield item
+        else:
+            yield from items[index:]
+
+    def dispatch(self, item: Item, runner: "ScenarioRunner") -> Optional[DetachedRun]:
+        """Submit scenario of item to worker threads if it could be executed detached from item"""
+        if item.get_closest_marker(THREAD_SAFE_MARKER) is None:
+            return None
+        # Skipped items are never called, so their scenarios must not be executed ahead of them
+        if is_item_run_skipped(item):
+            return None
+        callspec = getattr(item, "callspec", None)
+        if callspec is None:
+            return None
+        feature: Optional[Feature] = callspec.params.get("feature")
+        pickle: Optional[Pickle] = callspec.params.get("scenario")
+        plan = get_plan(item)
+        if not isinstance(feature, Feature) or not isinstance(pickle, Pickle) or plan is None:
+            return None
+        if not plan.is_valid(get_item_registry(item)):
+            return None
+        fixtures = get_detached_fixtures(item, plan, feature, pickle)
+        if fixtures is None:
+            return None
+
+        request = DetachedRequest(config=item.config, node=item)  # type: ignore[call-arg]
+        try:
+            for argname in fixtures:
+                request.values[argname] = item._request.getfixturevalue(argname)  # type: ignore[attr-defined]
+        except (Exception, OutcomeException):
+            # Fixture errors are reported by setup of the item itself
+            return None
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="pytest-bdd")
+        hook_recorder = HookRecorder(runner.get_hook_dispatcher(item.config))  # type: ignore[call-arg]
+        detached_run = DetachedRun(request=request, hook_recorder=hook_recorder)  # type: ignore[call-arg]
+        detached_run.future = self.executor.submit(_run_detached, runner, request, feature, pickle, plan, hook_recorder)
+        return detached_run
+
+    def shutdown(self):
+        for detached_run in self.runs.values():
+            detached_run.future.cancel()
+        self.runs.clear()
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+def is_runner_thread_safe(config: Config) -> bool:
+    """Check that hooks executed by worker threads are not implemented by other plugins"""
+    return all(len(getattr(config.hook, name).get_hookimpls()) == 1 for name in BUILTIN_ONLY_HOOKS) and not any(
+        getattr(config.hook, name).get_hookimpls() for name in UNIMPLEMENTED_HOOKS
+    )
+
+
+def is_detachable_fixture(item: Item, argname: str) -> bool:
+    """Check that fixture could be resolved in advance without setting the item up"""
+    fixturedefs = get_item_fixturedefs(item, argname)
+    return bool(fixturedefs) and fixturedefs[-1].scope != "function" and fixturedefs[-1].params is None
+
+
+def get_detached_fixtures(item: Item, plan, feature: Feature, pickle: Pickle) -> Optional[List[str]]:
+    """Get names of fixtures which have to be resolved in advance for scenario executed detached from item; Scenario
+    couldn't be executed detached if item or its steps require function-scoped or parametrized fixtures"""
+    fixtures: List[str] = []
+    # Fixtures of the item closure, like autouse ones, are set up by pytest for the item itself
+    params = getattr(item, "callspec").params
+    for arg in item.fixturenames:
+        if arg == "request" or (arg in params and not get_item_fixturedefs(item, arg)):
+            continue
+        if not is_detachable_fixture(item, arg):
+            return None
+        fixtures.append(arg)
+
+    provided = set()
+    # Views of steps are built by main thread, so hooks get the same step objects
+    for step in feature.get_executable_steps(pickle):
+        step_plan = plan.get_step_plan(step)
+        if step_plan is None:
+            return None
+        step_definition = step_plan.step_definition
+        if is_async_step_func(step_definition.func):
+            return None
+        provided.update(step_plan.params_fixtures.values())
+        for arg in step_plan.func_args:
+            if arg in step_plan.params_names or arg in step_definition.special_args or arg in provided:
+                continue
+            if arg in fixtures:
+                continue
+            if not is_detachable_fixture(item, arg):
+                return None
+            fixtures.append(arg)
+        provided.update(step_definition.target_fixtures)
+    return fixtures
+
+
+def get_concurrent_scenarios(config: Union[Config, Any]) -> Optional[ConcurrentScenarios]:
+    return getattr(config, "pytest_bdd_concurrency", None)
+
+
+def get_detached_run(item: Item, runner: "ScenarioRunner") -> Optional[DetachedRun]:
+    concurrent_scenarios = get_concurrent_scenarios(item.config)
+    return None if concurrent_scenarios is None else concurrent_scenarios.get_detached_run(item, runner)
+
+
+def configure(config: Config) -> None:
+    config.addinivalue_line(
+        "markers", f"{THREAD_SAFE_MARKER}: scenario could be executed concurrently with other scenarios"
+    )
+    if is_enabled(config):
+        concurrent_scenarios = ConcurrentScenarios.build(config)
+        config.pytest_bdd_concurrency = concurrent_scenarios  # type: ignore[attr-defined]
+        config.pluginmanager.register(concurrent_scenarios, name="pytest_bdd_concurrency")
+
+
+def unconfigure(config: Config) -> None:
+    concurrent_scenarios = get_concurrent_scenarios(config)
+    if concurrent_scenarios is not None:
+        concurrent_scenarios.shutdown()
+        with suppress(ValueError):
+            config.pluginmanager.unregister(name="pytest_bdd_concurrency")
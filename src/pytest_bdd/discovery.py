@@ -0,0 +1,200 @@
+"""Discovery of feature files.
+
+Directories are listed by `os.scandir`, so file types are known from directory entries without stat of every file;
+Ignored directories (`norecursedirs` patterns) are pruned before they are entered; Like by `os.walk`, symlinked
+directories are not listed, so walk and recursive patterns don't loop over links. Optionally listings are kept in
+directory index persisted by pytest cache: listing of directory is reused while directory mtime is not changed.
+"""
+import os
+import time
+from fnmatch import fnmatchcase
+from glob import has_magic
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from attr import Factory, attrib, attrs
+
+from pytest_bdd.compatibility.pytest import Config, Parser
+
+DIRECTORY_INDEX_CACHE_KEY = "pytest_bdd/discovery_index"
+# Directories modified recently could be modified again within same mtime tick, so their listings are not indexed
+DIRECTORY_INDEX_MTIME_GRANULARITY_NS = 2 * 10**9
+RECURSIVE_PATTERN_PART = "**"
+
+Listing = Tuple[List[str], List[str]]
+
+
+def add_options(parser: Parser) -> None:
+    parser.addini(
+        "bdd_discovery_index",
+        type="bool",
+        default=False,
+        help="Persist index of directories listings between runs, so unchanged directories are not rescanned",
+    )
+
+
+def scan_dir(path: str) -> Listing:
+    """List sorted names of files and directories in given directory"""
+    file_names, dir_names = [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dir_names.append(entry.name)
+                    elif entry.is_file():
+                        file_names.append(entry.name)
+                except OSError:
+                    continue
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        pass
+    return sorted(file_names), sorted(dir_names)
+
+
+@attrs
+class DirectoryIndex:
+    entries: Dict[str, Tuple[int, List[str], List[str]]] = attrib(default=Factory(dict))
+    is_changed: bool = attrib(default=False)
+
+    @classmethod
+    def load(cls, config: Config) -> "DirectoryIndex":
+        raw_entries = config.cache.get(DIRECTORY_INDEX_CACHE_KEY, {})  # type: ignore[union-attr]
+        return cls(
+            entries={
+                path: (mtime, list(file_names), list(dir_names))
+                for path, (mtime, file_names, dir_names) in raw_entries.items()
+            }
+        )
+
+    def dump(self, config: Config) -> None:
+        config.cache.set(DIRECTORY_INDEX_CACHE_KEY, self.entries)  # type: ignore[union-attr]
+        self.is_changed = False
+
+    def list_dir(self, path: str) -> Listing:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return [], []
+
+        indexed_entry = self.entries.get(path)
+        if indexed_entry is not None and indexed_entry[0] == mtime:
+            return indexed_entry[1], indexed_entry[2]
+
+        file_names, dir_names = scan_dir(path)
+        if time.time_ns() - mtime > DIRECTORY_INDEX_MTIME_GRANULARITY_NS:
+            self.entries[path] = (mtime, file_names, dir_names)
+            self.is_changed = True
+        elif self.entries.pop(path, None) is not None:
+            self.is_changed = True
+        return file_names, dir_names
+
+
+@attrs
+class FeatureDiscovery:
+    """Walks directories and matches glob patterns against files
+
+    :param ignored_dirs: fnmatch patterns of directory names which are not entered by recursive walks or wildcards;
+        Directories named literally in patterns are entered anyway
+    :param index: Directory index used instead of scanning directories
+    """
+
+    ignored_dirs: Sequence[str] = attrib(default=())
+    index: Optional[DirectoryIndex] = attrib(default=None)
+
+    @classmethod
+    def build(cls, config: Config) -> "FeatureDiscovery":
+        index = None
+        if config.getini("bdd_discovery_index") and getattr(config, "cache", None) is not None:
+            index = DirectoryIndex.load(config)
+        return cls(ignored_dirs=tuple(config.getini("norecursedirs")), index=index)
+
+    def list_dir(self, path: str) -> Listing:
+        return scan_dir(path) if self.index is None else self.index.list_dir(path)
+
+    def is_ignored_dir(self, dir_name: str) -> bool:
+        return any(fnmatchcase(dir_name, pattern) for pattern in self.ignored_dirs)
+
+    def walk(self, root: Union[str, Path], is_matching: Optional[Callable[[Path], Any]] = None) -> Iterator[Path]:
+        """Yield files of directory tree; Files are filtered by `is_matching` predicate if one is given"""
+        for file_path in self._walk(str(root)):
+            path = Path(file_path)
+            if is_matching is None or is_matching(path):
+                yield path
+
+    def glob(self, root: Union[str, Path], pattern: str) -> Iterator[Path]:
+        """Yield files matching glob pattern relative to root; Same pattern semantics as `Path.glob` is used"""
+        pattern_path = Path(pattern)
+        if pattern_path.is_absolute():
+            root, pattern_parts = pattern_path.anchor, pattern_path.parts[1:]
+        else:
+            pattern_parts = pattern_path.parts
+        if not pattern_parts:
+            raise ValueError(f"Unacceptable pattern: {pattern!r}")
+
+        seen_file_paths = set()
+        for file_path in self._glob(str(root), pattern_parts):
+            if file_path not in seen_file_paths:
+                seen_file_paths.add(file_path)
+                yield Path(file_path)
+
+    def _walk(self, dir_path: str) -> Iterator[str]:
+        file_names, dir_names = self.list_dir(dir_path)
+        for file_name in file_names:
+            yield os.path.join(dir_path, file_name)
+        for dir_name in dir_names:
+            if not self.is_ignored_dir(dir_name):
+                yield from self._walk(os.path.join(dir_path, dir_name))
+
+    def _glob(self, dir_path: str, pattern_parts: Sequence[str]) -> Iterator[str]:
+        part, rest_parts = pattern_parts[0], pattern_parts[1:]
+        if part == RECURSIVE_PATTERN_PART:
+            if not rest_parts:
+                # Like Path.glob, bare recursive pattern matches only directories
+                return
+            yield from self._glob(dir_path, rest_parts)
+            for dir_name in self.list_dir(dir_path)[1]:
+                if not self.is_ignored_dir(dir_name):
+                    yield from self._glob(os.path.join(dir_path, dir_name), pattern_parts)
+        elif not has_magic(part):
+            path = os.path.join(dir_path, part)
+            if rest_parts:
+                if os.path.isdir(path):
+                    yield from self._glob(path, rest_parts)
+            elif os.path.isfile(path):
+                yield path
+        else:
+            file_names, dir_names = self.list_dir(dir_path)
+            if rest_parts:
+                for dir_name in dir_names:
+                    if fnmatchcase(dir_name, part) and not self.is_ignored_dir(dir_name):
+                        yield from self._glob(os.path.join(dir_path, dir_name), rest_parts)
+            else:
+                for file_name in file_names:
+                    if fnmatchcase(file_name, part):
+                        yield os.path.join(dir_path, file_name)
+
+
+@attrs
+class DiscoveryGlob:
+    """Glob callable of parsers; Finds files matching pattern in given directory"""
+
+    pattern: str = attrib()
+    discovery: FeatureDiscovery = attrib(default=Factory(FeatureDiscovery))
+
+    def __call__(self, path: Union[str, Path]) -> List[Path]:
+        return list(self.discovery.glob(path, self.pattern))
+
+
+def get_discovery(config: Union[Config, Any]) -> FeatureDiscovery:
+    discovery = getattr(config, "pytest_bdd_feature_discovery", None)
+    return FeatureDiscovery() if discovery is None else discovery
+
+
+def configure(config: Config) -> None:
+    config.pytest_bdd_feature_discovery = FeatureDiscovery.build(config)  # type: ignore[attr-defined]
+
+
+def unconfigure(config: Union[Config, Any]) -> None:
+    discovery = getattr(config, "pytest_bdd_feature_discovery", None)
+    if discovery is not None and discovery.index is not None and discovery.index.is_changed:
+        discovery.index.dump(config)
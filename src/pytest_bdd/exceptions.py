@@ -41,3 +41,15 @@ class FeatureError(Exception):
     def __str__(self):
         """String representation."""
         return self.message.format(*self.args)
+
+
+class HttpCacheMissError(Exception):
+    """Remote feature is not cached, but could not be requested in offline mode."""
+
+
+class ForkedScenarioError(Exception):
+    """Exception raised by forked process of scenario could not be transferred back."""
+
+
+class AsyncStepError(Exception):
+    """Async step function could not be awaited on event loop of scenario."""
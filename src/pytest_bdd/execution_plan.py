@@ -0,0 +1,181 @@
+"""Execution plans of scenarios.
+
+When plans are enabled, steps of every collected scenario are resolved once at the end of collection: each step is
+matched to its step definition, step arguments are parsed, and names of step function arguments and fixtures injected
+from step arguments are resolved. Converters of step definitions are applied when the step is executed, like without
+plans, so they aren't called for deselected items and converted values aren't shared between executions. Runner
+executes plan steps directly; Steps are matched dynamically if step definitions were registered after the plan was
+built or the item uses another step registries chain.
+"""
+from contextlib import suppress
+from operator import is_
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from attr import attrib, attrs
+
+from pytest_bdd.compatibility.pytest import Config, Item, Parser, get_item_fixturedefs
+from pytest_bdd.model import Feature
+from pytest_bdd.model.messages import Pickle
+from pytest_bdd.steps import StepHandler
+
+ITEM_PLAN_ATTR = "pytest_bdd_execution_plan"
+
+
+def add_options(parser: Parser):
+    """Add pytest-bdd execution plans options."""
+    group = parser.getgroup("bdd", "Execution plans")
+    group.addoption(
+        "--bdd-execution-plans",
+        action="store_true",
+        dest="bdd_execution_plans",
+        default=None,
+        help="Resolve step definitions and step arguments of scenarios at the end of collection",
+    )
+    parser.addini(
+        "bdd_execution_plans",
+        type="bool",
+        default=False,
+        help="Resolve step definitions and step arguments of scenarios at the end of collection",
+    )
+
+
+def is_enabled(config: Config) -> bool:
+    is_plans_enabled = config.option.bdd_execution_plans
+    return config.getini("bdd_execution_plans") if is_plans_enabled is None else is_plans_enabled
+
+
+@attrs
+class StepPlan:
+    step_definition: StepHandler.Definition = attrib()
+    # Step arguments parsed from step text; Converters are not applied yet
+    arguments: Dict[str, Any] = attrib()
+    # Names of step parameters: parsed arguments and parameters defaults
+    params_names: AbstractSet[str] = attrib()
+    # Step parameters which are injected as fixtures, mapped to fixture names
+    params_fixtures: Dict[str, str] = attrib()
+    func_args: Sequence[str] = attrib()
+
+    @classmethod
+    def build(cls, step, step_definition: StepHandler.Definition, match_result=None) -> "StepPlan":
+        arguments = step_definition.parse_arguments(step, match_result=match_result)
+        params_names = frozenset({*step_definition.param_defaults.keys(), *arguments.keys()})
+        return cls(  # type: ignore[call-arg]
+            step_definition=step_definition,
+            arguments=arguments,
+            params_names=params_names,
+            params_fixtures=step_definition.get_params_fixtures(params_names),
+            func_args=step_definition.func_args,
+        )
+
+    def get_step_params(self) -> Dict[str, Any]:
+        """Convert parsed step arguments for execution of step"""
+        return self.step_definition.convert_arguments(self.arguments)
+
+
+@attrs
+class ExecutionPlan:
+    registries: Tuple[StepHandler.Registry, ...] = attrib()
+    registrations_count: int = attrib()
+    steps: Dict[str, StepPlan] = attrib()
+
+    def is_valid(self, step_registry: Optional[StepHandler.Registry]) -> bool:
+        """Check if plan could be used with step registry got by item at run time"""
+        registries = tuple(iter_registries(step_registry))
+        return (
+            StepHandler.Registry.registrations_count == self.registrations_count
+            and len(registries) == len(self.registries)
+            and all(map(is_, registries, self.registries))
+        )
+
+    def get_step_plan(self, step) -> Optional[StepPlan]:
+        return self.steps.get(step.id)
+
+
+def iter_registries(registry: Optional[StepHandler.Registry]) -> Iterable[StepHandler.Registry]:
+    while registry:
+        yield registry
+        registry = getattr(registry, "parent", None)
+
+
+def get_item_registry(item: Item) -> Optional[StepHandler.Registry]:
+    """Get step registry which item would get from `step_registry` fixture; Parents are bound the same way as the
+    fixture does"""
+    if len(get_item_fixturedefs(item, "step_matcher")) != 1:
+        # Step matcher is overridden, so steps have to be matched by it
+        return None
+
+    registries: List[StepHandler.Registry] = []
+    for fixturedef in get_item_fixturedefs(item, "step_registry"):
+        registry = getattr(fixturedef.func, "__registry__", None)
+        if registry is None:
+            # Step registry fixture is overridden by user
+            return None
+        registries.append(registry)
+    if not registries:
+        return None
+
+    for parent, registry in zip(registries, registries[1:]):
+        registry.parent = parent
+    return registries[-1]
+
+
+def build_plan(item: Item, config: Config) -> Optional[ExecutionPlan]:
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return None
+    feature: Optional[Feature] = callspec.params.get("feature")
+    pickle: Optional[Pickle] = callspec.params.get("scenario")
+    if not isinstance(feature, Feature) or not isinstance(pickle, Pickle):
+        return None
+    step_registry = get_item_registry(item)
+    if step_registry is None:
+        return None
+
+    matcher = StepHandler.Matcher(config)  # type: ignore[call-arg]
+    steps: Dict[str, StepPlan] = {}
+    previous_step = None
+    for step in pickle.steps:
+        try:
+            step_definition = matcher(feature, pickle, step, previous_step, step_registry)
+            steps[step.id] = StepPlan.build(
+                step, step_definition, match_result=matcher.get_last_match_result(step, step_definition)
+            )
+        except Exception:
+            # Scenario couldn't be planned; Its steps are matched at run time and errors are reported as usual
+            return None
+        previous_step = step
+
+    return ExecutionPlan(  # type: ignore[call-arg]
+        registries=tuple(iter_registries(step_registry)),
+        registrations_count=StepHandler.Registry.registrations_count,
+        steps=steps,
+    )
+
+
+def build_plans(config: Config, items: Iterable[Item], required: bool = False) -> None:
+    """Build plans of scenario items if plans are enabled or required by other features"""
+    if not (required or is_enabled(config)):
+        return
+    if len(config.hook.pytest_bdd_match_step_definition_to_step.get_hookimpls()) != 1:
+        # Steps are matched by other plugins
+        return
+    for item in items:
+        if item.get_closest_marker("pytest_bdd_scenario") is None:
+            continue
+        plan = build_plan(item, config)
+        if plan is not None:
+            setattr(item, ITEM_PLAN_ATTR, plan)
+
+
+def get_plan(item: Union[Item, Any]) -> Optional[ExecutionPlan]:
+    return getattr(item, ITEM_PLAN_ATTR, None)
+
+
+def get_valid_plan(item: Item) -> Optional[ExecutionPlan]:
+    plan = get_plan(item)
+    if plan is None:
+        return None
+    step_registry = None
+    with suppress(Exception):
+        step_registry = item._request.getfixturevalue("step_registry")
+    return plan if plan.is_valid(step_registry) else None
@@ -0,0 +1,100 @@
+"""Session store of parsed features.
+
+Same feature file could be bound by many `scenario`/`scenarios` marks and by feature autoload; Store keeps parsed
+features for the session, so every locator gets same Feature instance and file is parsed only once. Features are
+stored by unfiltered document: if feature was parsed with declarative scenario filter and is requested by other
+locator, pickles of other scenarios are compiled from stored document instead of parsing the file again.
+"""
+import os
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union, cast
+
+from attr import Factory, attrib, attrs
+
+from pytest_bdd.compatibility.pytest import Config
+from pytest_bdd.model import Feature
+from pytest_bdd.model.messages import Message
+from pytest_bdd.parse_pool import ParseTask
+from pytest_bdd.scenario_filter import ScenarioFilter
+from pytest_bdd.utils import PytestBDDIdGeneratorHandler
+
+
+@attrs
+class FeatureStore:
+    features: Dict[Hashable, Feature] = attrib(default=Factory(dict))
+    # Declarative filters stored features were parsed with; None means all pickles are compiled
+    scenario_filters: Dict[Hashable, Optional[ScenarioFilter]] = attrib(default=Factory(dict))
+    hits: int = attrib(default=0)
+    misses: int = attrib(default=0)
+
+    @staticmethod
+    def get_parser_type_key(parser_type: Any) -> Hashable:
+        if isinstance(parser_type, partial):
+            return (
+                parser_type.func,
+                repr(parser_type.args),
+                repr(sorted(parser_type.keywords.items())),
+            )
+        return parser_type
+
+    def build_key(self, task: ParseTask, args: Sequence[Any], kwargs: dict) -> Hashable:
+        parser_type, path, uri = task
+        resolved_path = Path(path).resolve()
+        try:
+            mtime = os.stat(resolved_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        return str(resolved_path), mtime, uri, self.get_parser_type_key(parser_type), repr(args), repr(kwargs)
+
+    def get_or_parse(
+        self,
+        config: Union[Config, PytestBDDIdGeneratorHandler],
+        tasks: Iterable[ParseTask],
+        parse: Callable[[Sequence[ParseTask]], Sequence[Feature]],
+        args: Sequence[Any],
+        kwargs: dict,
+    ) -> List[Feature]:
+        """Get features from store; Missing ones are parsed all together and stored
+
+        Features parsed with scenario filter contain only part of pickles; Pickles of other scenarios are compiled
+        from stored document once feature is requested with other filter or without it
+        """
+        scenario_filter = kwargs.get("scenario_filter")
+        unfiltered_kwargs = {key: value for key, value in kwargs.items() if key != "scenario_filter"}
+        keys_tasks: List[Tuple[Hashable, ParseTask]] = [
+            (self.build_key(task, args, unfiltered_kwargs), task) for task in tasks
+        ]
+
+        missed_keys_tasks = {key: task for key, task in keys_tasks if key not in self.features}
+        self.misses += len(missed_keys_tasks)
+        self.hits += len(keys_tasks) - len(missed_keys_tasks)
+
+        for key, _ in keys_tasks:
+            if key not in missed_keys_tasks and self.scenario_filters[key] not in (None, scenario_filter):
+                self.complete_feature(config, key)
+
+        if missed_keys_tasks:
+            self.features.update(zip(missed_keys_tasks.keys(), parse([*missed_keys_tasks.values()])))
+            self.scenario_filters.update(dict.fromkeys(missed_keys_tasks.keys(), scenario_filter))
+
+        return [self.features[key] for key, _ in keys_tasks]
+
+    def complete_feature(self, config: Union[Config, PytestBDDIdGeneratorHandler], key: Hashable):
+        feature = self.features[key]
+        new_pickles = feature.complete_pickles(cast(PytestBDDIdGeneratorHandler, config).pytest_bdd_id_generator)
+        self.scenario_filters[key] = None
+
+        hook_handler = cast(Config, config).hook
+        for pickle in new_pickles:
+            hook_handler.pytest_bdd_message(config=config, message=Message(pickle=pickle))
+
+
+def configure(config: Config) -> None:
+    config.pytest_bdd_feature_store = FeatureStore()  # type: ignore[attr-defined]
+
+
+def unconfigure(config: Union[Config, Any]) -> None:
+    if hasattr(config, "pytest_bdd_feature_store"):
+        config.pytest_bdd_feature_store.features.clear()
+        config.pytest_bdd_feature_store.scenario_filters.clear()
@@ -0,0 +1,126 @@
+"""Session fetcher of remote features.
+
+Remote features of all locators are fetched by the single HTTP client session which owns keep-alive connection pool
+and limits count of concurrent connections. Client session lives in its own event loop thread, so features could be
+prefetched in background while collection goes on; Every URL is fetched only once per session.
+"""
+import asyncio
+import ssl
+from concurrent.futures import Future
+from threading import Thread
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import aiohttp
+import certifi
+from attr import Factory, attrib, attrs
+
+from pytest_bdd.compatibility.pytest import Config, Parser
+from pytest_bdd.http_cache import HttpCache, HttpCacheEntry
+
+
+def add_options(parser: Parser):
+    """Add pytest-bdd remote features fetcher options."""
+    group = parser.getgroup("bdd", "Remote features fetcher")
+    group.addoption(
+        "--bdd-http-concurrency",
+        action="store",
+        dest="bdd_http_concurrency",
+        type=int,
+        default=None,
+        help="Max count of concurrent connections used to fetch remote features",
+    )
+    parser.addini(
+        "bdd_http_concurrency",
+        default="16",
+        help="Max count of concurrent connections used to fetch remote features",
+    )
+
+
+@attrs
+class FeatureFetcher:
+    concurrency: int = attrib(default=16)
+    http_cache: Optional[HttpCache] = attrib(default=None)
+
+    futures: Dict[str, "Future[HttpCacheEntry]"] = attrib(default=Factory(dict), init=False)
+    loop: Optional[asyncio.AbstractEventLoop] = attrib(default=None, init=False)
+    thread: Optional[Thread] = attrib(default=None, init=False)
+    session: Optional[aiohttp.ClientSession] = attrib(default=None, init=False)
+
+    @classmethod
+    def build(cls, config: Config) -> "FeatureFetcher":
+        concurrency = config.option.bdd_http_concurrency
+        return cls(  # type: ignore[call-arg]
+            concurrency=int(config.getini("bdd_http_concurrency")) if concurrency is None else concurrency,
+            http_cache=getattr(config, "pytest_bdd_http_cache", None),
+        )
+
+    def start(self):
+        """Start event loop thread; Sessions without remote features don't start it at all"""
+        if self.loop is not None:
+            return
+        self.loop = asyncio.new_event_loop()
+        self.thread = Thread(target=self.loop.run_forever, name="pytest-bdd-feature-fetcher", daemon=True)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self._open_session(), self.loop).result()
+
+    async def _open_session(self):
+        connector = aiohttp.TCPConnector(limit=self.concurrency, ssl=ssl.create_default_context(cafile=certifi.where()))
+        self.session = aiohttp.ClientSession(connector=connector)
+
+    async def _fetch(self, url: str) -> HttpCacheEntry:
+        session = self.session
+        assert session is not None
+        if self.http_cache is not None:
+            return await self.http_cache.fetch(session, url)
+        async with session.get(url) as response:
+            return await HttpCacheEntry.from_response(url, response)
+
+    def prefetch(self, urls: Iterable[str]):
+        """Schedule fetch of features; Doesn't wait for results"""
+        for url in urls:
+            if url not in self.futures:
+                self.start()
+                self.futures[url] = asyncio.run_coroutine_threadsafe(self._fetch(url), self.loop)  # type: ignore
+
+    def fetch_all(self, urls: Iterable[str]) -> List[Union[HttpCacheEntry, BaseException]]:
+        """Get fetched features or fetch errors in order of urls"""
+        urls = list(urls)
+        self.prefetch(urls)
+
+        results: List[Union[HttpCacheEntry, BaseException]] = []
+        for url in urls:
+            try:
+                results.append(self.futures[url].result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def shutdown(self):
+        if self.loop is None:
+            return
+        if self.session is not None:
+            asyncio.run_coroutine_threadsafe(self.session.close(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()  # type: ignore[union-attr]
+        self.loop.close()
+        self.loop = self.thread = self.session = None
+        self.futures.clear()
+
+
+def get_fetcher(config: Union[Config, Any]) -> Optional[FeatureFetcher]:
+    return getattr(config, "pytest_bdd_feature_fetcher", None)
+
+
+def configure(config: Config) -> None:
+    config.pytest_bdd_feature_fetcher = FeatureFetcher.build(config)  # type: ignore[attr-defined]
+
+
+def shutdown(config: Union[Config, Any]) -> None:
+    """Stop event loop thread; Fetcher starts it again if more features are fetched"""
+    fetcher = get_fetcher(config)
+    if fetcher is not None:
+        fetcher.shutdown()
+
+
+def unconfigure(config: Union[Config, Any]) -> None:
+    shutdown(config)
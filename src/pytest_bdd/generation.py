@@ -131,7 +131,7 @@ def generate_and_print_missing_code(config: Config) -> Union[int, ExitCode]:
             seen_feature_pickles_ids.add((feature.uri, pickle.name))
 
             previous_step = None
-            for step in pickle.steps:
+            for step in feature.get_executable_steps(pickle):
                 try:
                     item_request.config.hook.pytest_bdd_match_step_definition_to_step(
                         request=item_request, feature=feature, scenario=pickle, step=step, previous_step=previous_step
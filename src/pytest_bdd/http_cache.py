@@ -0,0 +1,169 @@
+"""Persistent HTTP cache of remote features.
+
+Responses are stored under pytest ``cache_dir`` and are keyed by URL. Stored entries are revalidated by conditional
+requests (``If-None-Match``/``If-Modified-Since``) once they are older than max age; In offline mode stored entries
+are used regardless of their age and no requests are made.
+"""
+import os
+import pickle
+import time
+from contextlib import suppress
+from hashlib import sha256
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+from attr import Factory, attrib, attrs
+
+from pytest_bdd.compatibility.pytest import Config, Parser
+from pytest_bdd.exceptions import HttpCacheMissError
+
+if TYPE_CHECKING:  # pragma: no cover
+    import aiohttp
+
+CACHE_DIR_NAME = "pytest_bdd_http_cache"
+CACHE_FILE_SUFFIX = ".response.pickle"
+HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
+
+
+def add_options(parser: Parser):
+    """Add pytest-bdd HTTP cache options."""
+    group = parser.getgroup("bdd", "HTTP cache")
+    group.addoption(
+        "--bdd-http-cache-max-age",
+        action="store",
+        dest="bdd_http_cache_max_age",
+        type=float,
+        default=None,
+        help="Seconds during which cached remote features are used without revalidation",
+    )
+    group.addoption(
+        "--bdd-http-offline",
+        action="store_true",
+        dest="bdd_http_offline",
+        default=None,
+        help="Use cached remote features regardless of their age; Remote features are not requested",
+    )
+    parser.addini(
+        "bdd_http_cache_max_age",
+        default="0",
+        help="Seconds during which cached remote features are used without revalidation",
+    )
+    parser.addini(
+        "bdd_http_offline",
+        type="bool",
+        default=False,
+        help="Use cached remote features regardless of their age; Remote features are not requested",
+    )
+
+
+@attrs
+class HttpCacheEntry:
+    url: str = attrib()
+    body: bytes = attrib()
+    content_type: Optional[str] = attrib(default=None)
+    charset: Optional[str] = attrib(default=None)
+    etag: Optional[str] = attrib(default=None)
+    last_modified: Optional[str] = attrib(default=None)
+    fetched_at: float = attrib(default=Factory(time.time))
+
+    def is_fresh(self, max_age: float) -> bool:
+        return time.time() - self.fetched_at < max_age
+
+    @property
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def decode(self, encoding: Optional[str] = None) -> str:
+        return self.body.decode(encoding or self.charset or "utf-8")
+
+    @classmethod
+    async def from_response(cls, url: str, response: "aiohttp.ClientResponse") -> "HttpCacheEntry":
+        return cls(  # type: ignore[call-arg]
+            url=url,
+            body=await response.read(),
+            content_type=response.content_type,
+            charset=response.charset,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+
+@attrs
+class HttpCache:
+    cache_dir: Optional[Path] = attrib()
+    max_age: float = attrib(default=0)
+    is_offline: bool = attrib(default=False)
+
+    hits: int = attrib(default=0, init=False)
+    revalidations: int = attrib(default=0, init=False)
+    misses: int = attrib(default=0, init=False)
+
+    @classmethod
+    def build(cls, config: Config) -> "HttpCache":
+        max_age = config.option.bdd_http_cache_max_age
+        is_offline = config.option.bdd_http_offline
+        cache = getattr(config, "cache", None)
+        return cls(  # type: ignore[call-arg]
+            cache_dir=None if cache is None else cache.mkdir(CACHE_DIR_NAME),
+            max_age=float(config.getini("bdd_http_cache_max_age")) if max_age is None else max_age,
+            is_offline=config.getini("bdd_http_offline") if is_offline is None else is_offline,
+        )
+
+    def get_cache_file_path(self, url: str) -> Path:
+        return Path(self.cache_dir) / f"{sha256(url.encode()).hexdigest()}{CACHE_FILE_SUFFIX}"  # type: ignore[arg-type]
+
+    def load(self, url: str) -> Optional[HttpCacheEntry]:
+        if self.cache_dir is None:
+            return None
+        try:
+            with self.get_cache_file_path(url).open(mode="rb") as cache_file:
+                entry = pickle.load(cache_file)
+        except Exception:
+            return None
+        return entry if isinstance(entry, HttpCacheEntry) and entry.url == url else None
+
+    def dump(self, entry: HttpCacheEntry):
+        if self.cache_dir is None:
+            return
+        cache_file_path = self.get_cache_file_path(entry.url)
+        temp_cache_file_path = cache_file_path.with_name(f"{cache_file_path.name}.{os.getpid()}.tmp")
+        try:
+            with temp_cache_file_path.open(mode="wb") as cache_file:
+                pickle.dump(entry, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_cache_file_path, cache_file_path)
+        except (OSError, pickle.PicklingError):
+            with suppress(OSError):
+                temp_cache_file_path.unlink()
+
+    async def fetch(self, session: "aiohttp.ClientSession", url: str, **request_kwargs) -> HttpCacheEntry:
+        """Get response from cache or by the (conditional) request"""
+        entry = self.load(url)
+        if entry is not None and (self.is_offline or entry.is_fresh(self.max_age)):
+            self.hits += 1
+            return entry
+        if self.is_offline:
+            raise HttpCacheMissError(url)
+
+        headers = {} if entry is None else entry.conditional_headers
+        async with session.get(url, headers=headers, **request_kwargs) as response:
+            if entry is not None and response.status == HTTP_NOT_MODIFIED:
+                self.revalidations += 1
+                entry.fetched_at = time.time()
+                self.dump(entry)
+                return entry
+
+            self.misses += 1
+            fetched_entry = await HttpCacheEntry.from_response(url, response)
+            if response.status == HTTP_OK:
+                self.dump(fetched_entry)
+            return fetched_entry
+
+
+def configure(config: Config) -> None:
+    config.pytest_bdd_http_cache = HttpCache.build(config)  # type: ignore[attr-defined]
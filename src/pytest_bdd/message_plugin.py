@@ -53,16 +53,12 @@ class MessagePlugin:
         )
 
     def pytest_bdd_message(self, config: Config, message: Message):
-        if config.option.messages_ndjson_path is None:
-            return
         with Path(self.config.option.messages_ndjson_path).open(mode="a+") as f:
             f.write(message.json(exclude_none=True))
             f.write("\n")
 
     def pytest_runtestloop(self, session: Session):
         config = session.config
-        if config.option.messages_ndjson_path is None:
-            return
         hook_handler = config.hook
 
         # TODO check messaging of step definitions; seems outdated
@@ -82,8 +78,6 @@ class MessagePlugin:
 
     def pytest_sessionfinish(self, session, exitstatus):
         config = session.config
-        if config.option.messages_ndjson_path is None:
-            return
         hook_handler = config.hook
 
         is_testrun_success = (isinstance(exitstatus, int) and exitstatus == 0) or exitstatus is ExitCode.OK
@@ -101,14 +95,12 @@ class MessagePlugin:
         config: Union[
             Config, PytestBDDIdGeneratorHandler
         ] = request.config  # https://github.com/python/typing/issues/213
-        if cast(Config, config).option.messages_ndjson_path is None:
-            return
         hook_handler = cast(Config, config).hook
 
         test_steps = []
         previous_step = None
         self.current_test_case_step_id_to_step_mapping = {}
-        for step in scenario.steps:
+        for step in feature.get_executable_steps(scenario):
             try:
                 step_definition = hook_handler.pytest_bdd_match_step_definition_to_step(
                     request=request,
@@ -144,8 +136,6 @@ class MessagePlugin:
 
     def pytest_bdd_after_scenario(self, request, feature, scenario):
         config = request.config
-        if config.option.messages_ndjson_path is None:
-            return
 
         hook_handler = config.hook
 
@@ -164,8 +154,6 @@ class MessagePlugin:
 
     def pytest_bdd_before_step(self, request, feature, scenario, step, step_func):
         config = request.config
-        if config.option.messages_ndjson_path is None:
-            return
         hook_handler = config.hook
 
         # TODO check behaviour if missing
@@ -186,8 +174,6 @@ class MessagePlugin:
 
     def pytest_bdd_after_step(self, request, feature, scenario, step, step_func):
         config = request.config
-        if config.option.messages_ndjson_path is None:
-            return
         hook_handler = config.hook
 
         # TODO check behaviour if missing
@@ -225,8 +211,6 @@ class MessagePlugin:
         self, request, feature, scenario, step, step_func, step_func_args, exception, step_definition
     ):
         config = request.config
-        if config.option.messages_ndjson_path is None:
-            return
         hook_handler = config.hook
 
         # TODO check behaviour if missing
@@ -1,5 +1,5 @@
-from pytest_bdd.model.gherkin_document import Feature
+from pytest_bdd.model.gherkin_document import ExecutableStep, Feature
 from pytest_bdd.model.messages import Pickle, PickleStep, Step, Tag
 from pytest_bdd.model.messages import Type as StepType
 
-__all__ = ["Feature", "Pickle", "Step", "StepType", "Tag"]
+__all__ = ["ExecutableStep", "Feature", "Pickle", "Step", "StepType", "Tag"]
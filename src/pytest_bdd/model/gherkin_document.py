@@ -19,20 +19,84 @@ Syntax example:
 :note: There are no multiline steps, the description of the step must fit in
 one line.
 """
+import json
+from functools import partial
 from itertools import chain
 from textwrap import dedent
-from typing import Sequence, Union, cast
+from typing import Dict, Iterator, List, Optional, Sequence, Union, cast
 
 from attr import Factory, attrib, attrs
 from gherkin.errors import CompositeParserException  # type: ignore[import]
 from gherkin.pickles.compiler import Compiler  # type: ignore[import]
+from pydantic import BaseModel
 
 from pytest_bdd.const import TAG_PREFIX
-from pytest_bdd.model.messages import Background, Examples
+from pytest_bdd.model.loading import load_model, load_models
+from pytest_bdd.model.messages import Background, DataTable, DocString, Examples
 from pytest_bdd.model.messages import Feature as FeatureMessage
 from pytest_bdd.model.messages import GherkinDocument, Pickle, PickleStep, Rule, Scenario, Step, TableRow, Tag
 from pytest_bdd.utils import _itemgetter, deepattrgetter
 
+# Fields of cucumber messages which refer to generated ids
+ID_FIELDS = {"id", "ast_node_id"}
+ID_LIST_FIELDS = {"ast_node_ids"}
+
+
+@attrs(frozen=True, slots=True)
+class PickleIndexEntry:
+    scenario: Scenario = attrib()
+    line_number: int = attrib()
+    tag_names: List[str] = attrib()
+    table_rows: List[TableRow] = attrib()
+    table_rows_breadcrumb: str = attrib()
+
+
+@attrs(frozen=True, slots=True, eq=False)
+class ExecutableStep:
+    """Pickle step enriched by fields of linked AST step
+
+    View is built once per feature and isn't changed during execution, so it could be shared by concurrently executed
+    scenarios. Other attributes and methods, like ``dict()`` and ``json()``, are taken from the pickle step; View is
+    registered as virtual subclass of ``PickleStep``, so ``isinstance`` checks of hooks implementations keep working.
+    """
+
+    pickle_step: PickleStep = attrib()
+    ast_step: Optional[Step] = attrib()
+    keyword: Optional[str] = attrib()
+    line_number: Optional[int] = attrib()
+    doc_string: Optional[DocString] = attrib()
+    data_table: Optional[DataTable] = attrib()
+
+    @property
+    def id(self) -> str:
+        return self.pickle_step.id
+
+    @property
+    def text(self) -> str:
+        return self.pickle_step.text
+
+    @property
+    def type(self):
+        return self.pickle_step.type
+
+    @property
+    def argument(self):
+        return self.pickle_step.argument
+
+    @property
+    def ast_node_ids(self) -> List[str]:
+        return self.pickle_step.ast_node_ids
+
+    def __getattr__(self, name):
+        if name == "pickle_step":
+            # Slot isn't filled yet, e.g. during unpickling
+            raise AttributeError(name)
+        return getattr(self.pickle_step, name)
+
+
+# Hooks and step functions received pickle steps before views were introduced
+PickleStep.register(ExecutableStep)
+
 
 @attrs
 class Feature:
@@ -42,16 +106,93 @@ class Feature:
 
     registry: dict = attrib(default=Factory(dict))
     pickles: Sequence[Pickle] = attrib(default=Factory(list))
+    # Indexes of AST nodes linked to pickles and pickle steps; Built together with registry
+    pickles_index: Dict[str, PickleIndexEntry] = attrib(default=Factory(dict), eq=False, repr=False)
+    pickle_steps_index: Dict[str, ExecutableStep] = attrib(default=Factory(dict), eq=False, repr=False)
 
     def __attrs_post_init__(self):
         self.fill_registry()
 
     @staticmethod
     def load_pickles(scenarios_data) -> Sequence[Pickle]:
-        return [*map(Pickle.parse_obj, scenarios_data)]
+        return load_models(Pickle, scenarios_data)
 
     def fill_registry(self):
         self.registry.update(self.get_child_ids_gen(self.gherkin_document.feature))
+        self.build_index()
+
+    def build_index(self):
+        self.pickles_index.clear()
+        self.pickle_steps_index.clear()
+        for pickle in self.pickles:
+            self._index_pickle(pickle)
+
+    def _index_pickle(self, pickle: Pickle):
+        self.pickles_index[pickle.id] = self._build_pickle_index_entry(pickle)
+        for pickle_step in pickle.steps:
+            self.pickle_steps_index[pickle_step.id] = self._build_executable_step(pickle_step)
+
+    def _build_pickle_index_entry(self, pickle: Pickle) -> PickleIndexEntry:
+        linked_ast_nodes = self._get_linked_ast_nodes(pickle)
+        scenario = cast(Scenario, next(filter(lambda node: type(node) is Scenario, linked_ast_nodes)))
+        table_rows = [*filter(lambda node: type(node) is TableRow, linked_ast_nodes)]
+        table_rows_lines = ",".join(
+            map(lambda row: f"line: {deepattrgetter('location.line', default=-1)(row)[0]}", table_rows)
+        )
+        return PickleIndexEntry(
+            scenario=scenario,
+            line_number=scenario.location.line,
+            tag_names=sorted(map(lambda tag: tag.name.lstrip(TAG_PREFIX), pickle.tags)),
+            table_rows=table_rows,
+            table_rows_breadcrumb=f"[table_rows:[{table_rows_lines}]]" if table_rows_lines else "",
+        )
+
+    def _build_executable_step(self, pickle_step: PickleStep) -> ExecutableStep:
+        step = cast(
+            Optional[Step], next(filter(lambda node: type(node) is Step, self._get_linked_ast_nodes(pickle_step)), None)
+        )
+        return ExecutableStep(
+            pickle_step=pickle_step,
+            ast_step=step,
+            keyword=None if step is None else step.keyword.strip(),
+            line_number=None if step is None else step.location.line,
+            doc_string=getattr(step, "doc_string", None),
+            data_table=getattr(step, "data_table", None),
+        )
+
+    def complete_pickles(self, id_generator) -> List[Pickle]:
+        """Compile pickles of scenarios which were filtered out when feature was parsed
+
+        Already compiled pickles are kept, so items collected before share them with new ones; Pickles keep order of
+        scenarios in the document. Returns only new pickles.
+        """
+        gherkin_document_raw_dict = json.loads(self.gherkin_document.json(by_alias=True, exclude_none=True))
+        compiled_pickles = self.load_pickles(Compiler(id_generator=id_generator).compile(gherkin_document_raw_dict))
+
+        known_pickles = {tuple(pickle.ast_node_ids): pickle for pickle in self.pickles}
+        new_pickles = [pickle for pickle in compiled_pickles if tuple(pickle.ast_node_ids) not in known_pickles]
+        self.pickles = [known_pickles.get(tuple(pickle.ast_node_ids), pickle) for pickle in compiled_pickles]
+        for pickle in new_pickles:
+            self._index_pickle(pickle)
+        return new_pickles
+
+    def _get_pickle_index_entry(self, pickle: Pickle) -> PickleIndexEntry:
+        entry = self.pickles_index.get(pickle.id)
+        if entry is None:
+            entry = self.pickles_index[pickle.id] = self._build_pickle_index_entry(pickle)
+        return entry
+
+    def get_executable_step(self, pickle_step: Union[PickleStep, ExecutableStep]) -> ExecutableStep:
+        """Get view of pickle step enriched by fields of linked AST step"""
+        if isinstance(pickle_step, ExecutableStep):
+            return pickle_step
+        executable_step = self.pickle_steps_index.get(pickle_step.id)
+        if executable_step is None:
+            executable_step = self.pickle_steps_index[pickle_step.id] = self._build_executable_step(pickle_step)
+        return executable_step
+
+    def get_executable_steps(self, pickle: Pickle) -> List[ExecutableStep]:
+        return [*map(self.get_executable_step, pickle.steps)]
 
     @classmethod
     def get_child_ids_gen(cls, obj):
@@ -120,7 +261,48 @@ class Feature:
         elif isinstance(obj, Step):
             yield obj.id, obj
 
-    load_gherkin_document = staticmethod(GherkinDocument.parse_obj)
+    load_gherkin_document = staticmethod(partial(load_model, GherkinDocument))
+
+    def reassign_ids(self, id_generator):
+        """Replace ids generated out of current session (by cache or parse worker) with ids unique for the session
+
+        Numeric ids keep their relative order, so features get same ids as if they were parsed in place
+        """
+        old_ids: List[str] = []
+        for model in self._gen_models():
+            for field_name in ID_FIELDS.intersection(model.__fields__):
+                old_ids.extend(filter(None, [getattr(model, field_name)]))
+            for field_name in ID_LIST_FIELDS.intersection(model.__fields__):
+                old_ids.extend(getattr(model, field_name) or [])
+
+        ids_mapping: Dict[str, str] = {}
+        for old_id in sorted(
+            dict.fromkeys(old_ids), key=lambda id_: (not id_.isdigit(), int(id_) if id_.isdigit() else 0)
+        ):
+            ids_mapping[old_id] = id_generator.get_next_id()
+
+        for model in self._gen_models():
+            for field_name in ID_FIELDS.intersection(model.__fields__):
+                if getattr(model, field_name) is not None:
+                    setattr(model, field_name, ids_mapping[getattr(model, field_name)])
+            for field_name in ID_LIST_FIELDS.intersection(model.__fields__):
+                setattr(model, field_name, [*map(ids_mapping.__getitem__, getattr(model, field_name) or [])])
+
+        self.registry.clear()
+        self.fill_registry()
+
+    def _gen_models(self):
+        def gen(obj) -> Iterator[BaseModel]:
+            if isinstance(obj, BaseModel):
+                yield obj
+                for field_name in obj.__fields__:
+                    yield from gen(getattr(obj, field_name))
+            elif isinstance(obj, (list, tuple)):
+                for item in obj:
+                    yield from gen(item)
+
+        yield from gen(self.gherkin_document)
+        yield from gen(self.pickles)
 
     @property
     def name(self) -> Union[str, None]:
@@ -150,16 +332,10 @@ class Feature:
         return sorted(map(lambda tag: tag.name.lstrip(TAG_PREFIX), self.gherkin_document.feature.tags))
 
     def build_pickle_table_rows_breadcrumb(self, pickle):
-        table_rows_lines = ",".join(
-            map(
-                lambda row: f"line: {deepattrgetter('location.line', default=-1)(row)[0]}",
-                self._get_pickle_ast_table_rows(pickle),
-            )
-        )
-        return f"[table_rows:[{table_rows_lines}]]" if table_rows_lines else ""
+        return self._get_pickle_index_entry(pickle).table_rows_breadcrumb
 
     def _get_pickle_ast_table_rows(self, pickle):
-        return list(filter(lambda node: type(node) is TableRow, self._get_linked_ast_nodes(pickle)))
+        return self._get_pickle_index_entry(pickle).table_rows
 
     def _get_linked_ast_nodes(self, obj):
         return _itemgetter(
@@ -168,21 +344,19 @@ class Feature:
         )(self.registry)
 
     def _get_pickle_tag_names(self, pickle: Pickle):
-        return sorted(map(lambda tag: tag.name.lstrip(TAG_PREFIX), pickle.tags))
+        return self._get_pickle_index_entry(pickle).tag_names
 
     def _get_pickle_ast_scenario(self, pickle: Pickle) -> Scenario:
-        return cast(Scenario, next(filter(lambda node: type(node) is Scenario, self._get_linked_ast_nodes(pickle))))
+        return self._get_pickle_index_entry(pickle).scenario
 
     def _get_pickle_line_number(self, pickle: Pickle):
-        return self._get_pickle_ast_scenario(pickle).location.line
+        return self._get_pickle_index_entry(pickle).line_number
 
     def _get_pickle_step_model_step(self, pickle_step: PickleStep):
-        return cast(Step, next(filter(lambda node: type(node) is Step, self._get_linked_ast_nodes(pickle_step)), None))
+        return self.get_executable_step(pickle_step).ast_step
 
     def _get_step_keyword(self, step: PickleStep):
-        model_step: Union[Step, None] = self._get_pickle_step_model_step(step)
-        if model_step is not None:
-            return model_step.keyword.strip()
+        return self.get_executable_step(step).keyword
 
     def _get_step_prefix(self, step: PickleStep):
         step_keyword = self._get_step_keyword(step)
@@ -190,12 +364,10 @@ class Feature:
             return step_keyword.lower()
 
     def _get_step_line_number(self, step: PickleStep):
-        model_step: Union[Step, None] = self._get_pickle_step_model_step(step)
-        if model_step is not None:
-            return model_step.location.line
+        return self.get_executable_step(step).line_number
 
     def _get_step_doc_string(self, step: PickleStep):
-        return getattr(self._get_pickle_step_model_step(step), "doc_string", None)
+        return self.get_executable_step(step).doc_string
 
     def _get_step_data_table(self, step: PickleStep):
-        return getattr(self._get_pickle_step_model_step(step), "data_table", None)
+        return self.get_executable_step(step).data_table
@@ -0,0 +1,115 @@
+"""Loading of messages models from trusted data.
+
+Data produced by gherkin parser and pickles compiler is already valid, so models are constructed recursively without
+pydantic validation; Aliases and enums are still converted. Full validation could be turned back on for debugging by
+the `PYTEST_BDD_VALIDATE_MODELS` environment variable. Models are constructed by inspection of pydantic 1 fields, so
+with pydantic 2 they are always validated.
+"""
+import os
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from pytest_bdd.compatibility.pydantic import (
+    MODEL_FIELDS_SHAPES_SUPPORTED,
+    SHAPE_LIST,
+    SHAPE_SEQUENCE,
+    SHAPE_SINGLETON,
+    ModelField,
+)
+
+VALIDATE_MODELS_ENV_VAR = "PYTEST_BDD_VALIDATE_MODELS"
+
+Model = TypeVar("Model", bound=BaseModel)
+Converter = Callable[[Any], Any]
+
+object_setattr = object.__setattr__
+_constructors: Dict[Type[BaseModel], Callable[[Dict[str, Any]], BaseModel]] = {}
+
+
+def is_validation_enabled() -> bool:
+    if not MODEL_FIELDS_SHAPES_SUPPORTED:  # pragma: no cover
+        return True
+    return os.environ.get(VALIDATE_MODELS_ENV_VAR, "").lower() in {"1", "true", "yes", "on"}
+
+
+def _identity(value):
+    return value
+
+
+def _build_item_converter(type_: Any) -> Converter:
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        return _get_constructor(type_)
+    elif isinstance(type_, type) and issubclass(type_, Enum):
+        return type_
+    else:
+        return _identity
+
+
+def _build_field_converter(field: ModelField) -> Optional[Converter]:
+    item_converter = _build_item_converter(field.type_)
+    if item_converter is _identity:
+        return None
+    elif field.shape == SHAPE_SINGLETON:
+        return item_converter
+    elif field.shape in {SHAPE_LIST, SHAPE_SEQUENCE}:
+        return lambda values: [*map(item_converter, values)]
+    else:
+        return None
+
+
+def _build_constructor(model_type: Type[Model]) -> Callable[[Dict[str, Any]], Model]:
+    fields = [*model_type.__fields__.items()]
+    fields_converters: List[Tuple[str, str, Optional[Converter]]] = []
+
+    def construct(data: Dict[str, Any]) -> Model:
+        values = {}
+        fields_set = set()
+        for name, alias, converter in fields_converters:
+            if alias in data:
+                value = data[alias]
+            elif name in data:
+                value = data[name]
+            else:
+                field = model_type.__fields__[name]
+                if not field.required:
+                    values[name] = field.get_default()
+                continue
+            values[name] = value if converter is None or value is None else converter(value)
+            fields_set.add(name)
+
+        model = model_type.__new__(model_type)
+        object_setattr(model, "__dict__", values)
+        object_setattr(model, "__fields_set__", fields_set)
+        if model_type.__private_attributes__:
+            model._init_private_attributes()
+        return model
+
+    # Constructor is registered before converters are built, so recursive models are supported
+    _constructors[model_type] = construct
+    fields_converters.extend((name, field.alias, _build_field_converter(field)) for name, field in fields)
+    return construct
+
+
+def _get_constructor(model_type: Type[Model]) -> Callable[[Dict[str, Any]], Model]:
+    constructor = _constructors.get(model_type)
+    return _build_constructor(model_type) if constructor is None else constructor
+
+
+def construct_model(model_type: Type[Model], data: Dict[str, Any]) -> Model:
+    """Construct model and its nested models from raw dict without validation
+
+    Same as `BaseModel.construct`, but nested models are constructed too
+    """
+    return _get_constructor(model_type)(data)
+
+
+def load_model(model_type: Type[Model], data: Dict[str, Any]) -> Model:
+    return model_type.parse_obj(data) if is_validation_enabled() else construct_model(model_type, data)
+
+
+def load_models(model_type: Type[Model], data: Sequence[Dict[str, Any]]) -> List[Model]:
+    if is_validation_enabled():
+        return [*map(model_type.parse_obj, data)]
+    return [*map(_get_constructor(model_type), data)]
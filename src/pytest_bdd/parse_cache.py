@@ -0,0 +1,210 @@
+"""Persistent cache of parsed features.
+
+Parsed features are stored under pytest ``cache_dir`` and are keyed by the feature file content hash, versions of
+pytest-bdd-ng and gherkin, parser type and parse arguments. So features unchanged between test sessions are not
+parsed again.
+"""
+
+import os
+import pickle
+from contextlib import suppress
+from enum import Enum
+from hashlib import sha256
+from pathlib import Path
+from typing import Optional, Union, cast
+
+from attr import Factory, attrib, attrs
+
+from pytest_bdd.compatibility.importlib.metadata import version
+from pytest_bdd.compatibility.parser import ParserProtocol, decode_text, is_content_parser
+from pytest_bdd.compatibility.pytest import Config, Parser
+from pytest_bdd.model import Feature
+from pytest_bdd.utils import PytestBDDIdGeneratorHandler
+
+CACHE_DIR_NAME = "pytest_bdd_parse_cache"
+CACHE_FILE_SUFFIX = ".feature.pickle"
+# Bumped on every change of pickled Feature layout
+CACHE_FORMAT_VERSION = "2"
+
+
+class ParseCacheMode(Enum):
+    OFF = "off"
+    READ = "read"
+    WRITE = "write"
+
+
+def add_options(parser: Parser):
+    """Add pytest-bdd parse cache options."""
+    group = parser.getgroup("bdd", "Parse cache")
+    group.addoption(
+        "--bdd-parse-cache",
+        action="store",
+        dest="bdd_parse_cache",
+        choices=[mode.value for mode in ParseCacheMode],
+        default=None,
+        help="Reuse parsed features between test sessions: 'read' uses existing entries, "
+        "'write' also stores new ones",
+    )
+    parser.addini(
+        "bdd_parse_cache",
+        default=ParseCacheMode.OFF.value,
+        help="Reuse parsed features between test sessions: off|read|write",
+    )
+    parser.addini(
+        "bdd_parse_cache_max_size",
+        default=str(256 * 2**20),
+        help="Max size in bytes of parsed features cache; Least recently used entries are evicted first",
+    )
+
+
+@attrs
+class FeatureParseCache:
+    cache_dir: Optional[Path] = attrib()
+    mode: ParseCacheMode = attrib(default=ParseCacheMode.OFF)
+    max_size: int = attrib(default=256 * 2**20)
+
+    hits: int = attrib(default=0, init=False)
+    misses: int = attrib(default=0, init=False)
+    versions: str = attrib(
+        default=Factory(lambda: f"{CACHE_FORMAT_VERSION}:{version('pytest-bdd-ng')}:{version('gherkin-official')}")
+    )
+
+    @classmethod
+    def build(cls, config: Config) -> "FeatureParseCache":
+        mode = ParseCacheMode(config.option.bdd_parse_cache or config.getini("bdd_parse_cache"))
+        cache = getattr(config, "cache", None)
+        if mode is ParseCacheMode.OFF or cache is None:
+            return cls(cache_dir=None)  # type: ignore[call-arg]
+        return cls(  # type: ignore[call-arg]
+            cache_dir=cache.mkdir(CACHE_DIR_NAME),
+            mode=mode,
+            max_size=int(config.getini("bdd_parse_cache_max_size")),
+        )
+
+    @property
+    def is_readable(self) -> bool:
+        return self.cache_dir is not None and self.mode in (ParseCacheMode.READ, ParseCacheMode.WRITE)
+
+    @property
+    def is_writable(self) -> bool:
+        return self.cache_dir is not None and self.mode is ParseCacheMode.WRITE
+
+    @staticmethod
+    def get_parser_token(parser: ParserProtocol) -> str:
+        parser_type = type(parser)
+        loader = getattr(parser, "loader", None)
+        return ":".join(
+            map(
+                str,
+                [
+                    f"{parser_type.__module__}.{parser_type.__qualname__}",
+                    getattr(parser, "kind", None),
+                    getattr(loader, "__qualname__", None),
+                ],
+            )
+        )
+
+    def build_key(self, parser: ParserProtocol, content: bytes, path: Path, uri: str, args, kwargs) -> str:
+        key_hash = sha256(content)
+        for part in [self.versions, self.get_parser_token(parser), path.as_posix(), uri, repr(args), repr(kwargs)]:
+            key_hash.update(b"\0")
+            key_hash.update(part.encode("utf-8"))
+        return key_hash.hexdigest()
+
+    def parse(
+        self,
+        config: Union[Config, PytestBDDIdGeneratorHandler],
+        parser: ParserProtocol,
+        path: Path,
+        uri: str,
+        *args,
+        **kwargs,
+    ) -> Feature:
+        """Parse feature by parser or load it from cache if it was already parsed"""
+        if not self.is_readable:
+            return parser.parse(config, path, uri, *args, **kwargs)
+
+        content = path.read_bytes()
+        key = self.build_key(parser, content, path, uri, args, kwargs)
+        cache_file_path = cast(Path, self.cache_dir) / f"{key}{CACHE_FILE_SUFFIX}"
+
+        feature = self.load(cache_file_path)
+        if feature is not None:
+            self.hits += 1
+            feature.reassign_ids(cast(PytestBDDIdGeneratorHandler, config).pytest_bdd_id_generator)
+            emit_messages = getattr(parser, "emit_messages", None)
+            if emit_messages is not None:
+                emit_messages(config, feature, decode_text(content, kwargs.get("encoding", "utf-8")), path, uri)
+            return feature
+
+        self.misses += 1
+        if is_content_parser(parser):
+            # Content is already read to build the key
+            feature = parser.parse_bytes(config, content, uri, *args, path=path, **kwargs)
+        else:
+            feature = parser.parse(config, path, uri, *args, **kwargs)
+        if self.is_writable:
+            self.dump(cache_file_path, feature)
+        return feature
+
+    @staticmethod
+    def load(cache_file_path: Path) -> Optional[Feature]:
+        try:
+            with cache_file_path.open(mode="rb") as cache_file:
+                feature = pickle.load(cache_file)
+        except Exception:
+            return None
+        if not isinstance(feature, Feature):
+            return None
+        with suppress(OSError):
+            # Cache entries are evicted by modification time, so mark entry as recently used
+            os.utime(cache_file_path)
+        return feature
+
+    @staticmethod
+    def dump(cache_file_path: Path, feature: Feature):
+        temp_cache_file_path = cache_file_path.with_name(f"{cache_file_path.name}.{os.getpid()}.tmp")
+        try:
+            with temp_cache_file_path.open(mode="wb") as cache_file:
+                pickle.dump(feature, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_cache_file_path, cache_file_path)
+        except (OSError, pickle.PicklingError):
+            with suppress(OSError):
+                temp_cache_file_path.unlink()
+
+    def evict(self):
+        """Remove least recently used entries until cache fits max size"""
+        if not self.is_writable:
+            return
+        entries = []
+        for cache_file_path in cast(Path, self.cache_dir).glob(f"*{CACHE_FILE_SUFFIX}"):
+            with suppress(OSError):
+                entries.append((cache_file_path, cache_file_path.stat()))
+        entries.sort(key=lambda entry: entry[1].st_mtime)
+
+        total_size = sum(stat.st_size for _, stat in entries)
+        for cache_file_path, stat in entries:
+            if total_size <= self.max_size:
+                break
+            with suppress(OSError):
+                cache_file_path.unlink()
+                total_size -= stat.st_size
+
+
+def parse_feature(
+    config: Union[Config, PytestBDDIdGeneratorHandler], parser: ParserProtocol, path: Path, uri: str, *args, **kwargs
+) -> Feature:
+    """Parse feature using session parse cache if it is configured"""
+    feature_parse_cache: Optional[FeatureParseCache] = getattr(config, "pytest_bdd_parse_cache", None)
+    if feature_parse_cache is None:
+        return parser.parse(config, path, uri, *args, **kwargs)
+    return feature_parse_cache.parse(config, parser, path, uri, *args, **kwargs)
+
+
+def configure(config: Config) -> None:
+    config.pytest_bdd_parse_cache = FeatureParseCache.build(config)  # type: ignore[attr-defined]
+
+
+def unconfigure(config: Config) -> None:
+    with suppress(AttributeError):
+        config.pytest_bdd_parse_cache.evict()  # type: ignore[attr-defined]
@@ -0,0 +1,149 @@
+"""Parallel parsing of features.
+
+Feature files are parsed by the pool of worker processes; Parsed features are returned back to the main process,
+which assigns session ids to them and emits messages in the same order as if features were parsed one by one.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union, cast
+
+from attr import Factory, attrib, attrs
+
+from pytest_bdd.compatibility.parser import ParserProtocol
+from pytest_bdd.compatibility.pytest import Config, Parser
+from pytest_bdd.model import Feature
+from pytest_bdd.parse_cache import FeatureParseCache, parse_feature
+from pytest_bdd.utils import IdGenerator, PytestBDDIdGeneratorHandler
+
+ParseTask = Tuple[Callable[..., ParserProtocol], Path, str]
+
+
+def add_options(parser: Parser):
+    """Add pytest-bdd parse workers options."""
+    group = parser.getgroup("bdd", "Parse workers")
+    group.addoption(
+        "--bdd-parse-workers",
+        action="store",
+        dest="bdd_parse_workers",
+        type=int,
+        metavar="N",
+        default=None,
+        help="Parse feature files by N worker processes",
+    )
+    parser.addini(
+        "bdd_parse_workers",
+        default="0",
+        help="Parse feature files by N worker processes",
+    )
+
+
+@attrs
+class _WorkerConfig:
+    """Stands for pytest config inside of parse worker; Messages are emitted by the main process"""
+
+    pytest_bdd_id_generator: IdGenerator = attrib(default=Factory(IdGenerator))
+    hook = attrib(default=Factory(lambda: SimpleNamespace(pytest_bdd_message=lambda **kwargs: None)))
+
+
+def _parse_in_worker(
+    parser_type: Callable[..., ParserProtocol],
+    path: Path,
+    uri: str,
+    args: Sequence[Any],
+    kwargs: dict,
+    feature_parse_cache: Optional[FeatureParseCache],
+) -> Tuple[Feature, int, int]:
+    worker_config = _WorkerConfig()
+    parser = parser_type(id_generator=worker_config.pytest_bdd_id_generator)
+    if feature_parse_cache is None:
+        return parser.parse(worker_config, path, uri, *args, **kwargs), 0, 0
+    feature_parse_cache.hits = feature_parse_cache.misses = 0
+    feature = feature_parse_cache.parse(worker_config, parser, path, uri, *args, **kwargs)
+    return feature, feature_parse_cache.hits, feature_parse_cache.misses
+
+
+@attrs
+class FeatureParsePool:
+    workers: int = attrib(default=0)
+    executor: Optional[ProcessPoolExecutor] = attrib(default=None, init=False)
+
+    @classmethod
+    def build(cls, config: Config) -> "FeatureParsePool":
+        workers = config.option.bdd_parse_workers
+        if workers is None:
+            workers = int(config.getini("bdd_parse_workers"))
+        return cls(workers=workers)  # type: ignore[call-arg]
+
+    def parse(
+        self, config: Union[Config, PytestBDDIdGeneratorHandler], tasks: Iterable[ParseTask], *args, **kwargs
+    ) -> List[Feature]:
+        """Parse features in the order of tasks"""
+        tasks = list(tasks)
+        if self.workers <= 1 or len(tasks) <= 1:
+            id_generator = cast(PytestBDDIdGeneratorHandler, config).pytest_bdd_id_generator
+            return [
+                parse_feature(config, parser_type(id_generator=id_generator), path, uri, *args, **kwargs)
+                for parser_type, path, uri in tasks
+            ]
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        feature_parse_cache: Optional[FeatureParseCache] = getattr(config, "pytest_bdd_parse_cache", None)
+        futures = [
+            self.executor.submit(_parse_in_worker, parser_type, path, uri, args, kwargs, feature_parse_cache)
+            for parser_type, path, uri in tasks
+        ]
+
+        features = []
+        for (parser_type, path, uri), future in zip(tasks, futures):
+            feature, hits, misses = future.result()
+            if feature_parse_cache is not None:
+                feature_parse_cache.hits += hits
+                feature_parse_cache.misses += misses
+
+            feature.reassign_ids(cast(PytestBDDIdGeneratorHandler, config).pytest_bdd_id_generator)
+            emit_messages = getattr(parser_type, "emit_messages", None)
+            if emit_messages is not None:
+                emit_messages(config, feature, path.read_text(encoding=kwargs.get("encoding", "utf-8")), path, uri)
+            features.append(feature)
+        return features
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+def parse_features(
+    config: Union[Config, PytestBDDIdGeneratorHandler], tasks: Iterable[ParseTask], *args, **kwargs
+) -> List[Feature]:
+    """Parse features using session feature store and parse pool if they are configured"""
+    feature_parse_pool = getattr(config, "pytest_bdd_parse_pool", None) or FeatureParsePool()  # type: ignore[call-arg]
+
+    feature_store = getattr(config, "pytest_bdd_feature_store", None)
+    if feature_store is None:
+        return feature_parse_pool.parse(config, tasks, *args, **kwargs)
+    return feature_store.get_or_parse(
+        config,
+        tasks,
+        lambda missed_tasks: feature_parse_pool.parse(config, missed_tasks, *args, **kwargs),
+        args,
+        kwargs,
+    )
+
+
+def configure(config: Config) -> None:
+    config.pytest_bdd_parse_pool = FeatureParsePool.build(config)  # type: ignore[attr-defined]
+
+
+def shutdown(config: Config) -> None:
+    """Stop parse workers; Pool starts them again if more features are parsed"""
+    with suppress(AttributeError):
+        config.pytest_bdd_parse_pool.shutdown()  # type: ignore[attr-defined]
+
+
+def unconfigure(config: Config) -> None:
+    shutdown(config)
@@ -1,10 +1,10 @@
-import linecache
 from functools import partial
 from itertools import filterfalse
-from operator import contains, methodcaller
+from operator import contains
 from os.path import relpath
 from pathlib import Path
-from typing import Callable, List, Sequence, Set, Union, cast
+from typing import Callable, List, Optional, Sequence, Set, Union, cast
+from urllib.parse import urlparse
 
 from attr import attrib, attrs
 from attr._make import Factory
@@ -13,12 +13,14 @@ from gherkin.errors import CompositeParserException
 from gherkin.parser import Parser as CucumberIOBaseParser  # type: ignore[import]
 from gherkin.pickles.compiler import Compiler as PicklesCompiler
 
-from pytest_bdd.compatibility.parser import ParserProtocol
+from pytest_bdd.compatibility.parser import ParserProtocol, decode_text
 from pytest_bdd.compatibility.pytest import Config
 from pytest_bdd.compatibility.struct_bdd import STRUCT_BDD_INSTALLED
+from pytest_bdd.discovery import DiscoveryGlob
 from pytest_bdd.exceptions import FeatureError
 from pytest_bdd.model import Feature
 from pytest_bdd.model.messages import MediaType, Message, Source
+from pytest_bdd.scenario_filter import ScenarioFilter
 from pytest_bdd.utils import IdGenerator, PytestBDDIdGeneratorHandler
 
 if STRUCT_BDD_INSTALLED:  # pragma: no cover
@@ -29,14 +31,20 @@ if STRUCT_BDD_INSTALLED:  # pragma: no cover
 
 @attrs
 class GlobMixin:
-    glob: Callable[..., Sequence[Union[str, Path]]] = attrib(default=methodcaller("glob", "*.feature"), kw_only=True)
+    glob: Callable[..., Sequence[Union[str, Path]]] = attrib(default=DiscoveryGlob("*.feature"), kw_only=True)
 
 
 class ASTBuilderMixin:
-    def build_feature(self, gherkin_document_raw_dict, filename: str, id_generator) -> Feature:
+    def build_feature(
+        self, gherkin_document_raw_dict, filename: str, id_generator, scenario_filter: Optional[ScenarioFilter] = None
+    ) -> Feature:
         gherkin_document = Feature.load_gherkin_document(gherkin_document_raw_dict)
 
-        pickles_data = PicklesCompiler(id_generator=id_generator).compile(gherkin_document_raw_dict)
+        pickles_data = PicklesCompiler(id_generator=id_generator).compile(
+            gherkin_document_raw_dict
+            if scenario_filter is None
+            else scenario_filter.prune_gherkin_document(gherkin_document_raw_dict)
+        )
         pickles = Feature.load_pickles(pickles_data)
 
         feature = Feature(  # type: ignore[call-arg]
@@ -60,29 +68,45 @@ class GherkinParser(CucumberIOBaseParser, ASTBuilderMixin, GlobMixin, ParserProt
     def parse(
         cls, config: Union[Config, PytestBDDIdGeneratorHandler], path: Path, uri: str, *args, **kwargs
     ) -> Feature:
-        parser = cls(id_generator=cast(PytestBDDIdGeneratorHandler, config).pytest_bdd_id_generator)
-        encoding = kwargs.pop("encoding", "utf-8")
-        with path.open(mode="r", encoding=encoding) as feature_file:
-            feature_file_data = feature_file.read()
+        return cls.parse_bytes(config, path.read_bytes(), uri, *args, path=path, **kwargs)
 
-        if ".md" in path.suffixes:
-            media_type = MediaType.text_x_cucumber_gherkin_markdown
-        else:
-            media_type = MediaType.text_x_cucumber_gherkin_plain
+    @classmethod
+    def parse_bytes(
+        cls,
+        config: Union[Config, PytestBDDIdGeneratorHandler],
+        data: bytes,
+        uri: str,
+        *args,
+        path: Optional[Path] = None,
+        **kwargs,
+    ) -> Feature:
+        encoding = kwargs.pop("encoding", "utf-8")
+        return cls.parse_text(config, decode_text(data, encoding), uri, *args, path=path, **kwargs)
 
-        cast(Config, config).hook.pytest_bdd_message(
-            config=config, message=Message(source=Source(uri=uri, data=feature_file_data, media_type=media_type))
-        )
+    @classmethod
+    def parse_text(
+        cls,
+        config: Union[Config, PytestBDDIdGeneratorHandler],
+        data: str,
+        uri: str,
+        *args,
+        path: Optional[Path] = None,
+        **kwargs,
+    ) -> Feature:
+        parser = cls(id_generator=cast(PytestBDDIdGeneratorHandler, config).pytest_bdd_id_generator)
+        kwargs.pop("encoding", None)
+        scenario_filter = kwargs.pop("scenario_filter", None)
+        filename = uri if path is None else str(path.as_posix())
 
         try:
-            gherkin_document_raw_dict = CucumberIOBaseParser.parse(
-                parser, token_scanner_or_str=feature_file_data, *args, **kwargs
-            )
+            gherkin_document_raw_dict = CucumberIOBaseParser.parse(parser, token_scanner_or_str=data, *args, **kwargs)
         except CompositeParserException as e:
+            line_number = e.errors[0].location["line"]
+            data_lines = data.splitlines()
             raise FeatureError(
                 e.args[0],
-                e.errors[0].location["line"],
-                linecache.getline(str(path), e.errors[0].location["line"]).rstrip("\n"),
+                line_number,
+                data_lines[line_number - 1] if 0 < line_number <= len(data_lines) else "",
                 uri,
             ) from e
 
@@ -90,18 +114,32 @@ class GherkinParser(CucumberIOBaseParser, ASTBuilderMixin, GlobMixin, ParserProt
 
         feature = parser.build_feature(
             gherkin_document_raw_dict,
-            filename=str(path.as_posix()),
+            filename=filename,
             id_generator=getattr(config, "pytest_bdd_id_generator", IdGenerator()),
+            scenario_filter=scenario_filter,
         )
 
-        cast(Config, config).hook.pytest_bdd_message(
-            config=config, message=Message(gherkin_document=feature.gherkin_document)
-        )
-        for pickle in feature.pickles:
-            cast(Config, config).hook.pytest_bdd_message(config=config, message=Message(pickle=pickle))
+        parser.emit_messages(config, feature, data, Path(urlparse(uri).path) if path is None else path, uri)
 
         return feature
 
+    @staticmethod
+    def emit_messages(
+        config: Union[Config, PytestBDDIdGeneratorHandler], feature: Feature, data: str, path: Path, uri: str
+    ):
+        if ".md" in path.suffixes:
+            media_type = MediaType.text_x_cucumber_gherkin_markdown
+        else:
+            media_type = MediaType.text_x_cucumber_gherkin_plain
+
+        hook_handler = cast(Config, config).hook
+        hook_handler.pytest_bdd_message(
+            config=config, message=Message(source=Source(uri=uri, data=data, media_type=media_type))
+        )
+        hook_handler.pytest_bdd_message(config=config, message=Message(gherkin_document=feature.gherkin_document))
+        for pickle in feature.pickles:
+            hook_handler.pytest_bdd_message(config=config, message=Message(pickle=pickle))
+
     def get_from_paths(self, config: Config, paths: Sequence[Path], **kwargs) -> Sequence[Feature]:
         """Get features for given paths."""
         seen_names: Set[Path] = set()
@@ -2,21 +2,26 @@
 # from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from contextlib import suppress
 from functools import partial, singledispatchmethod
-from itertools import filterfalse
+from itertools import filterfalse, takewhile
 from operator import attrgetter, contains, methodcaller
-from re import Match
+from os.path import commonprefix
 from re import Pattern as _RePattern
 from re import compile as re_compile
-from typing import Any, Dict, Iterable, Optional, Sequence, Union, cast
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Sequence, Tuple, TypeVar, Union, cast
 
 import parse as base_parse
 import parse_type.cfparse as base_cfparse
+from attr import Factory, attrib, attrs
 from cucumber_expressions.argument import Argument as CucumberExpressionArgument
 from cucumber_expressions.expression import CucumberExpression
 from cucumber_expressions.parameter_type_registry import ParameterTypeRegistry
 from cucumber_expressions.regular_expression import RegularExpression as CucumberRegularExpression
 
+from pytest_bdd.compatibility.sre_parse import sre_parse
 from pytest_bdd.compatibility.typing import Protocol, runtime_checkable
 from pytest_bdd.model.messages import ExpressionType
 from pytest_bdd.utils import StringableProtocol, stringify
@@ -26,6 +31,117 @@ class ParserBuildValueError(ValueError):
     ...
 
 
+Interned = TypeVar("Interned")
+
+# Process-wide table of compiled parsers; Values are stored with objects referenced by keys' identities. Table is
+# bounded, least recently used entries are evicted, so patterns built at runtime don't grow it indefinitely
+INTERNED_MAXSIZE = 4096
+_interned: "OrderedDict[Hashable, Tuple[Any, Sequence[Any]]]" = OrderedDict()
+_interned_lock = Lock()
+
+
+def _get_intern_key_part(value: Any) -> Hashable:
+    try:
+        hash(value)
+    except TypeError:
+        return "__id__", id(value)
+    return value
+
+
+def get_interned(kind: Any, *args: Any, factory: Callable[..., Interned], **kwargs: Any) -> Interned:
+    """Get parser object built by factory from args, so identical patterns share one compiled object; Only immutable
+    objects have to be interned, because they are shared by all step definitions with identical patterns
+
+    :param kind: Kind of built object; Part of interning key together with args and kwargs. Unhashable args (like
+                 parameter type registries) are keyed by their identity
+    """
+    key = (
+        kind,
+        *map(_get_intern_key_part, args),
+        *((name, _get_intern_key_part(value)) for name, value in sorted(kwargs.items())),
+    )
+    with _interned_lock:
+        entry = _interned.get(key)
+        if entry is not None:
+            _interned.move_to_end(key)
+            return cast(Interned, entry[0])
+
+    interned = factory(*args, **kwargs)
+    with _interned_lock:
+        interned, _ = _interned.setdefault(key, (interned, (*args, *kwargs.values())))
+        while len(_interned) > INTERNED_MAXSIZE:
+            _interned.popitem(last=False)
+    return cast(Interned, interned)
+
+
+@attrs
+class MatchResult:
+    """Result of step name matching; Step arguments are got from the same match"""
+
+    named: Dict[str, Any] = attrib(default=Factory(dict))
+    anonymous: Sequence[Any] = attrib(default=())
+
+    def get_arguments(self, anonymous_group_names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        arguments = dict(self.named)
+        if anonymous_group_names is not None:
+            arguments.update(zip(anonymous_group_names, self.anonymous))
+        return arguments
+
+
+@attrs
+class DeferredMatchResult(MatchResult):
+    """Result of step name matching which arguments are parsed on demand"""
+
+    parse_arguments: Callable[[Optional[Iterable[str]]], Optional[Dict[str, Any]]] = attrib(default=None, kw_only=True)
+
+    def get_arguments(self, anonymous_group_names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        return self.parse_arguments(anonymous_group_names) or {}
+
+
+def get_match_result(parser: "StepParserProtocol", name: str) -> Optional[MatchResult]:
+    """Match step name by parser; Parsers which don't implement `match` are supported too"""
+    match = getattr(parser, "match", None)
+    if match is not None:
+        return match(name)
+    elif parser.is_matching(name):
+        return DeferredMatchResult(parse_arguments=partial(parser.parse_arguments, name))  # type: ignore[call-arg]
+    else:
+        return None
+
+
+def fold_literal_prefix(prefix: str) -> str:
+    """Fold prefix for case-insensitive comparison
+
+    Non-ASCII characters could be case-insensitively equal to ASCII ones (like "K" and Kelvin sign), so prefix is cut
+    at the first non-ASCII character
+    """
+    return "".join(takewhile(str.isascii, prefix)).lower()
+
+
+def get_regex_literal_prefix(regex: _RePattern) -> Tuple[str, bool]:
+    """Get literal which starts every string matched by regex from the start and if it's case-sensitive"""
+    if not isinstance(regex.pattern, str):
+        return "", True
+    try:
+        parsed_pattern = sre_parse.parse(regex.pattern, regex.flags)
+    except Exception:
+        return "", True
+
+    chars = []
+    for op, av in parsed_pattern:
+        if op == sre_parse.LITERAL:
+            chars.append(chr(av))
+        elif op == sre_parse.AT and not chars and av in (sre_parse.AT_BEGINNING, sre_parse.AT_BEGINNING_STRING):
+            continue
+        else:
+            break
+    prefix = "".join(chars)
+
+    if parsed_pattern.state.flags & sre_parse.SRE_FLAG_IGNORECASE:
+        return fold_literal_prefix(prefix), False
+    return prefix, True
+
+
 @runtime_checkable
 class StepParserProtocol(Protocol):
     type: ExpressionType = ExpressionType.pytest_bdd_other_expression
@@ -65,6 +181,23 @@ class StepParser(StepParserProtocol, metaclass=ABCMeta):
         """Match given name with the step name."""
         raise NotImplementedError()  # pragma: no cover
 
+    def match(self, name: str) -> Optional[MatchResult]:
+        """Match given name with the step name and get match result to parse step arguments without rematch.
+
+        :return: match result or None if name is not matched
+        """
+        if not self.is_matching(name):
+            return None
+        return DeferredMatchResult(parse_arguments=partial(self.parse_arguments, name))  # type: ignore[call-arg]
+
+    def get_literal_prefix(self) -> Tuple[str, bool]:
+        """Get literal which starts every step name matched by parser; Used to index step definitions.
+
+        :return: prefix and if it is case-sensitive; Case-insensitive prefix is folded by `fold_literal_prefix`.
+                 Empty prefix means that any step name could be matched
+        """
+        return "", True
+
     @classmethod
     def build(cls, parserlike: Union[str, bytes, "StepParser", StepParserProtocol]) -> "StepParser":
         """Get parser by given name.
@@ -85,6 +218,9 @@ class StepParser(StepParserProtocol, metaclass=ABCMeta):
             parser = cucumber_expression(parserlike)
         elif isinstance(parserlike, CucumberRegularExpression):
             parser = cucumber_regular_expression(parserlike)
+        elif isinstance(parserlike, (StringableProtocol, str, bytes)):
+            # Heuristic parser remembers matched sub-parsers, so only its compiled sub-parsers are shared
+            parser = heuristic(stringify(parserlike))
         else:
             parser = heuristic(parserlike)
 
@@ -105,40 +241,46 @@ class re(StepParser):
     def _(self, pattern: str, *args: Any, **kwargs: Any) -> None:
         """Compile regex."""
         self.pattern = pattern
-        self.regex = re_compile(self.pattern, *args, **kwargs)
+        self.regex = get_interned(re_compile, self.pattern, *args, factory=re_compile, **kwargs)
 
     @__init__.register
     def _(self, pattern: _RePattern):
-        """Compile regex."""
+        """Use compiled regex; Identical regexes are shared"""
         self.pattern = pattern.pattern
-        self.regex = pattern
+        self.regex = get_interned(re_compile, pattern.pattern, pattern.flags, factory=lambda *_: pattern)
 
     def parse_arguments(
         self,
         name,
         anonymous_group_names: Optional[Iterable[str]] = None,
     ):
-        match = cast(Match, self.regex.match(name))  # Can't be None because is already matched
+        match_result = self.match(name)
+        return None if match_result is None else match_result.get_arguments(anonymous_group_names)
+
+    def match(self, name: str) -> Optional[MatchResult]:
+        match = self.regex.fullmatch(name)
+        if match is None:
+            return None
         group_dict = match.groupdict()
-        if anonymous_group_names is not None:
-            group_dict.update(
-                zip(
-                    anonymous_group_names,
-                    map(
-                        lambda span: name[slice(*span)],  # type: ignore[no-any-return] # https://github.com/python/mypy/issues/9590
-                        filterfalse(
-                            partial(contains, [*map(match.span, group_dict.keys())]),
-                            map(match.span, range(1, len(match.groups()) + 1)),
-                        ),
+        return MatchResult(  # type: ignore[call-arg]
+            named=group_dict,
+            anonymous=[
+                *map(
+                    lambda span: name[slice(*span)],  # type: ignore[no-any-return] # https://github.com/python/mypy/issues/9590
+                    filterfalse(
+                        partial(contains, [*map(match.span, group_dict.keys())]),
+                        map(match.span, range(1, len(match.groups()) + 1)),
                     ),
                 )
-            )
-
-        return group_dict
+            ],
+        )
 
     def is_matching(self, name):
         return bool(self.regex.fullmatch(name))
 
+    def get_literal_prefix(self) -> Tuple[str, bool]:
+        return get_regex_literal_prefix(self.regex)
+
     def __str__(self):
         return stringify(self.pattern)
 
@@ -160,7 +302,7 @@ class parse(StepParser):
         self, format: Union[StringableProtocol, str, bytes], *args: Any, builder=base_parse.compile, **kwargs: Any
     ) -> None:
         self.format = stringify(format)
-        self.parser = builder(self.format, *args, **kwargs)
+        self.parser = get_interned(builder, self.format, *args, factory=builder, **kwargs)
 
     @__init__.register
     def _(self, format: base_parse.Parser):
@@ -174,12 +316,18 @@ class parse(StepParser):
 
     def parse_arguments(
         self, name: str, anonymous_group_names: Optional[Iterable[str]] = None
-    ) -> Union[Dict[str, Any]]:
-        match = self.parser.parse(name)
-        group_dict = cast(dict, match.named)
-        if anonymous_group_names is not None:
-            group_dict.update(dict(zip(anonymous_group_names, match.fixed)))
-        return group_dict
+    ) -> Optional[Dict[str, Any]]:
+        match_result = self.match(name)
+        return None if match_result is None else match_result.get_arguments(anonymous_group_names)
+
+    def match(self, name: str) -> Optional[MatchResult]:
+        try:
+            match = self.parser.parse(name)
+        except ValueError:
+            return None
+        if not match:
+            return None
+        return MatchResult(named=cast(dict, match.named), anonymous=match.fixed)  # type: ignore[call-arg]
 
     def is_matching(self, name):
         try:
@@ -187,6 +335,13 @@ class parse(StepParser):
         except ValueError:
             return False
 
+    def get_literal_prefix(self) -> Tuple[str, bool]:
+        try:
+            match_regex = self.parser._match_re
+        except Exception:
+            return "", True
+        return get_regex_literal_prefix(match_regex)
+
     def __str__(self):
         return str(self.format)
 
@@ -220,6 +375,12 @@ class string(StepParser):
         """Match given name with the step name."""
         return bool(self.name == name)
 
+    def match(self, name: str) -> Optional[MatchResult]:
+        return MatchResult() if self.name == name else None  # type: ignore[call-arg]
+
+    def get_literal_prefix(self) -> Tuple[str, bool]:
+        return self.name, True
+
     def __str__(self):
         return self.name
 
@@ -242,6 +403,24 @@ class _CucumberExpression(StepParser):
     ) -> Optional[Dict[str, Any]]:
         return dict(zip(anonymous_group_names or [], map(attrgetter("value"), self.expression.match(name) or [])))
 
+    def match(self, name: str) -> Optional[MatchResult]:
+        arguments = self.expression.match(name)
+        if not arguments:
+            return None
+        # Values of arguments are transformed only when they are requested
+        return DeferredMatchResult(  # type: ignore[call-arg]
+            parse_arguments=lambda anonymous_group_names: dict(
+                zip(anonymous_group_names or [], map(attrgetter("value"), arguments))
+            )
+        )
+
+    def get_literal_prefix(self) -> Tuple[str, bool]:
+        try:
+            regex = self.expression.tree_regexp.regexp  # type: ignore[attr-defined]
+        except AttributeError:
+            return "", True
+        return get_regex_literal_prefix(regex)
+
     def __str__(self):
         return str(self.pattern)
 
@@ -257,7 +436,9 @@ class cucumber_expression(_CucumberExpression):
     @__init__.register
     def _(self, expression: str, parameter_type_registry: ParameterTypeRegistry = ParameterTypeRegistry()):
         self.pattern = expression
-        self.expression = CucumberExpression(expression, parameter_type_registry=parameter_type_registry)
+        self.expression = get_interned(
+            CucumberExpression, expression, parameter_type_registry=parameter_type_registry, factory=CucumberExpression
+        )
 
     @__init__.register
     def _(self, expression: CucumberExpression):
@@ -276,7 +457,12 @@ class cucumber_regular_expression(_CucumberExpression):
     @__init__.register
     def _(self, expression: str, parameter_type_registry: ParameterTypeRegistry = ParameterTypeRegistry()):
         self.pattern = expression
-        self.expression = CucumberRegularExpression(expression, parameter_type_registry=parameter_type_registry)
+        self.expression = get_interned(
+            CucumberRegularExpression,
+            expression,
+            parameter_type_registry=parameter_type_registry,
+            factory=CucumberRegularExpression,
+        )
 
     @__init__.register
     def _(self, expression: CucumberRegularExpression):
@@ -285,59 +471,141 @@ class cucumber_regular_expression(_CucumberExpression):
 
 
 class heuristic(StepParser):
+    """Parser which tries string, cucumber expression, cfparse and regex parsers by priority
+
+    Sub-parsers are built on first use; Plain literals are matched only as strings (and case-insensitively as
+    cfparse formats do), because cucumber expressions and regexes without special characters are plain strings too.
+    """
+
     type = ExpressionType.pytest_bdd_heuristic_expression
 
+    special_chars = frozenset("{}()[]/\\.^$*+?|")
+    quantifier_chars = frozenset("?*+{")
+    sub_parser_builders = {
+        "string_parser": string,
+        "cucumber_expression_parser": cucumber_expression,
+        "cfparse_parser": cfparse,
+        "re_parser": re,
+    }
+    matched_priorities_maxsize = 1024
+
     def __init__(self, format):
         if isinstance(format, (StringableProtocol, str, bytes)):
             format = stringify(format)
         self.format = format
+        self.is_plain_literal = isinstance(format, str) and self.special_chars.isdisjoint(format)
+        self.sub_parsers: Dict[str, Optional[StepParser]] = {}
+        self.sub_parser_errors: Dict[str, Exception] = {}
+        # Priority of sub-parser which first matched given name; None if no one matched. Least recently matched names
+        # are evicted
+        self.matched_priorities: "OrderedDict[str, Optional[int]]" = OrderedDict()
+
+        if self.string_parser is not None:
+            return
 
         # Rework to exception groups after python 3.10 end of support
         e_cause = None
-        try:
-            self.string_parser = string(format)
-        except Exception as e:
-            e_cause = e
-            self.string_parser = None
+        for parser_name in self.sub_parser_builders.keys():
+            if self.get_sub_parser(parser_name) is None:
+                e = self.sub_parser_errors[parser_name]
+                e.__cause__, e_cause = e_cause, e
 
-        try:
-            self.cucumber_expression_parser = cucumber_expression(format)
-        except Exception as e:
-            e.__cause__, e_cause = e_cause, e
-            self.cucumber_expression_parser = None
+        if not any(self.parser_by_priorities):
+            raise ParserBuildValueError(f"Unable build parser for format {format}") from e_cause  # pragma: no cover
 
+    def get_sub_parser(self, parser_name: str) -> Optional[StepParser]:
         try:
-            self.cfparse_parser = cfparse(format)
-        except Exception as e:
-            e.__cause__, e_cause = e_cause, e
-            self.cfparse_parser = None
-
+            return self.sub_parsers[parser_name]
+        except KeyError:
+            pass
         try:
-            self.re_parser = re(format)
+            parser = self.sub_parser_builders[parser_name](self.format)
         except Exception as e:
-            e.__cause__, e_cause = e_cause, e
-            self.re_parser = None
+            self.sub_parser_errors[parser_name] = e
+            parser = None
+        self.sub_parsers[parser_name] = parser
+        return parser
 
-        if not any(self.parser_by_priorities):
-            raise ParserBuildValueError(f"Unable build parser for format {format}") from e_cause  # pragma: no cover
+    @property
+    def string_parser(self) -> Optional[StepParser]:
+        return self.get_sub_parser("string_parser")
+
+    @property
+    def cucumber_expression_parser(self) -> Optional[StepParser]:
+        return self.get_sub_parser("cucumber_expression_parser")
+
+    @property
+    def cfparse_parser(self) -> Optional[StepParser]:
+        return self.get_sub_parser("cfparse_parser")
 
     @property
-    def parser_by_priorities(self) -> Sequence[StepParser]:
-        return [self.string_parser, self.cucumber_expression_parser, self.cfparse_parser, self.re_parser]
+    def re_parser(self) -> Optional[StepParser]:
+        return self.get_sub_parser("re_parser")
+
+    @property
+    def parser_names_by_priorities(self) -> Sequence[str]:
+        if self.is_plain_literal:
+            return ["string_parser", "cfparse_parser"]
+        return [*self.sub_parser_builders.keys()]
+
+    @property
+    def parser_by_priorities(self) -> Sequence[Optional[StepParser]]:
+        return [*map(self.get_sub_parser, self.parser_names_by_priorities)]
 
     def is_matching(self, name: str) -> bool:
-        return any(map(methodcaller("is_matching", name), filter(bool, self.parser_by_priorities)))
+        return self.match(name) is not None
 
     def parse_arguments(
         self, name: str, anonymous_group_names: Optional[Iterable[str]] = None
     ) -> Optional[Dict[str, Any]]:
-        for parser in self.parser_by_priorities:
-            if parser is not None and parser.is_matching(name):
-                arguments = parser.parse_arguments(name, anonymous_group_names=anonymous_group_names)
-                break
+        match_result = self.match(name)
+        return None if match_result is None else match_result.get_arguments(anonymous_group_names)
+
+    def match(self, name: str) -> Optional[MatchResult]:
+        parser_names = self.parser_names_by_priorities
+        try:
+            priority = self.matched_priorities[name]
+        except KeyError:
+            pass
         else:
-            arguments = None
-        return arguments
+            with suppress(KeyError):
+                # Name could be evicted by other thread meanwhile
+                self.matched_priorities.move_to_end(name)
+            return (
+                None if priority is None else cast(StepParser, self.get_sub_parser(parser_names[priority])).match(name)
+            )
+
+        match_result = None
+        for priority, parser_name in enumerate(parser_names):  # noqa: B007
+            parser = self.get_sub_parser(parser_name)
+            if parser is not None:
+                match_result = parser.match(name)
+                if match_result is not None:
+                    break
+        else:
+            priority = None
+
+        self.matched_priorities[name] = priority
+        while len(self.matched_priorities) > self.matched_priorities_maxsize:
+            with suppress(KeyError):
+                self.matched_priorities.popitem(last=False)
+        return match_result
+
+    def get_literal_prefix(self) -> Tuple[str, bool]:
+        # Prefix is got from format, so sub-parsers are not built; cfparse makes it case-insensitive
+        if self.is_plain_literal:
+            return fold_literal_prefix(self.format), False
+        if not isinstance(self.format, str) or "|" in self.format:
+            return "", False
+        prefix = "".join(takewhile(lambda char: char not in self.special_chars, self.format))
+        special_char = self.format[len(prefix)]
+        if special_char in self.quantifier_chars:
+            # Regex quantifier is applied to the preceding char
+            prefix = prefix[:-1]
+        elif special_char == "/":
+            # Cucumber expression alternative is the whole preceding word
+            prefix = prefix[: len(prefix) - len(prefix.split(" ")[-1])]
+        return fold_literal_prefix(prefix), False
 
     def __str__(self):
         return self.format
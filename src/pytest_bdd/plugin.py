@@ -1,26 +1,54 @@
 """Pytest plugin entry point. Used for any fixtures needed."""
 # from __future__ import annotations
 
+from asyncio import AbstractEventLoop
 from collections import deque
 from contextlib import suppress
 from functools import partial
-from inspect import signature
+from inspect import isclass, isfunction, signature
 from itertools import chain, filterfalse, starmap
 from operator import attrgetter, contains, methodcaller
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Collection, Deque, Iterable, Optional, Sequence, Union
+from typing import Any, Collection, Deque, Iterable, Iterator, Optional, Sequence, Union
 from unittest.mock import patch
 from urllib.parse import urlparse
 
 import pytest
+from _pytest.mark.structures import get_unpacked_marks
 from _pytest.nodes import Collector
 
-from pytest_bdd import cucumber_json, generation, gherkin_terminal_reporter, given, steps, then, when
+from pytest_bdd import (
+    async_steps,
+    concurrency,
+    cucumber_json,
+    discovery,
+    execution_plan,
+    feature_store,
+    fetcher,
+    generation,
+    gherkin_terminal_reporter,
+    given,
+    http_cache,
+    parse_cache,
+    parse_pool,
+    prefix_sharing,
+    steps,
+    then,
+    when,
+)
 from pytest_bdd.allure_logging import AllurePytestBDD
 from pytest_bdd.collector import FeatureFileModule as FeatureFileCollector
 from pytest_bdd.collector import Module as ModuleCollector
-from pytest_bdd.compatibility.pytest import Config, Mark, MarkDecorator, Metafunc, Parser, PytestPluginManager
+from pytest_bdd.compatibility.pytest import (
+    Config,
+    Mark,
+    MarkDecorator,
+    Metafunc,
+    Parser,
+    PytestPluginManager,
+    TerminalReporter,
+)
 from pytest_bdd.message_plugin import MessagePlugin
 from pytest_bdd.mimetypes import Mimetype
 from pytest_bdd.model import Feature
@@ -32,6 +60,7 @@ from pytest_bdd.runner import ScenarioRunner
 from pytest_bdd.scenario import FeaturePathType, FileScenarioLocator, UrlScenarioLocator
 from pytest_bdd.scenario import add_options as scenario_add_options
 from pytest_bdd.scenario import scenarios
+from pytest_bdd.scenario_filter import ScenarioFilter
 from pytest_bdd.steps import StepHandler
 from pytest_bdd.struct_bdd.plugin import StructBDDPlugin
 from pytest_bdd.utils import IdGenerator, compose, getitemdefault, setdefaultattr
@@ -55,13 +84,14 @@ def trace() -> None:
 __registry = StepHandler.Registry()
 
 
-@pytest.fixture
 def step_registry() -> StepHandler.Registry:
     """Fixture containing registry of all user-defined steps"""
     return __registry
 
 
+# Registry is bound before function is wrapped, so it's accessible from fixture definition too
 step_registry.__registry__ = __registry  # type: ignore[attr-defined]
+step_registry = pytest.fixture(step_registry)
 
 
 @pytest.fixture
@@ -70,6 +100,12 @@ def step_matcher(pytestconfig) -> StepHandler.Matcher:
     return StepHandler.Matcher(pytestconfig)  # type: ignore[call-arg]
 
 
+@pytest.fixture
+def step_event_loop(request) -> Iterator[AbstractEventLoop]:
+    """Fixture containing event loop which runs async step functions"""
+    yield from async_steps.iter_step_event_loop(request)
+
+
 @pytest.fixture
 def steps_left() -> Deque[Step]:
     """Fixture containing steps which are left to be executed"""
@@ -80,7 +116,16 @@ def pytest_addoption(parser: Parser) -> None:
     """Add pytest-bdd options."""
     add_bdd_ini(parser)
     steps.add_options(parser)
+    execution_plan.add_options(parser)
+    async_steps.add_options(parser)
+    concurrency.add_options(parser)
+    prefix_sharing.add_options(parser)
     scenario_add_options(parser)
+    discovery.add_options(parser)
+    parse_cache.add_options(parser)
+    parse_pool.add_options(parser)
+    http_cache.add_options(parser)
+    fetcher.add_options(parser)
     cucumber_json.add_options(parser)
     generation.add_options(parser)
     gherkin_terminal_reporter.add_options(parser)
@@ -99,9 +144,23 @@ def pytest_configure(config: Config) -> None:
     config.addinivalue_line("markers", "scenarios: marker to provide scenarios locator")
     cucumber_json.configure(config)
     gherkin_terminal_reporter.configure(config)
+    steps.configure(config)
+    async_steps.configure(config)
+    concurrency.configure(config)
+    prefix_sharing.configure(config)
+    discovery.configure(config)
+    parse_cache.configure(config)
+    feature_store.configure(config)
+    parse_pool.configure(config)
+    http_cache.configure(config)
+    fetcher.configure(config)
     config.pluginmanager.register(ScenarioReporterPlugin())
     config.pluginmanager.register(ScenarioRunner())
-    config.pluginmanager.register(MessagePlugin(config=config), name="pytest_bdd_messages")  # type: ignore[call-arg]
+    if config.option.messages_ndjson_path is not None:
+        # Messages plugin hooks are not dispatched at all if messages are not reported
+        config.pluginmanager.register(
+            MessagePlugin(config=config), name="pytest_bdd_messages"  # type: ignore[call-arg]
+        )
     config.__allure_plugin__ = AllurePytestBDD.register_if_allure_accessible(config)  # type: ignore[attr-defined]
     setdefaultattr(config, "pytest_bdd_id_generator", value_factory=IdGenerator)
     config.pluginmanager.register(StructBDDPlugin())
@@ -109,10 +168,39 @@ def pytest_configure(config: Config) -> None:
 
 @pytest.hookimpl(tryfirst=True)
 def pytest_unconfigure(config: Config) -> None:
-    config.pluginmanager.unregister(name="pytest_bdd_messages")
+    if config.pluginmanager.has_plugin("pytest_bdd_messages"):
+        config.pluginmanager.unregister(name="pytest_bdd_messages")
     with suppress(AttributeError):
         config.__allure_plugin__.unregister(config)  # type: ignore[attr-defined]
     cucumber_json.unconfigure(config)
+    async_steps.unconfigure(config)
+    concurrency.unconfigure(config)
+    prefix_sharing.unconfigure(config)
+    discovery.unconfigure(config)
+    parse_cache.unconfigure(config)
+    feature_store.unconfigure(config)
+    parse_pool.unconfigure(config)
+    fetcher.unconfigure(config)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config: Config, items):
+    # Concurrently executed scenarios and scenarios sharing prefixes are always planned
+    execution_plan.build_plans(
+        config, items, required=concurrency.is_enabled(config) or prefix_sharing.is_enabled(config)
+    )
+    prefix_sharing.build_tree(config, items)
+
+
+def pytest_collection_finish(session) -> None:
+    # Features are parsed during collection; Threads of parse workers and fetcher would prevent forking of prefixes
+    parse_pool.shutdown(session.config)
+    fetcher.shutdown(session.config)
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter, config: Config) -> None:
+    steps.terminal_summary(terminalreporter, config)
+    prefix_sharing.terminal_summary(terminalreporter, config)
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -137,8 +225,7 @@ def _build_filter(filter_):
             if not isinstance(filter_, str):
                 filter_ = str(filter_)
 
-            def updated_filter(config, feature, scenario):
-                return scenario.name == filter_
+            updated_filter = ScenarioFilter(names=[filter_])  # type: ignore[call-arg]
 
     return updated_filter
 
@@ -218,7 +305,7 @@ def _build_scenario_locators_from_mark(mark: Mark, config: Config) -> Iterable[A
 
     url_locator = UrlScenarioLocator(  # type: ignore[call-arg]
         url_paths=filterfalse(is_local_path, feature_paths),
-        filter_=mark_arguments["filter_"],
+        filter_=filter_,
         encoding=mark_arguments["encoding"],
         features_base_url=features_base_url,
         mimetype=mark_arguments["features_mimetype"],
@@ -264,6 +351,28 @@ def pytest_generate_tests(metafunc: Metafunc):
         )
 
 
+def prefetch_module_features(module: ModuleType, config: Config):
+    """Start fetch of all remote features bound to module tests, so they are fetched together in background"""
+    feature_fetcher = fetcher.get_fetcher(config)
+    if feature_fetcher is None:
+        return
+    test_objs = chain.from_iterable(
+        [obj, *filter(isfunction, vars(obj).values())] if isclass(obj) else [obj]
+        for obj in vars(module).values()
+        if isfunction(obj) or isclass(obj)
+    )
+    scenario_marks = [
+        mark for test_obj in test_objs for mark in get_unpacked_marks(test_obj) if mark.name == "scenarios"
+    ]
+    feature_fetcher.prefetch(
+        chain.from_iterable(
+            locator.get_urls()
+            for locator in chain_map(partial(_build_scenario_locators_from_mark, config=config), scenario_marks)
+            if isinstance(locator, UrlScenarioLocator)
+        )
+    )
+
+
 def pytest_cmdline_main(config: Config) -> Optional[int]:
     return generation.cmdline_main(config)
 
@@ -281,9 +390,21 @@ def pytest_collect_file(parent: Collector, path, file_path=None):
     hook = parent.config.hook
 
     if hook.pytest_bdd_is_collectible(config=config, path=Path(file_path)):
+        prefetch_link_file_feature(Path(file_path), config)
         return FeatureFileCollector.build(parent=parent, file_path=file_path)
 
 
+def prefetch_link_file_feature(file_path: Path, config: Config):
+    """Start fetch of remote feature of link file; All files are collected before modules, so links are batched"""
+    feature_fetcher = fetcher.get_fetcher(config)
+    if feature_fetcher is None or file_path.suffixes[-1] not in {".url", ".desktop", ".webloc"}:
+        return
+    with suppress(Exception):
+        feature_pathlike, _ = FeatureFileCollector.get_feature_pathlike_and_base_dir(file_path)
+        if urlparse(str(feature_pathlike)).scheme in {"http", "https"}:
+            feature_fetcher.prefetch([str(feature_pathlike)])
+
+
 @pytest.mark.trylast
 def pytest_bdd_convert_tag_to_marks(feature, scenario, tag) -> Optional[Collection[Union[Mark, MarkDecorator]]]:
     return [getattr(pytest.mark, tag)]
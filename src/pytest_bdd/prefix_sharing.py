@@ -0,0 +1,617 @@
+"""Execution of scenarios sharing leading steps by forked processes.
+
+Planned scenarios of every module or class are grouped into prefix tree by step definitions and step arguments of
+their steps. Shared prefix is executed once by the process forked from pytest; When next scenario is called, process
+which executed its prefix forks again, so remaining steps are executed against copy-on-write snapshot of the state made
+by prefix steps. Step hooks and outcome of every scenario are sent back and replayed for its test item.
+
+Like concurrent scenarios, forked scenarios are executed detached from their items: steps could get only step arguments,
+fixtures injected by previous steps and fixtures of higher than function scope. Fixtures injected by forked steps are
+sent back when they could be pickled. Only process memory is copied by fork, so state kept by files, databases or other
+processes is shared between branches; Prefixes are not forked from pytest while other threads are alive, because only
+calling thread is copied to the forked process, such scenarios are listed by terminal summary. Threads of feature
+fetcher and parse workers are stopped once collection is finished. Mode is available on Linux.
+"""
+import os
+import pickle
+import select
+import struct
+import sys
+import threading
+import traceback
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from attr import Factory, attrib, attrs
+from pytest import UsageError
+
+from pytest_bdd.compatibility.pytest import Config, FixtureRequest, Item, Parser, TerminalReporter, is_item_run_skipped
+from pytest_bdd.concurrency import RECORDED_HOOKS, DetachedRequest, get_detached_fixtures
+from pytest_bdd.exceptions import ForkedScenarioError
+from pytest_bdd.execution_plan import ExecutionPlan, StepPlan, get_item_registry, get_plan
+from pytest_bdd.model import ExecutableStep, Feature
+from pytest_bdd.model.messages import Pickle
+from pytest_bdd.runner import ScenarioRunner
+from pytest_bdd.utils import inject_fixture
+
+# Hooks which are executed by forked processes; Only built-in implementations of them are known to keep no state
+BUILTIN_ONLY_HOOKS = ("pytest_bdd_run_step", "pytest_bdd_get_step_caller")
+UNIMPLEMENTED_HOOKS = ("pytest_bdd_before_step_call",)
+
+# Step hook name, step position in scenario, exception and step function arguments of recorded hook call; Prefix steps
+# are recorded once, so positions are used instead of ids of steps
+StepRecord = Tuple[str, int, Optional["ExceptionPayload"], Optional[Dict[str, Optional["ValuePayload"]]]]
+ExceptionPayload = Tuple[Optional[bytes], str]
+# Pickled value or representation of value which couldn't be pickled
+ValuePayload = Tuple[Optional[bytes], str]
+
+
+def add_options(parser: Parser):
+    """Add pytest-bdd prefix sharing options."""
+    group = parser.getgroup("bdd", "Prefix sharing")
+    group.addoption(
+        "--bdd-fork-prefixes",
+        action="store_true",
+        dest="bdd_fork_prefixes",
+        default=None,
+        help="Execute leading steps shared by scenarios once and fork process for every scenario (Linux only)",
+    )
+    parser.addini(
+        "bdd_fork_prefixes",
+        type="bool",
+        default=False,
+        help="Execute leading steps shared by scenarios once and fork process for every scenario (Linux only)",
+    )
+
+
+def is_enabled(config: Config) -> bool:
+    is_fork_prefixes_enabled = config.option.bdd_fork_prefixes
+    return config.getini("bdd_fork_prefixes") if is_fork_prefixes_enabled is None else is_fork_prefixes_enabled
+
+
+def is_supported() -> bool:
+    return sys.platform.startswith("linux") and hasattr(os, "fork")
+
+
+class RemoteTraceback(Exception):
+    """Traceback of exception raised by forked process"""
+
+    def __init__(self, tb: str):
+        super().__init__(tb)
+        self.tb = tb
+
+    def __str__(self):
+        return self.tb
+
+
+def dump_exception(exception: BaseException) -> ExceptionPayload:
+    tb = "".join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+    try:
+        data: Optional[bytes] = pickle.dumps(exception)
+        pickle.loads(data)  # type: ignore[arg-type]
+    except Exception:
+        data = None
+    return data, tb
+
+
+def load_exception(payload: ExceptionPayload) -> BaseException:
+    data, tb = payload
+    if data is None:
+        return ForkedScenarioError(tb)
+    exception = pickle.loads(data)
+    exception.__cause__ = RemoteTraceback(tb)
+    return exception
+
+
+@attrs(repr=False)
+class UnpicklableValue:
+    """Stands for value of forked process which couldn't be sent to pytest process"""
+
+    value_repr: str = attrib()
+
+    def __repr__(self):
+        return self.value_repr
+
+
+def dump_value(value: Any) -> ValuePayload:
+    try:
+        return pickle.dumps(value), ""
+    except Exception:
+        return None, f"<unpicklable {object.__repr__(value)}>"
+
+
+def load_value(payload: ValuePayload) -> Any:
+    data, value_repr = payload
+    return UnpicklableValue(value_repr) if data is None else pickle.loads(data)  # type: ignore[call-arg]
+
+
+def write_message(fd: int, message: Any):
+    data = pickle.dumps(message)
+    view = memoryview(struct.pack("<Q", len(data)) + data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _read_exactly(fd: int, size: int) -> Optional[bytes]:
+    chunks = []
+    while size:
+        chunk = os.read(fd, size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def read_message(fd: int) -> Any:
+    """Read message from pipe; None is returned if pipe is closed"""
+    header = _read_exactly(fd, 8)
+    if header is None:
+        return None
+    (size,) = struct.unpack("<Q", header)
+    data = _read_exactly(fd, size)
+    return None if data is None else pickle.loads(data)
+
+
+@attrs(eq=False)
+class PrefixNode:
+    """Node of prefix tree; Depth is the count of leading steps shared by scenarios passing the node"""
+
+    depth: int = attrib()
+    items_count: int = attrib(default=0)
+    children: Dict[Hashable, "PrefixNode"] = attrib(default=Factory(dict))
+
+
+@attrs(eq=False)
+class PrefixItem:
+    item: Item = attrib()
+    feature: Feature = attrib()
+    pickle: Pickle = attrib()
+    plan: ExecutionPlan = attrib()
+    steps: List[ExecutableStep] = attrib()
+    fixtures: List[str] = attrib()
+    # Nodes where scenario branches from other scenarios; Process executing steps up to every node is forked
+    fork_nodes: List[PrefixNode] = attrib(default=Factory(list))
+
+
+@attrs(eq=False)
+class ForkedProcess:
+    pid: int = attrib()
+    writer: int = attrib()
+    exit_status: Optional[int] = attrib(default=None)
+
+    def poll(self) -> Optional[int]:
+        if self.exit_status is None:
+            pid, status = os.waitpid(self.pid, os.WNOHANG)
+            if pid:
+                self.exit_status = status
+        return self.exit_status
+
+    def close(self):
+        os.close(self.writer)
+        if self.exit_status is None:
+            _, self.exit_status = os.waitpid(self.pid, 0)
+
+
+@attrs
+class StepRecorder:
+    """Records calls of per-step hooks made by forked process in the form sent to pytest process; Other hooks are
+    called by wrapped dispatcher"""
+
+    hook_dispatcher: Callable[[str, Dict[str, Any]], Any] = attrib()
+    request: DetachedRequest = attrib()
+    prefix_item: "PrefixItem" = attrib()
+    records: List[StepRecord] = attrib()
+    steps_indexes: Dict[int, int] = attrib(init=False)
+
+    @steps_indexes.default
+    def _get_steps_indexes(self) -> Dict[int, int]:
+        return {id(step): index for index, step in enumerate(self.prefix_item.steps)}
+
+    def __call__(self, name: str, kwargs: Dict[str, Any]):
+        if name not in RECORDED_HOOKS:
+            return self.hook_dispatcher(name, kwargs)
+        step = kwargs["step"]
+        exception = kwargs.get("exception")
+        step_func_args = kwargs.get("step_func_args")
+        self.records.append(
+            (
+                name,
+                self.steps_indexes[id(step)],
+                None if exception is None else dump_exception(exception),
+                None if step_func_args is None else self.dump_step_func_args(step, step_func_args),
+            )
+        )
+        return None
+
+    def dump_step_func_args(
+        self, step: ExecutableStep, step_func_args: Dict[str, Any]
+    ) -> Dict[str, Optional[ValuePayload]]:
+        """Special arguments and fixtures resolved before fork are known to pytest process, so only values of step
+        parameters and fixtures injected by steps are sent"""
+        step_plan = self.prefix_item.plan.steps[step.id]
+        special_args = step_plan.step_definition.special_args
+        return {
+            arg: (
+                dump_value(value)
+                if arg in step_plan.params_names or (arg in self.request.injected and arg not in special_args)
+                else None
+            )
+            for arg, value in step_func_args.items()
+        }
+
+
+@attrs(eq=False)
+class PrefixState:
+    """State of process which executed shared leading steps"""
+
+    request: DetachedRequest = attrib()
+    depth: int = attrib(default=0)
+    records: List[StepRecord] = attrib(default=Factory(list))
+    failure: Optional[ExceptionPayload] = attrib(default=None)
+    finalizers_count: int = attrib(default=0)
+
+
+def get_step_key(step: ExecutableStep, step_plan: StepPlan) -> Optional[Hashable]:
+    """Get key of step in prefix tree; Steps which get step argument or step itself are not shared"""
+    step_definition = step_plan.step_definition
+    if step.argument is not None or step_definition.special_args.intersection(step_plan.func_args):
+        return None
+    key = id(step_definition), tuple(step_plan.arguments.items())
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def is_step_execution_builtin(config: Config) -> bool:
+    return all(len(getattr(config.hook, name).get_hookimpls()) == 1 for name in BUILTIN_ONLY_HOOKS) and not any(
+        getattr(config.hook, name).get_hookimpls() for name in UNIMPLEMENTED_HOOKS
+    )
+
+
+@attrs(eq=False)
+class PrefixSharing:
+    items: Dict[str, PrefixItem] = attrib(default=Factory(dict), init=False)
+    # Count of not executed items of every top prefix node
+    pending: Dict[int, int] = attrib(default=Factory(dict), init=False)
+    processes: Dict[int, ForkedProcess] = attrib(default=Factory(dict), init=False)
+    results_reader: Optional[int] = attrib(default=None, init=False)
+    results_writer: Optional[int] = attrib(default=None, init=False)
+    runner: Optional[ScenarioRunner] = attrib(default=None, init=False)
+    # Scenarios which weren't forked because other threads were alive, and names of those threads
+    not_forked_count: int = attrib(default=0, init=False)
+    alive_threads_names: Set[str] = attrib(default=Factory(set), init=False)
+
+    def build_tree(self, items: Sequence[Item]):
+        roots: Dict[int, PrefixNode] = {}
+        paths = []
+        for item in items:
+            prefix_item = self.build_prefix_item(item)
+            if prefix_item is None:
+                continue
+            node = roots.setdefault(id(item.parent), PrefixNode(depth=0))  # type: ignore[call-arg]
+            path = []
+            for step in prefix_item.steps:
+                key = get_step_key(step, prefix_item.plan.steps[step.id])
+                if key is None:
+                    break
+                node = node.children.setdefault(key, PrefixNode(depth=node.depth + 1))  # type: ignore[call-arg]
+                node.items_count += 1
+                path.append(node)
+            paths.append((prefix_item, path))
+
+        for prefix_item, path in paths:
+            prefix_item.fork_nodes = [
+                node
+                for node, next_node in zip(path, [*path[1:], None])
+                if node.items_count > 1 and (next_node is None or next_node.items_count < node.items_count)
+            ]
+            if prefix_item.fork_nodes:
+                self.items[prefix_item.item.nodeid] = prefix_item
+                top_node_id = id(prefix_item.fork_nodes[0])
+                self.pending[top_node_id] = self.pending.get(top_node_id, 0) + 1
+
+    @staticmethod
+    def build_prefix_item(item: Item) -> Optional[PrefixItem]:
+        callspec = getattr(item, "callspec", None)
+        plan = get_plan(item)
+        if callspec is None or plan is None or is_item_run_skipped(item):
+            return None
+        feature: Optional[Feature] = callspec.params.get("feature")
+        pickle_: Optional[Pickle] = callspec.params.get("scenario")
+        if not isinstance(feature, Feature) or not isinstance(pickle_, Pickle):
+            return None
+        fixtures = get_detached_fixtures(item, plan, feature, pickle_)
+        if fixtures is None:
+            return None
+        return PrefixItem(  # type: ignore[call-arg]
+            item=item,
+            feature=feature,
+            pickle=pickle_,
+            plan=plan,
+            steps=feature.get_executable_steps(pickle_),
+            fixtures=fixtures,
+        )
+
+    def pytest_bdd_get_step_dispatcher(self, request: FixtureRequest, feature: Feature, scenario: Pickle):
+        prefix_item = self.items.get(request.node.nodeid)
+        if (
+            prefix_item is None
+            or not is_step_execution_builtin(request.config)
+            or not prefix_item.plan.is_valid(get_item_registry(request.node))
+        ):
+            return None
+        top_node_id = id(prefix_item.fork_nodes[0])
+        if top_node_id not in self.processes and threading.active_count() > 1:
+            # Threads of pytest process, like ones of concurrent scenarios or other plugins, are not copied by fork
+            self.pending[top_node_id] -= 1
+            self.not_forked_count += 1
+            self.alive_threads_names.update(
+                thread.name for thread in threading.enumerate() if thread is not threading.current_thread()
+            )
+            return None
+        if self.runner is None:
+            self.runner = next(
+                plugin for plugin in request.config.pluginmanager.get_plugins() if isinstance(plugin, ScenarioRunner)
+            )
+        return partial(self.dispatch, request, prefix_item)
+
+    def dispatch(self, request: FixtureRequest, prefix_item: PrefixItem, left_steps):
+        left_steps.clear()
+        top_node = prefix_item.fork_nodes[0]
+        process = self.processes.get(id(top_node))
+        if process is None:
+            if self.results_reader is None:
+                self.results_reader, self.results_writer = os.pipe()
+            detached_request = DetachedRequest(config=request.config, node=request.node)  # type: ignore[call-arg]
+            for other_item in self.items.values():
+                if other_item.fork_nodes[0] is top_node:
+                    for argname in other_item.fixtures:
+                        detached_request.values[argname] = request.getfixturevalue(argname)
+            state = PrefixState(request=detached_request)  # type: ignore[call-arg]
+            process = self.processes[id(top_node)] = self.fork_prefix(top_node, prefix_item, state, self.processes)
+
+        try:
+            write_message(process.writer, prefix_item.item.nodeid)
+            records, failure, teardown_failure, injected = self.read_result(process)
+        finally:
+            self.pending[id(top_node)] -= 1
+            if not self.pending[id(top_node)] or process.exit_status is not None:
+                self.processes.pop(id(top_node)).close()
+
+        if teardown_failure is not None:
+            teardown_exception = load_exception(teardown_failure)
+            request.addfinalizer(partial(_raise, teardown_exception))
+        self.replay(request, prefix_item, records, injected)
+        if failure is not None:
+            raise load_exception(failure)
+
+    def read_result(self, process: ForkedProcess):
+        """Wait for result sent by any process forked from the process of top prefix node"""
+        while not select.select([self.results_reader], [], [], 1)[0]:
+            if process.poll() is not None:
+                raise ForkedScenarioError(f"Forked process of shared prefix exited with status {process.exit_status}")
+        return read_message(self.results_reader)  # type: ignore[arg-type]
+
+    def replay(
+        self,
+        request: FixtureRequest,
+        prefix_item: PrefixItem,
+        records: List[StepRecord],
+        injected: Dict[str, ValuePayload],
+    ):
+        """Replay step hooks recorded by forked processes; Fixtures injected by forked steps are injected first, like
+        by concurrent scenarios"""
+        calls = []
+        for name, step_index, exception_payload, step_func_args_payload in records:
+            step = prefix_item.steps[step_index]
+            step_plan = prefix_item.plan.steps[step.id]
+            step_definition = step_plan.step_definition
+            hook_kwargs: Dict[str, Any] = dict(
+                request=request,
+                feature=prefix_item.feature,
+                scenario=prefix_item.pickle,
+                step=step,
+                step_func=step_definition.func,
+                step_definition=step_definition,
+            )
+            if step_func_args_payload is not None:
+                # Fixtures resolved before fork are got before fixtures injected by forked steps could override them
+                hook_kwargs["step_func_args"] = {
+                    arg: self.load_step_func_arg(request, step, step_plan, arg, payload)
+                    for arg, payload in step_func_args_payload.items()
+                }
+            if exception_payload is not None:
+                hook_kwargs["exception"] = load_exception(exception_payload)
+            calls.append((name, hook_kwargs))
+
+        for arg, payload in injected.items():
+            if payload[0] is not None:
+                inject_fixture(request, arg, load_value(payload))
+        hook_dispatcher = self.runner.hook_dispatcher  # type: ignore[union-attr]
+        for name, hook_kwargs in calls:
+            hook_dispatcher(name, hook_kwargs)
+
+    @staticmethod
+    def load_step_func_arg(
+        request: FixtureRequest, step: ExecutableStep, step_plan: StepPlan, arg: str, payload: Optional[ValuePayload]
+    ) -> Any:
+        if payload is not None:
+            return load_value(payload)
+        if arg in step_plan.step_definition.special_args:
+            return step
+        return request.getfixturevalue(arg)
+
+    def fork_prefix(
+        self, node: PrefixNode, prefix_item: PrefixItem, state: PrefixState, siblings: Dict[int, ForkedProcess]
+    ) -> ForkedProcess:
+        """Fork process which executes steps of prefix up to node and serves scenarios passing the node"""
+        reader, writer = os.pipe()
+        pid = os.fork()
+        if pid:
+            os.close(reader)
+            return ForkedProcess(pid=pid, writer=writer)  # type: ignore[call-arg]
+
+        try:
+            os.close(writer)
+            if self.results_reader is not None:
+                # Only pytest process reads results; Descriptor number could be reused by pipes of forked processes
+                os.close(self.results_reader)
+                self.results_reader = None
+            for sibling in siblings.values():
+                os.close(sibling.writer)
+            self.execute_steps(state, prefix_item, prefix_item.steps[state.depth : node.depth])
+            state.depth = node.depth
+            state.finalizers_count = len(state.request.finalizers)
+            self.serve(node, state, reader)
+        except BaseException:
+            traceback.print_exc()
+            os._exit(1)
+        finally:
+            os._exit(0)
+
+    def serve(self, node: PrefixNode, state: PrefixState, reader: int):
+        own_finalizers = state.request.finalizers[:]
+        children: Dict[int, ForkedProcess] = {}
+        while True:
+            nodeid = read_message(reader)
+            if nodeid is None:
+                break
+            prefix_item = self.items[nodeid]
+            if state.failure is not None:
+                self.send_result(state, None)
+                continue
+            fork_nodes = prefix_item.fork_nodes
+            node_index = next(index for index, fork_node in enumerate(fork_nodes) if fork_node is node)
+            if node_index + 1 == len(fork_nodes):
+                self.fork_scenario(prefix_item, state, children)
+                continue
+            next_node = fork_nodes[node_index + 1]
+            process = children.get(id(next_node))
+            if process is None:
+                process = children[id(next_node)] = self.fork_prefix(next_node, prefix_item, state, children)
+            try:
+                write_message(process.writer, nodeid)
+            except OSError as exception:
+                self.send_result(state, None, failure=dump_exception(exception))
+
+        for process in children.values():
+            process.close()
+        for finalizer in reversed(own_finalizers):
+            try:
+                finalizer()
+            except Exception:
+                pass
+
+    def fork_scenario(self, prefix_item: PrefixItem, state: PrefixState, siblings: Dict[int, ForkedProcess]):
+        """Fork process which executes remaining steps of scenario and sends its result"""
+        pid = os.fork()
+        if pid:
+            _, status = os.waitpid(pid, 0)
+            if status:
+                failure = ForkedScenarioError(f"Forked process of scenario exited with status {status}")
+                self.send_result(state, None, failure=dump_exception(failure))
+            return
+
+        try:
+            for sibling in siblings.values():
+                os.close(sibling.writer)
+            state.request.node = prefix_item.item
+            self.execute_steps(state, prefix_item, prefix_item.steps[state.depth :])
+            teardown_failure = None
+            for finalizer in reversed(state.request.finalizers[state.finalizers_count :]):
+                try:
+                    finalizer()
+                except Exception as exception:
+                    teardown_failure = teardown_failure or dump_exception(exception)
+            self.send_result(state, teardown_failure)
+        except BaseException:
+            traceback.print_exc()
+            os._exit(1)
+        finally:
+            os._exit(0)
+
+    def execute_steps(self, state: PrefixState, prefix_item: PrefixItem, steps: Sequence[ExecutableStep]):
+        if not steps or state.failure is not None:
+            return
+        runner: ScenarioRunner = self.runner  # type: ignore[assignment]
+        step_recorder = StepRecorder(  # type: ignore[call-arg]
+            runner.get_hook_dispatcher(prefix_item.item.config), state.request, prefix_item, state.records
+        )
+        try:
+            runner.run_detached_scenario(
+                state.request,
+                prefix_item.feature,
+                prefix_item.pickle,
+                prefix_item.plan,
+                step_recorder,
+                steps=steps,
+                previous_step=prefix_item.steps[state.depth - 1] if state.depth else None,
+            )
+        except BaseException as exception:
+            state.failure = dump_exception(exception)
+
+    def send_result(
+        self,
+        state: PrefixState,
+        teardown_failure: Optional[ExceptionPayload],
+        failure: Optional[ExceptionPayload] = None,
+    ):
+        """Send records, failure and fixtures injected by steps of scenario to pytest process"""
+        injected = {arg: dump_value(value) for arg, value in state.request.injected.items()}
+        message = state.records, failure or state.failure, teardown_failure, injected
+        write_message(self.results_writer, message)  # type: ignore[arg-type]
+
+    def close(self):
+        for process in self.processes.values():
+            process.close()
+        self.processes.clear()
+        for fd in (self.results_reader, self.results_writer):
+            if fd is not None:
+                os.close(fd)
+        self.results_reader = self.results_writer = None
+
+
+def _raise(exception: BaseException):
+    raise exception
+
+
+def get_prefix_sharing(config: Config) -> Optional[PrefixSharing]:
+    return getattr(config, "pytest_bdd_prefix_sharing", None)
+
+
+def build_tree(config: Config, items: Sequence[Item]) -> None:
+    prefix_sharing = get_prefix_sharing(config)
+    if prefix_sharing is not None:
+        prefix_sharing.build_tree(items)
+
+
+def terminal_summary(terminalreporter: TerminalReporter, config: Config) -> None:
+    prefix_sharing = get_prefix_sharing(config)
+    if prefix_sharing is not None and prefix_sharing.not_forked_count:
+        terminalreporter.write_sep(
+            "-",
+            f"prefix sharing: {prefix_sharing.not_forked_count} scenarios were not forked because other threads were "
+            f"alive: {', '.join(sorted(prefix_sharing.alive_threads_names))}",
+            yellow=True,
+        )
+
+
+def configure(config: Config) -> None:
+    if not is_enabled(config):
+        return
+    if not is_supported():
+        raise UsageError("--bdd-fork-prefixes is supported only on Linux")
+    prefix_sharing = PrefixSharing()
+    config.pytest_bdd_prefix_sharing = prefix_sharing  # type: ignore[attr-defined]
+    config.pluginmanager.register(prefix_sharing, name="pytest_bdd_prefix_sharing")
+
+
+def unconfigure(config: Config) -> None:
+    prefix_sharing = get_prefix_sharing(config)
+    if prefix_sharing is not None:
+        prefix_sharing.close()
+        if config.pluginmanager.has_plugin("pytest_bdd_prefix_sharing"):
+            config.pluginmanager.unregister(name="pytest_bdd_prefix_sharing")
@@ -1,48 +1,244 @@
 from collections import deque
-from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from functools import partial
 from itertools import zip_longest
 from operator import attrgetter
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
+from attr import attrib, attrs
 from pluggy import PluginManager
 from pytest import hookimpl
 
-from pytest_bdd import exceptions
+from pytest_bdd import concurrency, exceptions
+from pytest_bdd.async_steps import call_async_step_func, is_async_step_func
+from pytest_bdd.compatibility.pluggy import is_hook_calling_monitored
 from pytest_bdd.compatibility.pytest import FixtureRequest, Item, call_fixture_func
-from pytest_bdd.model import Feature
+from pytest_bdd.execution_plan import ExecutionPlan, get_valid_plan
+from pytest_bdd.model import ExecutableStep, Feature
 from pytest_bdd.model import Pickle as Scenario
-from pytest_bdd.model.messages import PickleStep
 from pytest_bdd.steps import StepHandler
-from pytest_bdd.utils import DefaultMapping, get_args, inject_fixture
+from pytest_bdd.utils import inject_fixture
+
+# Hooks dispatched for every step; Their callers are built once the session starts
+STEP_HOOKS = (
+    "pytest_bdd_run_step",
+    "pytest_bdd_match_step_definition_to_step",
+    "pytest_bdd_step_func_lookup_error",
+    "pytest_bdd_before_step",
+    "pytest_bdd_before_step_call",
+    "pytest_bdd_get_step_caller",
+    "pytest_bdd_after_step",
+    "pytest_bdd_step_error",
+)
+
+
+class HookDispatcher:
+    """Caller of per-step hooks
+
+    Implementations of every hook are inspected once, so hooks without implementations are not dispatched at all and
+    hooks with single implementation are called directly. Callers are rebuilt when plugin is registered or unregistered
+    or when monitoring of hook calls is turned on or off; Hooks are dispatched by pluggy as usual while hook calls are
+    monitored.
+    """
+
+    def __init__(self, plugin_manager: PluginManager) -> None:
+        self.plugin_manager = plugin_manager
+        self.callers: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        # Hook executor of plugin manager callers were built for; It is replaced when hook calls monitoring is changed
+        self.hookexec: Any = None
+        self.is_monitored = True
+        self.invalidate()
+        self.wrap_unregister()
+
+    def invalidate(self):
+        self.callers.clear()
+        self.hookexec = getattr(self.plugin_manager, "_inner_hookexec", None)
+        self.is_monitored = is_hook_calling_monitored(self.plugin_manager)
+
+    def wrap_unregister(self):
+        # Plugin manager doesn't call any hook when plugin is unregistered
+        unregister = self.plugin_manager.unregister
+
+        def unregister_and_invalidate(*args, **kwargs):
+            try:
+                return unregister(*args, **kwargs)
+            finally:
+                self.invalidate()
+
+        self.plugin_manager.unregister = unregister_and_invalidate  # type: ignore[assignment]
+
+    def build(self, names: Sequence[str] = STEP_HOOKS):
+        for name in names:
+            self.get_caller(name)
+
+    def get_caller(self, name: str) -> Callable[[Dict[str, Any]], Any]:
+        caller = self.callers.get(name)
+        if caller is None:
+            hook_caller = getattr(self.plugin_manager.hook, name)
+            caller = self.callers[name] = self.build_caller(hook_caller, hook_caller.get_hookimpls(), self.is_monitored)
+        return caller
+
+    def __call__(self, name: str, kwargs: Dict[str, Any]):
+        if getattr(self.plugin_manager, "_inner_hookexec", None) is not self.hookexec:
+            self.invalidate()
+        caller = self.callers.get(name)
+        if caller is None:
+            caller = self.get_caller(name)
+        return caller(kwargs)
+
+    @staticmethod
+    def build_caller(hook_caller, hookimpls: List[Any], is_monitored: bool) -> Callable[[Dict[str, Any]], Any]:
+        if is_monitored:
+            return lambda kwargs: hook_caller(**kwargs)
+
+        is_firstresult = hook_caller.spec is not None and hook_caller.spec.opts.get("firstresult", False)
+        if not hookimpls:
+            return lambda kwargs: None if is_firstresult else []
+        hookimpl = hookimpls[0]
+        if len(hookimpls) != 1 or hookimpl.hookwrapper or getattr(hookimpl, "wrapper", False):
+            return lambda kwargs: hook_caller(**kwargs)
+
+        function, argnames = hookimpl.function, hookimpl.argnames
+
+        def call_single_hookimpl(kwargs):
+            result = function(*map(kwargs.__getitem__, argnames))
+            return result if is_firstresult else [] if result is None else [result]
+
+        return call_single_hookimpl
+
+
+@attrs(frozen=True)
+class ScenarioExecution:
+    """State of scenario which is executed by runner in current thread"""
+
+    request: Any = attrib()
+    feature: Feature = attrib()
+    scenario: Scenario = attrib()
+    execution_plan: Optional[ExecutionPlan] = attrib()
+    hook_dispatcher: Callable[[str, Dict[str, Any]], Any] = attrib()
+
+
+_current_execution: ContextVar[Optional[ScenarioExecution]] = ContextVar("pytest_bdd_scenario_execution", default=None)
+
+
+def get_current_execution() -> Optional[ScenarioExecution]:
+    return _current_execution.get()
 
 
 class ScenarioRunner:
+    """Runner of scenarios
+
+    Runner is re-entrant: state of executed scenario is kept by context variable, so scenarios could be executed by
+    several threads at once.
+    """
+
     def __init__(self) -> None:
-        self.request: Optional[FixtureRequest] = None
-        self.feature: Optional[Feature] = None
-        self.scenario = None
         self.plugin_manager: Optional[PluginManager] = None
+        self.dispatcher: Optional[HookDispatcher] = None
+
+    @property
+    def execution(self) -> ScenarioExecution:
+        execution = _current_execution.get()
+        if execution is None:
+            raise RuntimeError("Scenario is not executed")
+        return execution
+
+    @property
+    def request(self):
+        execution = _current_execution.get()
+        return None if execution is None else execution.request
+
+    @property
+    def feature(self) -> Optional[Feature]:
+        execution = _current_execution.get()
+        return None if execution is None else execution.feature
+
+    @property
+    def scenario(self) -> Optional[Scenario]:
+        execution = _current_execution.get()
+        return None if execution is None else execution.scenario
+
+    @property
+    def execution_plan(self) -> Optional[ExecutionPlan]:
+        execution = _current_execution.get()
+        return None if execution is None else execution.execution_plan
+
+    @property
+    def hook_dispatcher(self) -> Callable[[str, Dict[str, Any]], Any]:
+        execution = _current_execution.get()
+        return self.dispatcher if execution is None else execution.hook_dispatcher  # type: ignore[return-value]
+
+    def pytest_plugin_registered(self, plugin, manager):
+        if self.dispatcher is not None and self.dispatcher.plugin_manager is manager:
+            self.dispatcher.invalidate()
+
+    def pytest_sessionstart(self, session):
+        self.get_hook_dispatcher(session.config).build()
+
+    def get_hook_dispatcher(self, config) -> HookDispatcher:
+        if self.dispatcher is None or self.dispatcher.plugin_manager is not config.pluginmanager:
+            self.dispatcher = HookDispatcher(config.pluginmanager)
+        return self.dispatcher
 
     def pytest_runtest_call(self, item: Item):
-        if "pytest_bdd_scenario" in list(map(attrgetter("name"), item.iter_markers())):
-            self.request = item._request
-            self.feature = self.request.getfixturevalue("feature")
-            self.scenario = self.request.getfixturevalue("scenario")
-            self.plugin_manager = self.request.config.hook
-            self.plugin_manager.pytest_bdd_before_scenario(
-                request=self.request, feature=self.feature, scenario=self.scenario
+        if "pytest_bdd_scenario" not in list(map(attrgetter("name"), item.iter_markers())):
+            return
+        request = item._request
+        feature = request.getfixturevalue("feature")
+        scenario = request.getfixturevalue("scenario")
+        self.plugin_manager = request.config.hook
+        hook_dispatcher = self.get_hook_dispatcher(request.config)
+
+        detached_run = concurrency.get_detached_run(item, self)
+        token = _current_execution.set(
+            ScenarioExecution(  # type: ignore[call-arg]
+                request=request,
+                feature=feature,
+                scenario=scenario,
+                execution_plan=get_valid_plan(item) if detached_run is None else None,
+                hook_dispatcher=hook_dispatcher,
             )
+        )
+        try:
+            self.plugin_manager.pytest_bdd_before_scenario(request=request, feature=feature, scenario=scenario)
             try:
-                self.plugin_manager.pytest_bdd_run_scenario(
-                    request=self.request,
-                    feature=self.feature,
-                    scenario=self.scenario,
-                )
+                if detached_run is None:
+                    self.plugin_manager.pytest_bdd_run_scenario(request=request, feature=feature, scenario=scenario)
+                else:
+                    detached_run.replay(request, hook_dispatcher)
             finally:
-                self.plugin_manager.pytest_bdd_after_scenario(
-                    request=self.request, feature=self.feature, scenario=self.scenario
+                self.plugin_manager.pytest_bdd_after_scenario(request=request, feature=feature, scenario=scenario)
+        finally:
+            _current_execution.reset(token)
+
+    def run_detached_scenario(
+        self,
+        request,
+        feature: Feature,
+        scenario: Scenario,
+        execution_plan: ExecutionPlan,
+        hook_dispatcher: Callable[[str, Dict[str, Any]], Any],
+        steps: Optional[Sequence[ExecutableStep]] = None,
+        previous_step: Optional[ExecutableStep] = None,
+    ):
+        """Execute planned steps of scenario while its pytest item is not set up; It is done by worker threads of
+        concurrent scenarios and forked processes of scenarios sharing leading steps"""
+        execution = ScenarioExecution(  # type: ignore[call-arg]
+            request=request,
+            feature=feature,
+            scenario=scenario,
+            execution_plan=execution_plan,
+            hook_dispatcher=hook_dispatcher,
+        )
+        token = _current_execution.set(execution)
+        try:
+            for step in feature.get_executable_steps(scenario) if steps is None else steps:
+                self.pytest_bdd_run_step(
+                    request=request, feature=feature, scenario=scenario, step=step, previous_step=previous_step
                 )
+                previous_step = step
+        finally:
+            _current_execution.reset(token)
 
     def pytest_bdd_run_scenario(self, request: FixtureRequest, feature: Feature, scenario: Scenario):
         """Execute the scenarios.
@@ -52,7 +248,7 @@ class ScenarioRunner:
         :param request: request.
         """
         steps: deque = request.getfixturevalue("steps_left")
-        steps.extend(scenario.steps)
+        steps.extend(feature.get_executable_steps(scenario))
         step_dispatcher = request.config.hook.pytest_bdd_get_step_dispatcher(
             request=request, feature=feature, scenario=scenario
         )
@@ -66,106 +262,110 @@ class ScenarioRunner:
             previous_step = None
             while left_steps:
                 step = left_steps.popleft()
-                self.plugin_manager.pytest_bdd_run_step(
-                    request=request, feature=feature, scenario=scenario, step=step, previous_step=previous_step
-                )  # type: ignore[call-arg]
+                self.hook_dispatcher(
+                    "pytest_bdd_run_step",
+                    dict(request=request, feature=feature, scenario=scenario, step=step, previous_step=previous_step),
+                )
                 previous_step = step
 
         return dispatcher
 
-    @contextmanager
-    def extended_step_context(self, feature: Feature, scenario, step):
-        if isinstance(step, PickleStep):
-            try:
-                step.__dict__["doc_string"] = feature._get_step_doc_string(step)
-                step.__dict__["data_table"] = feature._get_step_data_table(step)
-                step.__dict__["keyword"] = feature._get_step_keyword(step)
-                step.__dict__["line_number"] = feature._get_step_line_number(step)
-                yield
-            finally:
-                step.__dict__.pop("doc_string", None)
-                step.__dict__.pop("data_table", None)
-                step.__dict__.pop("keyword", None)
-                step.__dict__.pop("line_number", None)
-        else:
-            yield
-
     def pytest_bdd_run_step(self, request, feature: Feature, scenario, step, previous_step):
-        with self.extended_step_context(feature, scenario, step):
-            hook_kwargs = dict(
-                request=request,
-                feature=feature,
-                scenario=scenario,
-                step=step,
-                previous_step=previous_step,
-            )
+        # Step could be added to steps left without view
+        step = feature.get_executable_step(step)
+        hook_kwargs = dict(
+            request=request,
+            feature=feature,
+            scenario=scenario,
+            step=step,
+            previous_step=previous_step,
+        )
 
+        execution = self.execution
+        step_plan = None if execution.execution_plan is None else execution.execution_plan.get_step_plan(step)
+        if step_plan is None:
             try:
-                step_definition = self._match_to_step(step, previous_step)
+                step_definition = self._match_to_step(request, step, previous_step)
             except exceptions.StepDefinitionNotFoundError as exception:
                 hook_kwargs["exception"] = exception
-                request.config.hook.pytest_bdd_step_func_lookup_error(**hook_kwargs)
+                execution.hook_dispatcher("pytest_bdd_step_func_lookup_error", hook_kwargs)
                 raise
-            else:
-                hook_kwargs["step_func"] = step_definition.func
-                hook_kwargs["step_definition"] = step_definition
+        else:
+            step_definition = step_plan.step_definition
+        hook_kwargs["step_func"] = step_definition.func
+        hook_kwargs["step_definition"] = step_definition
 
-            request.config.hook.pytest_bdd_before_step(**hook_kwargs)
+        execution.hook_dispatcher("pytest_bdd_before_step", hook_kwargs)
 
-            hook_kwargs["step_func_args"] = {}
-            step_params = step_definition.get_parameters(step)
-            try:
-                self._inject_step_parameters_as_fixtures(
-                    step_params=step_params, params_fixtures_mapping=step_definition.params_fixtures_mapping
-                )
+        hook_kwargs["step_func_args"] = {}
+        if step_plan is None:
+            step_params = step_definition.get_parameters(
+                step, match_result=self._get_match_result(request, step, step_definition)
+            )
+            params_fixtures = step_definition.get_params_fixtures(step_params.keys())
+            func_args = None
+        else:
+            step_params = step_plan.get_step_params()
+            params_fixtures = step_plan.params_fixtures
+            func_args = step_plan.func_args
+        try:
+            for param, fixture_name in params_fixtures.items():
+                self._inject_fixture(request, fixture_name, step_params[param])
 
-                step_function_kwargs = dict(self._get_step_function_kwargs(step, step_definition, step_params))
-                hook_kwargs["step_func_args"] = step_function_kwargs
+            step_function_kwargs = dict(
+                self._get_step_function_kwargs(request, step, step_definition, step_params, func_args=func_args)
+            )
+            hook_kwargs["step_func_args"] = step_function_kwargs
 
-                request.config.hook.pytest_bdd_before_step_call(**hook_kwargs)
+            result_cache: Optional[StepHandler.ResultCache] = (
+                getattr(request.config, "pytest_bdd_step_result_cache", None) if step_definition.pure else None
+            )
+            is_cached = False
+            if result_cache is not None:
+                cache_key, pinned = result_cache.get_key(step_definition, step, step_function_kwargs)
+                is_cached, step_result = result_cache.get(cache_key)
+
+            if not is_cached:
+                execution.hook_dispatcher("pytest_bdd_before_step_call", hook_kwargs)
 
-                step_caller = request.config.hook.pytest_bdd_get_step_caller(**hook_kwargs)
+                step_caller = execution.hook_dispatcher("pytest_bdd_get_step_caller", hook_kwargs)
                 step_result = step_caller()
 
-                self._inject_target_fixtures(step_definition, step_result)
-                request.config.hook.pytest_bdd_after_step(**hook_kwargs)
-            except Exception as exception:
-                hook_kwargs["exception"] = exception
-                request.config.hook.pytest_bdd_step_error(**hook_kwargs)
-                raise
+                if result_cache is not None:
+                    result_cache.put(cache_key, pinned, step_result)
+
+            self._inject_target_fixtures(request, step_definition, step_result)
+            execution.hook_dispatcher("pytest_bdd_after_step", hook_kwargs)
+        except Exception as exception:
+            hook_kwargs["exception"] = exception
+            execution.hook_dispatcher("pytest_bdd_step_error", hook_kwargs)
+            raise
 
     @hookimpl(trylast=True)
     def pytest_bdd_get_step_caller(self, request, feature, scenario, step, step_func, step_func_args, step_definition):
+        if is_async_step_func(step_definition.func):
+            return partial(call_async_step_func, step_definition.func, request=request, kwargs=step_func_args)
         # Execute the step as if it was a pytest fixture, so that we can allow "yield" statements in it
         return partial(call_fixture_func, fixturefunc=step_definition.func, request=request, kwargs=step_func_args)
 
-    def _inject_step_parameters_as_fixtures(
-        self, step_params: Optional[dict] = None, params_fixtures_mapping: Optional[dict] = None
-    ):
-        step_params = step_params or {}
-        params_fixtures_mapping = (
-            DefaultMapping.instantiate_from_collection_or_bool(
-                params_fixtures_mapping or {}, warm_up_keys=step_params.keys()
-            )
-            or {}
-        )
-
-        for param, fixture_name in params_fixtures_mapping.items():
-            if fixture_name is not None:
-                with suppress(KeyError):
-                    inject_fixture(self.request, fixture_name, step_params[param])
-
-    def _get_step_function_kwargs(self, step, step_definition, step_params):
-        for param in get_args(step_definition.func):
-            try:
+    def _get_step_function_kwargs(self, request, step, step_definition, step_params, func_args=None):
+        special_args = step_definition.special_args
+        for param in step_definition.func_args if func_args is None else func_args:
+            if param in step_params:
                 yield param, step_params[param]
-            except KeyError:
-                try:
-                    yield param, dict(step=step)[param]
-                except KeyError:
-                    yield param, self.request.getfixturevalue(param)
+            elif param in special_args:
+                yield param, step
+            else:
+                yield param, request.getfixturevalue(param)
 
-    def _inject_target_fixtures(self, step_definition, step_result):
+    @staticmethod
+    def _inject_fixture(request, arg, value):
+        if isinstance(request, concurrency.DetachedRequest):
+            request.inject_fixture(arg, value)
+        else:
+            inject_fixture(request, arg, value)
+
+    def _inject_target_fixtures(self, request, step_definition, step_result):
         if len(step_definition.target_fixtures) == 1:
             injectable_fixtures = [(step_definition.target_fixtures[0], step_result)]
         elif step_result is not None and len(step_definition.target_fixtures) != 0:
@@ -174,22 +374,33 @@ class ScenarioRunner:
             injectable_fixtures = zip_longest(step_definition.target_fixtures, [])
 
         for target_fixture, return_value in injectable_fixtures:
-            inject_fixture(self.request, target_fixture, return_value)
+            self._inject_fixture(request, target_fixture, return_value)
+
+    @staticmethod
+    def _get_match_result(request, step, step_definition):
+        """Get match result of step matched by step matcher, so step text is not matched again"""
+        step_matcher = request.getfixturevalue("step_matcher")
+        get_last_match_result = getattr(step_matcher, "get_last_match_result", None)
+        return None if get_last_match_result is None else get_last_match_result(step, step_definition)
 
-    def _match_to_step(self, step, previous_step):
+    def _match_to_step(self, request, step, previous_step):
+        execution = self.execution
         try:
-            return self.request.config.hook.pytest_bdd_match_step_definition_to_step(
-                request=self.request,
-                feature=self.feature,
-                scenario=self.scenario,
-                step=step,
-                previous_step=previous_step,
+            return execution.hook_dispatcher(
+                "pytest_bdd_match_step_definition_to_step",
+                dict(
+                    request=request,
+                    feature=execution.feature,
+                    scenario=execution.scenario,
+                    step=step,
+                    previous_step=previous_step,
+                ),
             )
         except StepHandler.Matcher.MatchNotFoundError as e:
             raise exceptions.StepDefinitionNotFoundError(
                 f'Step definition is not found: "{step.text}". '
                 f'Step keyword: "{step.keyword}". '
                 f"Line {step.line_number} "
-                f'in scenario "{self.scenario.name}" '
-                f'in the feature "{self.feature.uri}"'
+                f'in scenario "{execution.scenario.name}" '
+                f'in the feature "{execution.feature.uri}"'
             ) from e
@@ -10,31 +10,31 @@ test_publish_article = scenario(
     scenario_name="Publishing the article",
 )
 """
-import asyncio
 import collections
 import os
-import ssl
 from contextlib import suppress
 from enum import Enum
 from functools import partial, reduce
-from operator import methodcaller, truediv
+from operator import truediv
 from os.path import commonpath
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Callable, Iterable, Optional, Tuple, Type, Union, cast
+from typing import Callable, Iterable, List, Optional, Type, Union, cast
 from urllib.parse import urljoin
 
-import aiohttp
-import certifi
 from attr import Factory, attrib, attrs
 from pytest import mark
 
-from pytest_bdd.compatibility.parser import ParserProtocol
+from pytest_bdd.compatibility.parser import ParserProtocol, is_content_parser
 from pytest_bdd.compatibility.pytest import Config, Parser, get_config_root_path
+from pytest_bdd.discovery import get_discovery
+from pytest_bdd.fetcher import FeatureFetcher, get_fetcher
 from pytest_bdd.mimetypes import Mimetype
 from pytest_bdd.model import Feature
 from pytest_bdd.model.messages import Pickle
+from pytest_bdd.parse_pool import parse_features
 from pytest_bdd.parser import GherkinParser
+from pytest_bdd.scenario_filter import ScenarioFilter
 from pytest_bdd.utils import PytestBDDIdGeneratorHandler, compose, make_python_name
 
 Args = collections.namedtuple("Args", ["args", "kwargs"])
@@ -58,6 +58,11 @@ def add_options(parser: Parser):
     )
 
 
+def _build_scenario_filter_kwargs(filter_):
+    # Declarative filters are pushed down to parser, so filtered out scenarios are not compiled at all
+    return dict(scenario_filter=filter_) if isinstance(filter_, ScenarioFilter) else {}
+
+
 @attrs
 class UrlScenarioLocator:
     url_paths = attrib()
@@ -68,38 +73,35 @@ class UrlScenarioLocator:
     parser_type = attrib()
     parse_args = attrib()
 
-    async def fetch(self, session: aiohttp.ClientSession, url):
-        sslcontext = ssl.create_default_context(cafile=certifi.where())
-        async with session.get(url, ssl=sslcontext) as response:
-            return response.content_type, await response.text(encoding=self.encoding)
-
-    async def fetch_all(self, urls):
-        async with aiohttp.ClientSession() as session:
-            return await asyncio.gather(*[self.fetch(session, url) for url in urls], return_exceptions=True)
-
-    def resolve(self, config: Union[Config, PytestBDDIdGeneratorHandler]):
-        urls = list(
+    def get_urls(self) -> List[str]:
+        return list(
             self.url_paths
             if self.features_base_url is None
             else map(partial(urljoin, self.features_base_url), self.url_paths)
         )
+
+    def resolve(self, config: Union[Config, PytestBDDIdGeneratorHandler]):
+        urls = self.get_urls()
         if not urls:
             return
-        loop = asyncio.new_event_loop()
-        responses = loop.run_until_complete(self.fetch_all(urls))
-
-        # Wait 250 ms for the underlying SSL connections to close
-        loop.run_until_complete(asyncio.sleep(0.250))
-        loop.close()
+        fetcher = get_fetcher(config)
+        if fetcher is None:
+            fetcher = FeatureFetcher(http_cache=getattr(config, "pytest_bdd_http_cache", None))  # type: ignore[call-arg]
+            try:
+                responses = fetcher.fetch_all(urls)
+            finally:
+                fetcher.shutdown()
+        else:
+            responses = fetcher.fetch_all(urls)
 
         hook_handler = cast(Config, config).hook
         encoding = self.encoding
 
         for url, response in zip(urls, responses):
-            if isinstance(response, Exception):
+            if isinstance(response, BaseException):
                 continue
 
-            mimetype, feature_content = response
+            mimetype, feature_content = response.content_type, response.decode(self.encoding)
 
             if self.mimetype is not None:
                 mimetype = self.mimetype
@@ -119,34 +121,40 @@ class UrlScenarioLocator:
                 break
 
             parser = parser_type(id_generator=cast(PytestBDDIdGeneratorHandler, config).pytest_bdd_id_generator)
+            parse_kwargs = {
+                **dict(encoding=encoding),
+                **_build_scenario_filter_kwargs(self.filter_),
+                **self.parse_args.kwargs,
+            }
+
+            if is_content_parser(parser):
+                # Downloaded content is parsed right from memory
+                feature = parser.parse_text(config, feature_content, url, *self.parse_args.args, **parse_kwargs)
+            else:
+                feature = self._parse_by_temp_file(config, parser, feature_content, url, parse_kwargs)
 
-            try:
-                filename = None
-                with NamedTemporaryFile(mode="w", delete=False) as f:
-                    filename = f.name
-                    f.write(feature_content)
-
-                feature = parser.parse(
-                    config,
-                    Path(filename),
-                    url,
-                    *self.parse_args.args,
-                    **{**dict(encoding=encoding), **self.parse_args.kwargs},
-                )
+            for pickle in feature.pickles:
+                if self.filter_ is None or self.filter_(config, feature, pickle):  # type: ignore
+                    yield feature, pickle
 
-                for pickle in feature.pickles:
-                    if self.filter_ is None or self.filter_(config, feature, pickle):  # type: ignore
-                        yield feature, pickle
-            finally:
-                if filename is not None:
-                    with suppress(Exception):
-                        os.unlink(filename)
+    def _parse_by_temp_file(self, config, parser, feature_content, url, parse_kwargs):
+        filename = None
+        try:
+            with NamedTemporaryFile(mode="w", delete=False) as f:
+                filename = f.name
+                f.write(feature_content)
+
+            return parser.parse(config, Path(filename), url, *self.parse_args.args, **parse_kwargs)
+        finally:
+            if filename is not None:
+                with suppress(Exception):
+                    os.unlink(filename)
 
 
 @attrs
 class FileScenarioLocator:
     feature_paths = attrib(default=Factory(list))
-    filter_: Optional[Callable[[Config, Feature, Pickle], Tuple[Feature, Pickle]]] = attrib(default=None)
+    filter_: Optional[Union[ScenarioFilter, Callable[[Config, Feature, Pickle], bool]]] = attrib(default=None)
     encoding = attrib(default="utf-8")
     features_base_dir: Optional[Union[str, Path]] = attrib(default=None)
     mimetype: Optional[str] = attrib(default=None)
@@ -169,19 +177,27 @@ class FileScenarioLocator:
 
         return features_base_dir
 
-    def _gen_feature_paths(self, features_base_dir):
+    def _gen_feature_paths(self, config: Union[Config, PytestBDDIdGeneratorHandler], features_base_dir: Path):
+        feature_discovery = get_discovery(config)
+        hook_handler = cast(Config, config).hook
+
+        def is_collectible(path: Path):
+            return hook_handler.pytest_bdd_is_collectible(config=config, path=path)
+
+        # Parser is chosen by mimetype only for collectible files; Explicit parser type could parse any file
+        is_feature_path = is_collectible if self.parser_type is None else None
         for feature_pathlike in self.feature_paths:
             if isinstance(feature_pathlike, Path):
                 feature_path = features_base_dir / feature_pathlike
                 if feature_path.is_dir():
-                    yield from filter(methodcaller("is_file"), feature_path.glob("**/*"))
+                    yield from feature_discovery.walk(feature_path, is_matching=is_feature_path)
                 else:
                     yield feature_path
             else:
                 try:
-                    yield from filter(methodcaller("is_file"), features_base_dir.glob(str(feature_pathlike)))
-                except IndexError:
-                    yield from filter(methodcaller("is_file"), features_base_dir.glob("**/*"))
+                    yield from feature_discovery.glob(features_base_dir, str(feature_pathlike))
+                except ValueError:
+                    yield from feature_discovery.walk(features_base_dir, is_matching=is_feature_path)
 
     @staticmethod
     def _build_file_uri(features_base_dir: Path, feature_path: Path):
@@ -199,19 +215,17 @@ class FileScenarioLocator:
 
         return "file:" + str(rel_feature_path.as_posix())
 
-    def resolve(self, config: Union[Config, PytestBDDIdGeneratorHandler]):
-        features_base_dir = self._resolve_features_base_dir(config)
+    def _gen_parse_tasks(self, config: Union[Config, PytestBDDIdGeneratorHandler], features_base_dir: Path):
         already_resolved_feature_paths = set()
+        hook_handler = cast(Config, config).hook
 
-        for feature_path in self._gen_feature_paths(features_base_dir=features_base_dir):
+        for feature_path in self._gen_feature_paths(config, features_base_dir=features_base_dir):
             feature_path_key = str(feature_path)
             if feature_path_key in already_resolved_feature_paths:
                 break
 
             uri = self._build_file_uri(features_base_dir, feature_path)
             already_resolved_feature_paths.add(feature_path_key)
-            hook_handler = cast(Config, config).hook
-            encoding = self.encoding
 
             if self.parser_type is None:
                 if self.mimetype is None:
@@ -229,16 +243,19 @@ class FileScenarioLocator:
             if parser_type is None:
                 break
 
-            parser = parser_type(id_generator=cast(PytestBDDIdGeneratorHandler, config).pytest_bdd_id_generator)
+            yield parser_type, feature_path, uri
 
-            feature = parser.parse(
-                config,
-                feature_path,
-                uri,
-                *self.parse_args.args,
-                **{**dict(encoding=encoding), **self.parse_args.kwargs},
-            )
+    def resolve(self, config: Union[Config, PytestBDDIdGeneratorHandler]):
+        features_base_dir = self._resolve_features_base_dir(config)
+
+        features = parse_features(
+            config,
+            self._gen_parse_tasks(config, features_base_dir),
+            *self.parse_args.args,
+            **{**dict(encoding=self.encoding), **_build_scenario_filter_kwargs(self.filter_), **self.parse_args.kwargs},
+        )
 
+        for feature in features:
             for pickle in feature.pickles:
                 if self.filter_ is None or self.filter_(config, feature, pickle):  # type: ignore
                     yield feature, pickle
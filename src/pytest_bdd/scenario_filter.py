@@ -0,0 +1,124 @@
+"""Declarative scenario filters.
+
+Unlike arbitrary callable filters, declarative ones are known to parsers before pickles are compiled, so scenarios and
+examples rows which would be filtered out anyway are not compiled at all.
+"""
+from copy import copy
+from typing import TYPE_CHECKING, Any, Collection, Dict, List, Optional, Sequence, Tuple
+
+from attr import attrib, attrs
+
+from pytest_bdd.const import TAG_PREFIX
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pytest_bdd.model import Feature
+    from pytest_bdd.model.messages import Pickle
+
+
+def _sorted_tuple_or_none(items: Optional[Collection[Any]]) -> Optional[Tuple[Any, ...]]:
+    return None if items is None else tuple(sorted(items))
+
+
+@attrs(frozen=True)
+class ScenarioFilter:
+    """Filter scenarios by names, line numbers and tag expression; All specified conditions have to be satisfied
+
+    :param names: Scenario names; Outline names are checked after placeholders are substituted
+    :param lines: Line numbers of scenarios or examples rows
+    :param tag_expression: pytest-like tag expression, for example "smoke and not slow"; Tag prefix is omitted
+    """
+
+    names: Optional[Tuple[str, ...]] = attrib(default=None, converter=_sorted_tuple_or_none)
+    lines: Optional[Tuple[int, ...]] = attrib(default=None, converter=_sorted_tuple_or_none)
+    tag_expression: Optional[str] = attrib(default=None)
+
+    def __call__(self, config, feature: "Feature", pickle: "Pickle") -> bool:
+        """Fallback check of already compiled pickles; Makes filter usable as callable filter"""
+        if self.names is not None and pickle.name not in self.names:
+            return False
+        if self.lines is not None:
+            pickle_lines = [
+                feature._get_pickle_line_number(pickle),
+                *(row.location.line for row in feature._get_pickle_ast_table_rows(pickle)),
+            ]
+            if not set(pickle_lines).intersection(self.lines):
+                return False
+        return self.is_matching_tags(tag.name for tag in pickle.tags)
+
+    def is_matching_tags(self, tag_names) -> bool:
+        if self.tag_expression is None:
+            return True
+        from _pytest.mark.expression import Expression
+
+        stripped_tag_names = {tag_name.lstrip(TAG_PREFIX) for tag_name in tag_names}
+        return bool(Expression.compile(self.tag_expression).evaluate(stripped_tag_names.__contains__))
+
+    def prune_gherkin_document(self, gherkin_document_raw_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Build copy of raw gherkin document which contains only scenarios and examples rows matching filter
+
+        Original document is not changed, so it could be used to build full AST
+        """
+        feature = gherkin_document_raw_dict.get("feature")
+        if feature is None:
+            return gherkin_document_raw_dict
+
+        pruned_document = copy(gherkin_document_raw_dict)
+        pruned_document["feature"] = self._prune_children_container(feature, self._get_tag_names(feature))
+        return pruned_document
+
+    @staticmethod
+    def _get_tag_names(node: Dict[str, Any]) -> List[str]:
+        return [tag["name"] for tag in node.get("tags", [])]
+
+    def _prune_children_container(self, node: Dict[str, Any], tag_names: Sequence[str]) -> Dict[str, Any]:
+        children = []
+        for child in node.get("children", []):
+            if "rule" in child:
+                rule = child["rule"]
+                pruned_rule = self._prune_children_container(rule, [*tag_names, *self._get_tag_names(rule)])
+                children.append({**child, "rule": pruned_rule})
+            elif "scenario" in child:
+                pruned_scenario = self._prune_scenario(child["scenario"], tag_names)
+                if pruned_scenario is not None:
+                    children.append({**child, "scenario": pruned_scenario})
+            else:
+                children.append(child)
+
+        pruned_node = copy(node)
+        pruned_node["children"] = children
+        return pruned_node
+
+    def _prune_scenario(self, scenario: Dict[str, Any], tag_names: Sequence[str]) -> Optional[Dict[str, Any]]:
+        scenario_tag_names = [*tag_names, *self._get_tag_names(scenario)]
+        is_scenario_line_matching = self.lines is None or scenario["location"]["line"] in self.lines
+
+        examples_list = scenario.get("examples", [])
+        if not examples_list:
+            is_matching = (
+                is_scenario_line_matching
+                and (self.names is None or scenario["name"] in self.names)
+                and self.is_matching_tags(scenario_tag_names)
+            )
+            return scenario if is_matching else None
+
+        pruned_examples_list = []
+        for examples in examples_list:
+            if not self.is_matching_tags([*scenario_tag_names, *self._get_tag_names(examples)]):
+                continue
+            header_cells = [cell["value"] for cell in examples.get("tableHeader", {}).get("cells", [])]
+            table_body = [
+                row
+                for row in examples.get("tableBody", [])
+                if (is_scenario_line_matching or row["location"]["line"] in self.lines)  # type: ignore[operator]
+                and (self.names is None or self._interpolate(scenario["name"], header_cells, row) in self.names)
+            ]
+            if table_body:
+                pruned_examples_list.append({**examples, "tableBody": table_body})
+
+        return {**scenario, "examples": pruned_examples_list} if pruned_examples_list else None
+
+    @staticmethod
+    def _interpolate(name: str, header_cells: Sequence[str], row: Dict[str, Any]) -> str:
+        for header_cell, cell in zip(header_cells, row["cells"]):
+            name = name.replace(f"<{header_cell}>", cell["value"])
+        return name
@@ -34,11 +34,30 @@ def given_beautiful_article(article):
     pass
 
 """
+import operator
 import os
 import warnings
+from collections import OrderedDict
 from contextlib import suppress
-from inspect import getfile, getsourcelines
-from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Set, Union, cast
+from copy import copy
+from inspect import getfile, getsourcelines, isasyncgenfunction, isgeneratorfunction
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 from uuid import uuid4
 from warnings import warn
 
@@ -46,15 +65,17 @@ import pytest
 from attr import Factory, attrib, attrs
 from ordered_set import OrderedSet
 
-from pytest_bdd.compatibility.pytest import Config, Parser, TypeAlias, get_config_root_path
+from pytest_bdd.compatibility.pytest import Config, Parser, TerminalReporter, TypeAlias, get_config_root_path
 from pytest_bdd.model import Feature, StepType
 from pytest_bdd.model.messages import Location, Pickle
 from pytest_bdd.model.messages import PickleStep as Step
 from pytest_bdd.model.messages import SourceReference, StepDefinition, StepDefinitionPattern
-from pytest_bdd.parsers import StepParser
+from pytest_bdd.parsers import MatchResult, StepParser, fold_literal_prefix, get_match_result, string
 from pytest_bdd.utils import (
+    DefaultMapping,
     PytestBDDIdGeneratorHandler,
     convert_str_to_python_name,
+    get_args,
     get_caller_module_locals,
     setdefaultattr,
 )
@@ -77,6 +98,27 @@ def add_options(parser: Parser):
         type="bool",
         help="Allow use different keywords with same step definition",
     )
+    parser.addini(
+        "bdd_step_match_cache_size",
+        default="4096",
+        help="Max count of step texts which matched step definitions are cached; 0 disables cache",
+    )
+    parser.addini(
+        "bdd_step_result_cache_size",
+        default="128",
+        help="Max count of results of pure step definitions which are cached; 0 disables cache",
+    )
+
+
+def configure(config: Config) -> None:
+    config.pytest_bdd_step_match_cache = StepHandler.MatchCache.build(config)  # type: ignore[attr-defined]
+    config.pytest_bdd_step_result_cache = StepHandler.ResultCache.build(config)  # type: ignore[attr-defined]
+
+
+def terminal_summary(terminalreporter: TerminalReporter, config: Config) -> None:
+    result_cache: Optional[StepHandler.ResultCache] = getattr(config, "pytest_bdd_step_result_cache", None)
+    if result_cache is not None and (result_cache.hits or result_cache.misses):
+        terminalreporter.write_sep("-", f"pure steps cache: {result_cache.hits} hits, {result_cache.misses} misses")
 
 
 def given(
@@ -88,6 +130,7 @@ def given(
     params_fixtures_mapping: Union[Set[str], Dict[str, str], Any] = True,
     param_defaults: Optional[dict] = None,
     liberal: Optional[bool] = None,
+    pure: bool = False,
     stacklevel=1,
 ) -> Callable:
     """Given step decorator.
@@ -101,6 +144,7 @@ def given(
     :param params_fixtures_mapping: StepHandler parameters would be injected as fixtures
     :param param_defaults: Default parameters for step definition
     :param liberal: Could step definition be used with other keywords
+    :param pure: Results of step function are cached by step arguments and fixtures it requests
     :param stacklevel: Stack level to find the caller frame. This is used when injecting the step definition fixture.
 
 
@@ -116,6 +160,7 @@ def given(
         params_fixtures_mapping=params_fixtures_mapping,
         param_defaults=param_defaults,
         liberal=liberal,
+        pure=pure,
         stacklevel=stacklevel + 1,
     )
 
@@ -129,6 +174,7 @@ def when(
     params_fixtures_mapping: Union[Set[str], Dict[str, str], Any] = True,
     param_defaults: Optional[dict] = None,
     liberal: Optional[bool] = None,
+    pure: bool = False,
     stacklevel=1,
 ) -> Callable:
     """When step decorator.
@@ -142,6 +188,7 @@ def when(
     :param params_fixtures_mapping: StepHandler parameters would be injected as fixtures
     :param param_defaults: Default parameters for step definition
     :param liberal: Could step definition be used with other keywords
+    :param pure: Results of step function are cached by step arguments and fixtures it requests
     :param stacklevel: Stack level to find the caller frame. This is used when injecting the step definition fixture.
 
     :return: Decorator function for the step.
@@ -156,6 +203,7 @@ def when(
         params_fixtures_mapping=params_fixtures_mapping,
         param_defaults=param_defaults,
         liberal=liberal,
+        pure=pure,
         stacklevel=stacklevel + 1,
     )
 
@@ -169,6 +217,7 @@ def then(
     params_fixtures_mapping: Union[Set[str], Dict[str, str], Any] = True,
     param_defaults: Optional[dict] = None,
     liberal: Optional[bool] = None,
+    pure: bool = False,
     stacklevel=1,
 ) -> Callable:
     """Then step decorator.
@@ -182,6 +231,7 @@ def then(
     :param params_fixtures_mapping: StepHandler parameters would be injected as fixtures
     :param param_defaults: Default parameters for step definition
     :param liberal: Could step definition be used with other keywords
+    :param pure: Results of step function are cached by step arguments and fixtures it requests
     :param stacklevel: Stack level to find the caller frame. This is used when injecting the step definition fixture.
 
     :return: Decorator function for the step.
@@ -196,6 +246,7 @@ def then(
         params_fixtures_mapping=params_fixtures_mapping,
         param_defaults=param_defaults,
         liberal=liberal,
+        pure=pure,
         stacklevel=stacklevel + 1,
     )
 
@@ -209,6 +260,7 @@ def step(
     params_fixtures_mapping: Union[Set[str], Dict[str, str], Any] = True,
     param_defaults: Optional[dict] = None,
     liberal: Optional[bool] = None,
+    pure: bool = False,
     stacklevel=1,
 ):
     """Liberal step decorator which could be used with any keyword.
@@ -222,6 +274,7 @@ def step(
     :param params_fixtures_mapping: StepHandler parameters would be injected as fixtures
     :param param_defaults: Default parameters for step definition
     :param liberal: Could step definition be used with other keywords
+    :param pure: Results of step function are cached by step arguments and fixtures it requests
     :param stacklevel: Stack level to find the caller frame. This is used when injecting the step definition fixture.
 
     :return: Decorator function for the step.
@@ -236,6 +289,7 @@ def step(
         params_fixtures_mapping=params_fixtures_mapping,
         param_defaults=param_defaults,
         liberal=liberal,
+        pure=pure,
         stacklevel=stacklevel + 1,
     )
 
@@ -245,6 +299,12 @@ class StepHandler:
 
     @attrs
     class Matcher:
+        """Matcher of steps to step definitions
+
+        State of every match is kept by a copy of matcher, so matcher could be called concurrently; Copies share step
+        type contexts and last matches of steps.
+        """
+
         config: Config = attrib()
         feature: Feature = attrib(init=False)
         pickle: Pickle = attrib(init=False)
@@ -252,6 +312,10 @@ class StepHandler:
         previous_step: Optional[Step] = attrib(init=False)
         step_registry: "StepHandler.Registry" = attrib(init=False)
         step_type_context = attrib(default=None)
+        match_results: Dict["StepHandler.Definition", Optional[MatchResult]] = attrib(default=Factory(dict), init=False)
+        # Step type contexts and last matches by step ids
+        step_type_contexts: Dict[str, Any] = attrib(default=Factory(dict), init=False)
+        last_matches: Dict[str, tuple] = attrib(default=Factory(dict), init=False)
 
         class MatchNotFoundError(RuntimeError):
             pass
@@ -264,46 +328,69 @@ class StepHandler:
             previous_step: Optional[Step],
             step_registry: "StepHandler.Registry",
         ) -> "StepHandler.Definition":
-            self.feature = feature
-            self.pickle = pickle
-            self.step = step
-            self.previous_step = previous_step
-            self.step_registry = step_registry
-
-            self.step_type_context = (
+            match = copy(self)
+            match.feature = feature
+            match.pickle = pickle
+            match.step = step
+            match.previous_step = previous_step
+            match.step_registry = step_registry
+            match.match_results = {}
+
+            step_type_context = (
                 self.step_type_context
-                if self.step.type is StepType.unknown and self.step_type_context is not None
-                else self.step.type
+                if previous_step is None
+                else self.step_type_contexts.get(previous_step.id, self.step_type_context)
             )
-
-            step_definitions = list(
-                self.find_step_definition_matches(
-                    self.step_registry, (self.strict_matcher, self.unspecified_matcher, self.liberal_matcher)
-                )
+            match.step_type_context = (
+                step_type_context if step.type is StepType.unknown and step_type_context is not None else step.type
             )
+            self.step_type_contexts[step.id] = match.step_type_context
+
+            step_definitions = match.find_cached_step_definition_matches(step_registry)
 
             if len(step_definitions) > 0:
                 if len(step_definitions) > 1:
                     warn(PytestBDDStepDefinitionWarning(f"Alternative step definitions are found: {step_definitions}"))
-                return step_definitions[0]
-            raise self.MatchNotFoundError(self.step.text)
+                step_definition = step_definitions[0]
+                self.last_matches[step.id] = step, step_definition, match.match_results.get(step_definition)
+                return step_definition
+            raise self.MatchNotFoundError(step.text)
+
+        def get_last_match_result(self, step: Step, step_definition: "StepHandler.Definition") -> Optional[MatchResult]:
+            """Get match result of the last match of step, so step arguments are parsed without rematch"""
+            last_match = self.last_matches.get(step.id)
+            if last_match is None:
+                return None
+            last_step, last_step_definition, match_result = last_match
+            return match_result if last_step is step and last_step_definition is step_definition else None
+
+        def is_step_definition_matching(self, step_definition: "StepHandler.Definition") -> bool:
+            try:
+                match_result = self.match_results[step_definition]
+            except KeyError:
+                match_result = self.match_results[step_definition] = get_match_result(
+                    step_definition.parser, self.step.text
+                )
+            return match_result is not None
 
         def strict_matcher(self, step_definition):
-            return step_definition.type_ == self.step_type_context and step_definition.parser.is_matching(
-                self.step.text
-            )
+            return step_definition.type_ == self.step_type_context and self.is_step_definition_matching(step_definition)
 
         def unspecified_matcher(self, step_definition):
             return (
                 self.step_type_context == StepType.unknown or step_definition.type_ == StepType.unknown
-            ) and step_definition.parser.is_matching(self.step.text)
+            ) and self.is_step_definition_matching(step_definition)
+
+        @property
+        def is_liberal_by_default(self) -> bool:
+            if self.config.option.liberal_steps is not None:
+                return self.config.option.liberal_steps
+            else:
+                return self.config.getini("liberal_steps")
 
         def liberal_matcher(self, step_definition):
             if step_definition.liberal is None:
-                if self.config.option.liberal_steps is not None:
-                    is_step_definition_liberal = self.config.option.liberal_steps
-                else:
-                    is_step_definition_liberal = self.config.getini("liberal_steps")
+                is_step_definition_liberal = self.is_liberal_by_default
             else:
                 is_step_definition_liberal = step_definition.liberal
 
@@ -312,10 +399,76 @@ class StepHandler:
                     not self.unspecified_matcher(step_definition),
                     is_step_definition_liberal,
                     step_definition.type_ != self.step_type_context,
-                    step_definition.parser.is_matching(self.step.text),
+                    self.is_step_definition_matching(step_definition),
                 )
             )
 
+        def find_cached_step_definition_matches(
+            self, registry: Optional["StepHandler.Registry"]
+        ) -> List["StepHandler.Definition"]:
+            match_cache: Optional[StepHandler.MatchCache] = getattr(self.config, "pytest_bdd_step_match_cache", None)
+            if match_cache is None or match_cache.maxsize <= 0:
+                return self.find_indexed_step_definition_matches(registry)
+
+            registries = []
+            while registry:
+                registries.append(registry)
+                registry = getattr(registry, "parent", None)
+            key = (
+                tuple(map(id, registries)),
+                self.step_type_context,
+                self.is_liberal_by_default,
+                self.step.text,
+            )
+            step_definitions = match_cache.get(key)
+            if step_definitions is None:
+                step_definitions = self.find_indexed_step_definition_matches(registries[0] if registries else None)
+                match_cache.put(key, registries, step_definitions)
+            return step_definitions
+
+        def find_indexed_step_definition_matches(
+            self, registry: Optional["StepHandler.Registry"]
+        ) -> List["StepHandler.Definition"]:
+            """Same as `find_step_definition_matches`, but matchers are applied only to candidates of flat index of
+            registry and its parents"""
+            matchers = (self.strict_matcher, self.unspecified_matcher, self.liberal_matcher)
+            while registry:
+                try:
+                    index = registry.get_flat_index()
+                except AttributeError:
+                    return list(self.find_step_definition_matches(registry, matchers))
+
+                if self.step_type_context == StepType.unknown:
+                    unspecified_step_types = index.step_types
+                else:
+                    unspecified_step_types = [StepType.unknown]
+                liberal_step_types = [
+                    step_type for step_type in index.step_types if step_type != self.step_type_context
+                ]
+                matchers_candidate_positions = [
+                    (matcher, index.get_candidate_positions(step_types, self.step.text))
+                    for matcher, step_types in (
+                        (self.strict_matcher, [self.step_type_context]),
+                        (self.unspecified_matcher, unspecified_step_types),
+                        (self.liberal_matcher, liberal_step_types),
+                    )
+                ]
+
+                # Registries are looked up one by one, so nearer registries definitions take precedence
+                for level in index.iter_levels():
+                    for matcher, candidate_positions in matchers_candidate_positions:
+                        found_matches = [
+                            step_definition
+                            for step_definition in map(
+                                index.definitions.__getitem__, filter(level.__contains__, candidate_positions)
+                            )
+                            if matcher(step_definition)
+                        ]
+                        if found_matches:
+                            return found_matches
+                registry = index.tail
+            return []
+
         @staticmethod
         def find_step_definition_matches(
             registry: Optional["StepHandler.Registry"], matchers: Sequence[Callable[["StepHandler.Definition"], bool]]
@@ -344,9 +497,18 @@ class StepHandler:
         param_defaults: dict = attrib()
         target_fixtures: Sequence[str] = attrib()
         liberal: Optional[Any] = attrib()
+        # Results of step function are cached by step arguments and fixtures values
+        pure: bool = attrib(default=False)
 
         id = attrib(init=False)
         __cached_message = attrib(init=False)
+        # Function which arguments were inspected and its arguments
+        __cached_func_args: Tuple[Callable, Sequence[str], FrozenSet[str]] = attrib(init=False)
+        # Step parameters names mapped to resolved step parameters which are injected as fixtures
+        __cached_params_fixtures: Dict[Tuple[str, ...], Dict[str, str]] = attrib(init=False, factory=dict)
+
+        # Step function arguments which are provided by runner instead of fixtures
+        SPECIAL_ARGS: ClassVar[FrozenSet[str]] = frozenset({"step"})
 
         def as_message(self, config: Union[Config, PytestBDDIdGeneratorHandler]):
             try:
@@ -367,19 +529,282 @@ class StepHandler:
                 message = self.__cached_message
             return message
 
-        def get_parameters(self, step: Step):
-            parsed_arguments = (
-                self.parser.parse_arguments(step.text, anonymous_group_names=self.anonymous_group_names) or {}
+        def _get_cached_func_args(self) -> Tuple[Callable, Sequence[str], FrozenSet[str]]:
+            try:
+                cached_func_args = self.__cached_func_args
+            except AttributeError:
+                cached_func_args = None
+            # Step function could be replaced by plugins, so its signature is inspected again in such case
+            if cached_func_args is None or cached_func_args[0] is not self.func:
+                func_args = get_args(self.func)
+                cached_func_args = self.__cached_func_args = (
+                    self.func,
+                    func_args,
+                    self.SPECIAL_ARGS.intersection(func_args),
+                )
+            return cached_func_args
+
+        @property
+        def func_args(self) -> Sequence[str]:
+            """Argument names of step function"""
+            return self._get_cached_func_args()[1]
+
+        @property
+        def special_args(self) -> FrozenSet[str]:
+            """Argument names of step function which are provided by runner"""
+            return self._get_cached_func_args()[2]
+
+        def get_params_fixtures(self, step_params: Iterable[str]) -> Dict[str, str]:
+            """Get step parameters which are injected as fixtures mapped to fixture names
+
+            :param step_params: Names of step parameters; Resolution is cached for every distinct set of names
+            """
+            params = tuple(step_params)
+            try:
+                return self.__cached_params_fixtures[params]
+            except KeyError:
+                pass
+            params_fixtures_mapping = DefaultMapping.instantiate_from_collection_or_bool(
+                self.params_fixtures_mapping or {}, warm_up_keys=params
             )
+            params_fixtures = self.__cached_params_fixtures[params] = {
+                param: fixture_name
+                for param, fixture_name in params_fixtures_mapping.items()
+                if param in params and fixture_name is not None
+            }
+            return params_fixtures
+
+        def get_parameters(self, step: Step, match_result: Optional[MatchResult] = None):
+            """Get step function parameters
+
+            :param match_result: Result of step text matching by parser of this definition; Step text is matched
+                                 again if it's not given
+            """
+            return self.convert_arguments(self.parse_arguments(step, match_result=match_result))
+
+        def parse_arguments(self, step: Step, match_result: Optional[MatchResult] = None) -> Dict[str, Any]:
+            """Get step arguments parsed from step text; Converters of step definition are not applied"""
+            if match_result is None and hasattr(self.parser, "match"):
+                match_result = self.parser.match(step.text)
+            if match_result is None:
+                return self.parser.parse_arguments(step.text, anonymous_group_names=self.anonymous_group_names) or {}
+            return match_result.get_arguments(self.anonymous_group_names)
+
+        def convert_arguments(self, parsed_arguments: Dict[str, Any]) -> Dict[str, Any]:
+            """Get step function parameters from parsed step arguments and parameters defaults"""
             return {
                 **self.param_defaults,
                 **{arg: self.converters.get(arg, lambda _: _)(value) for arg, value in parsed_arguments.items()},
             }
 
+    @attrs
+    class Index:
+        """Index of step definitions by step type and literal prefix of step parser
+
+        Index returns only candidates which could match step text; Candidates are ordered in the same way as registry
+        iterates over step definitions, so matching precedence is kept
+        """
+
+        definitions: List["StepHandler.Definition"] = attrib()
+        # Sizes of consecutive definition groups of registries in the order they are looked up; One group by default
+        level_sizes: List[int] = attrib(default=Factory(list))
+        # Registry which doesn't support indexing and is looked up after all indexed ones
+        tail: Optional[Any] = attrib(default=None)
+        sources: tuple = attrib(default=(), eq=False, repr=False)
+        step_types: List[Any] = attrib(default=Factory(list), init=False)
+        strings: Dict[Any, Dict[str, List[int]]] = attrib(default=Factory(dict), init=False)
+        prefixes: Dict[Any, dict] = attrib(default=Factory(dict), init=False)
+        folded_prefixes: Dict[Any, dict] = attrib(default=Factory(dict), init=False)
+        folded_positions: Dict[Any, List[int]] = attrib(default=Factory(dict), init=False)
+
+        PREFIX_ENTRIES_KEY = ""
+
+        def __attrs_post_init__(self):
+            if not self.level_sizes:
+                self.level_sizes.append(len(self.definitions))
+            for position, step_definition in enumerate(self.definitions):
+                step_type = step_definition.type_
+                if step_type not in self.step_types:
+                    self.step_types.append(step_type)
+                parser = step_definition.parser
+                if isinstance(parser, string):
+                    self.strings.setdefault(step_type, {}).setdefault(parser.name, []).append(position)
+                    continue
+                get_literal_prefix = getattr(parser, "get_literal_prefix", None)
+                prefix, is_case_sensitive = ("", True) if get_literal_prefix is None else get_literal_prefix()
+                if is_case_sensitive:
+                    self._add_prefix(self.prefixes.setdefault(step_type, {}), prefix, position)
+                else:
+                    self._add_prefix(self.folded_prefixes.setdefault(step_type, {}), prefix, position)
+                    self.folded_positions.setdefault(step_type, []).append(position)
+
+        def __len__(self):
+            return len(self.definitions)
+
+        @classmethod
+        def _add_prefix(cls, trie: dict, prefix: str, position: int):
+            node = trie
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node.setdefault(cls.PREFIX_ENTRIES_KEY, []).append(position)
+
+        @classmethod
+        def _search_prefixes(cls, trie: Optional[dict], text: str) -> Iterator[int]:
+            node = trie
+            if node is None:
+                return
+            yield from node.get(cls.PREFIX_ENTRIES_KEY, ())
+            for char in text:
+                node = node.get(char)
+                if node is None:
+                    return
+                yield from node.get(cls.PREFIX_ENTRIES_KEY, ())
+
+        @classmethod
+        def build_flat(
+            cls, index: "StepHandler.Index", parent_index: Optional["StepHandler.Index"], tail: Optional[Any] = None
+        ) -> "StepHandler.Index":
+            """Build index of registry definitions followed by definitions of its parents"""
+            if parent_index is None:
+                return cls(  # type: ignore[call-arg]
+                    definitions=index.definitions, tail=tail, sources=(index, parent_index, tail)
+                )
+            return cls(  # type: ignore[call-arg]
+                definitions=[*index.definitions, *parent_index.definitions],
+                level_sizes=[*index.level_sizes, *parent_index.level_sizes],
+                tail=parent_index.tail,
+                sources=(index, parent_index, tail),
+            )
+
+        def iter_levels(self) -> Iterator[range]:
+            """Iterate over ranges of positions of registries definitions in the lookup order"""
+            start = 0
+            for level_size in self.level_sizes:
+                yield range(start, start + level_size)
+                start += level_size
+
+        def get_candidates(self, step_types: Iterable[Any], text: str) -> List["StepHandler.Definition"]:
+            return [*map(self.definitions.__getitem__, self.get_candidate_positions(step_types, text))]
+
+        def get_candidate_positions(self, step_types: Iterable[Any], text: str) -> List[int]:
+            positions: List[int] = []
+            for step_type in step_types:
+                positions.extend(self.strings.get(step_type, {}).get(text, ()))
+                positions.extend(self._search_prefixes(self.prefixes.get(step_type), text))
+                if text.isascii():
+                    positions.extend(
+                        self._search_prefixes(self.folded_prefixes.get(step_type), fold_literal_prefix(text))
+                    )
+                else:
+                    positions.extend(self.folded_positions.get(step_type, ()))
+            return sorted(positions)
+
+    @attrs
+    class MatchCache:
+        """LRU cache of step definitions matched to step texts
+
+        Entries are keyed by identities of registries chain, step type context, liberal steps option and step text;
+        Cache is cleared when any step definition is registered
+        """
+
+        maxsize: int = attrib(default=4096)
+        hits: int = attrib(default=0, init=False)
+        misses: int = attrib(default=0, init=False)
+        entries: "OrderedDict[tuple, Tuple[list, List[StepHandler.Definition]]]" = attrib(
+            default=Factory(OrderedDict), init=False
+        )
+        registrations_count: int = attrib(default=0, init=False)
+
+        @classmethod
+        def build(cls, config: Config) -> "StepHandler.MatchCache":
+            return cls(maxsize=int(config.getini("bdd_step_match_cache_size")))  # type: ignore[call-arg]
+
+        def get(self, key) -> Optional[List["StepHandler.Definition"]]:
+            if self.registrations_count != StepHandler.Registry.registrations_count:
+                self.registrations_count = StepHandler.Registry.registrations_count
+                self.entries.clear()
+            try:
+                # Registries are stored with entry, so their ids used in key couldn't be reused by other objects
+                _, step_definitions = self.entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return step_definitions
+
+        def put(self, key, registries: list, step_definitions: List["StepHandler.Definition"]):
+            self.entries[key] = registries, step_definitions
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    @attrs
+    class ResultCache:
+        """LRU cache of results of pure step definitions
+
+        Entries are keyed by identity of step definition, step function arguments and text and argument of step, if
+        step function requests it; Hashable arguments are keyed by type and value, so equal values of different types,
+        like 1 and True, don't share entries. Unhashable arguments are keyed by identity and stored with entry, so their
+        ids couldn't be reused by other objects
+        """
+
+        maxsize: int = attrib(default=128)
+        hits: int = attrib(default=0, init=False)
+        misses: int = attrib(default=0, init=False)
+        entries: "OrderedDict[tuple, Tuple[list, Any]]" = attrib(default=Factory(OrderedDict), init=False)
+        lock: Lock = attrib(default=Factory(Lock), init=False, eq=False, repr=False)
+
+        @classmethod
+        def build(cls, config: Config) -> "StepHandler.ResultCache":
+            return cls(maxsize=int(config.getini("bdd_step_result_cache_size")))  # type: ignore[call-arg]
+
+        @staticmethod
+        def get_key(step_definition: "StepHandler.Definition", step, step_func_args: Dict[str, Any]):
+            pinned: list = [step_definition]
+            key: list = [id(step_definition)]
+            for name, value in step_func_args.items():
+                if name in step_definition.special_args:
+                    key.append((name, step.text, repr(step.argument)))
+                    continue
+                try:
+                    hash(value)
+                except TypeError:
+                    pinned.append(value)
+                    key.append((name, "id", id(value)))
+                else:
+                    key.append((name, type(value), value))
+            return tuple(key), pinned
+
+        def get(self, key) -> Tuple[bool, Any]:
+            if self.maxsize <= 0:
+                # Disabled cache doesn't count lookups
+                return False, None
+            with self.lock:
+                try:
+                    _, result = self.entries[key]
+                except KeyError:
+                    self.misses += 1
+                    return False, None
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return True, result
+
+        def put(self, key, pinned: list, result: Any):
+            if self.maxsize <= 0:
+                return
+            with self.lock:
+                self.entries[key] = pinned, result
+                if len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+
     @attrs
     class Registry:
-        registry: Set["StepHandler.Definition"] = attrib(default=Factory(set))
+        registrations_count: ClassVar[int] = 0
+
+        registry: Set["StepHandler.Definition"] = attrib(default=Factory(OrderedSet))
         parent: "StepHandler.Registry" = attrib(default=None, init=False)
+        index: Optional["StepHandler.Index"] = attrib(default=None, init=False, eq=False, repr=False)
+        flat_index: Optional["StepHandler.Index"] = attrib(default=None, init=False, eq=False, repr=False)
 
         @classmethod
         def inject_registry_fixture_and_register_steps(cls, obj):
@@ -394,6 +819,30 @@ class StepHandler:
 
         def register_step_definition(self, step_definition):
             self.registry.add(step_definition)
+            self.index = None
+            StepHandler.Registry.registrations_count += 1
+
+        def get_index(self) -> "StepHandler.Index":
+            """Get index of step definitions; It's rebuilt after registry is changed"""
+            if self.index is None or len(self.index) != len(self.registry):
+                self.index = StepHandler.Index(definitions=[*self.registry])  # type: ignore[call-arg]
+            return self.index
+
+        def get_flat_index(self) -> "StepHandler.Index":
+            """Get index of step definitions of registry and its parents; It's rebuilt only after any of them changed"""
+            parent_index, tail = None, None
+            if self.parent:
+                get_parent_flat_index = getattr(self.parent, "get_flat_index", None)
+                if get_parent_flat_index is None:
+                    tail = self.parent
+                else:
+                    parent_index = get_parent_flat_index()
+            index = self.get_index()
+
+            flat_index = self.flat_index
+            if flat_index is None or any(map(operator.is_not, flat_index.sources, (index, parent_index, tail))):
+                flat_index = self.flat_index = StepHandler.Index.build_flat(index, parent_index, tail)
+            return flat_index
 
         def register_steps(self, step_funcs):
             for step_func in step_funcs:
@@ -402,13 +851,13 @@ class StepHandler:
 
         @property
         def fixture(self):
-            @pytest.fixture
             def step_registry(step_registry):
                 self.parent = step_registry
                 return self
 
-            step_registry.__registry__ = self
-            return step_registry
+            # Registry is bound before function is wrapped, so it's accessible from fixture definition too
+            step_registry.__registry__ = self  # type: ignore[attr-defined]
+            return pytest.fixture(step_registry)
 
         def __iter__(self) -> Iterator["StepHandler.Definition"]:
             return iter(self.registry)
@@ -424,6 +873,7 @@ class StepHandler:
         params_fixtures_mapping: Union[Set[str], Dict[str, str], Any] = True,
         param_defaults: Optional[dict] = None,
         liberal: Optional[Any] = None,
+        pure: bool = False,
         stacklevel=2,
     ) -> Callable:
         """StepHandler decorator for the type and the name.
@@ -437,6 +887,7 @@ class StepHandler:
         :param params_fixtures_mapping: StepHandler parameters would be injected as fixtures
         :param param_defaults: Default parameters for step definition
         :param liberal: Could step definition be used with other keywords
+        :param pure: Results of step function are cached by step arguments and fixtures it requests
         :param stacklevel: Stack level to find the caller frame. This is used when injecting the step definition fixture
 
         :return: Decorator function for the step.
@@ -461,6 +912,15 @@ class StepHandler:
 
             :param function step_func: StepHandler definition function
             """
+            is_pure = pure
+            if is_pure and (isgeneratorfunction(step_func) or isasyncgenfunction(step_func)):
+                warnings.warn(
+                    PytestBDDStepDefinitionWarning(
+                        f"Results of generator step function {step_func.__name__} couldn't be cached"
+                    ),
+                    stacklevel=2,
+                )
+                is_pure = False
 
             step_definition = StepHandler.Definition(  # type: ignore[call-arg]
                 func=step_func,
@@ -472,9 +932,10 @@ class StepHandler:
                 param_defaults=cast(dict, param_defaults),
                 target_fixtures=cast(list, target_fixtures),
                 liberal=liberal,
+                pure=is_pure,
             )
 
-            setdefaultattr(step_func, "__pytest_bdd_step_definitions__", value_factory=set).add(step_definition)
+            setdefaultattr(step_func, "__pytest_bdd_step_definitions__", value_factory=OrderedSet).add(step_definition)
 
             # Allow step function have same names, so injecting same steps with generated names into module scope
             converted_name = convert_str_to_python_name(f'step_{step_type or ""}_{step_parserlike}_{uuid4()}')
@@ -1,7 +1,7 @@
 from itertools import filterfalse
 from json import loads as json_loads
 from operator import attrgetter
-from typing import Any, Union, cast
+from typing import Any, Optional, Union, cast
 
 from attr import attrib, attrs
 from gherkin.pickles.compiler import Compiler
@@ -23,6 +23,7 @@ from pytest_bdd.model.messages import (
     Tag,
     Type,
 )
+from pytest_bdd.scenario_filter import ScenarioFilter
 from pytest_bdd.struct_bdd.model import Join as StructJoin
 from pytest_bdd.struct_bdd.model import StepPrototype as StructStep
 from pytest_bdd.struct_bdd.model import Table as StructTable
@@ -45,13 +46,16 @@ class GherkinDocumentBuilder(_ASTBuilder):
             comments=[], uri=None, feature=StepToFeatureASTBuilder(self.model).build(id_generator=id_generator)
         )
 
-    def build_feature(self, filename, uri, id_generator):
+    def build_feature(self, filename, uri, id_generator, scenario_filter: Optional[ScenarioFilter] = None):
         gherkin_document = self.build(id_generator=id_generator)
         gherkin_document.uri = uri
 
         gherkin_document_serialized = gherkin_document.json(by_alias=True, exclude_none=True)
 
-        scenarios_data = Compiler().compile(json_loads(gherkin_document_serialized))
+        gherkin_document_raw_dict = json_loads(gherkin_document_serialized)
+        if scenario_filter is not None:
+            gherkin_document_raw_dict = scenario_filter.prune_gherkin_document(gherkin_document_raw_dict)
+        scenarios_data = Compiler().compile(gherkin_document_raw_dict)
         pickles = GherkinDocumentFeature.load_pickles(scenarios_data)
 
         feature = GherkinDocumentFeature(  # type: ignore[call-arg]
@@ -61,8 +65,6 @@ class GherkinDocumentBuilder(_ASTBuilder):
             filename=filename,
         )
 
-        feature.fill_registry()
-
         return feature
 
 
@@ -1,13 +1,13 @@
 from enum import Enum
 from functools import partial
-from operator import methodcaller
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from attr import attrib, attrs
 
 from pytest_bdd.compatibility.parser import ParserProtocol
 from pytest_bdd.compatibility.pytest import Config
+from pytest_bdd.discovery import DiscoveryGlob
 from pytest_bdd.struct_bdd.model import Step
 from pytest_bdd.struct_bdd.model_builder import GherkinDocumentBuilder
 from pytest_bdd.utils import PytestBDDIdGeneratorHandler
@@ -34,21 +34,30 @@ class StructBDDParser(ParserProtocol):
 
     @glob.default
     def glob_default(self):
-        return methodcaller("glob", "*" if self.kind is None else f"*.bdd.{self.kind}")
+        return DiscoveryGlob("*" if self.kind is None else f"*.bdd.{self.kind}")
 
     @loader.default
     def loader_default(self):
         return self.build_loader()
 
-    def parse(self, config: Union[Config, PytestBDDIdGeneratorHandler], path: Path, uri: str, *args, **kwargs):
-        encoding = kwargs.pop("encoding", "utf-8")
-        mode = kwargs.pop("mode", "r")
-        with path.open(mode=mode, encoding=encoding) as feature_file:
-            content = feature_file.read()
-        filename = str(path.as_posix())
-        raw_step = self.loader(content, *args, **kwargs)
+    def parse_text(
+        self,
+        config: Union[Config, PytestBDDIdGeneratorHandler],
+        data: str,
+        uri: str,
+        *args,
+        path: Optional[Path] = None,
+        **kwargs,
+    ):
+        kwargs.pop("encoding", None)
+        kwargs.pop("mode", None)
+        scenario_filter = kwargs.pop("scenario_filter", None)
+        filename = uri if path is None else str(path.as_posix())
+        raw_step = self.loader(data, *args, **kwargs)
         step = Step.parse_obj(raw_step)
-        return GherkinDocumentBuilder(model=step).build_feature(filename, uri, self.id_generator)  # type: ignore[call-arg]
+        return GherkinDocumentBuilder(model=step).build_feature(  # type: ignore[call-arg]
+            filename, uri, self.id_generator, scenario_filter=scenario_filter
+        )
 
     def build_loader(self):
         if self.kind == self.KIND.YAML.value:
@@ -17,6 +17,7 @@ from typing import (
     Callable,
     Collection,
     Dict,
+    List,
     Mapping,
     Optional,
     Pattern,
@@ -147,6 +148,71 @@ class DefaultMapping(defaultdict):
         return cls(bool_or_items, warm_up_keys=warm_up_keys)
 
 
+class FixturesOverlay:
+    """Fixtures injected into test item
+
+    Item gets one overlay which keeps values of injected fixtures in mutable mapping; Fixture definition of every
+    injected fixture name is created once and reused by later injections. Single finalizer restores fixture definitions
+    replaced by injection when item is torn down.
+    """
+
+    ITEM_ATTR = "pytest_bdd_fixtures_overlay"
+
+    def __init__(self, request):
+        self.request = request
+        self.values: Dict[str, Any] = {}
+        self.fixturedefs: Dict[str, FixtureDef] = {}
+        self.replaced_fixturedefs: Dict[str, Optional[FixtureDef]] = {}
+        self.added_fixturenames: List[str] = []
+
+    @classmethod
+    def get(cls, request) -> "FixturesOverlay":
+        item = request._pyfuncitem
+        overlay = getattr(item, cls.ITEM_ATTR, None)
+        if overlay is None:
+            # Injections are bound to test item, even if they are made by fixture request
+            overlay = cls(item._request)
+            setattr(item, cls.ITEM_ATTR, overlay)
+            item.addfinalizer(overlay.restore)
+        return overlay
+
+    def inject(self, arg, value):
+        request = self.request
+        fixturedef = self.fixturedefs.get(arg)
+        if fixturedef is None:
+            fixturedef = self.fixturedefs[arg] = FixtureDef(
+                fixturemanager=request._fixturemanager,
+                baseid=None,
+                argname=arg,
+                func=lambda: self.values[arg],
+                scope="function",
+                params=None,
+            )
+            self.replaced_fixturedefs[arg] = request._fixture_defs.get(arg)
+            if arg not in request.fixturenames:
+                request._pyfuncitem._fixtureinfo.names_closure.append(arg)
+                self.added_fixturenames.append(arg)
+
+        self.values[arg] = value
+        fixturedef.cached_result = (value, 0, None)
+        # inject fixture value in request cache
+        request._fixture_defs[arg] = fixturedef
+
+    def restore(self):
+        fixture_defs = self.request._fixture_defs
+        for arg, replaced_fixturedef in self.replaced_fixturedefs.items():
+            if replaced_fixturedef is None:
+                fixture_defs.pop(arg, None)
+            else:
+                fixture_defs[arg] = replaced_fixturedef
+
+        names_closure = self.request._pyfuncitem._fixtureinfo.names_closure
+        for arg in self.added_fixturenames:
+            names_closure.remove(arg)
+
+        delattr(self.request._pyfuncitem, self.ITEM_ATTR)
+
+
 def inject_fixture(request, arg, value):
     """Inject fixture into pytest fixture request.
 
@@ -154,35 +220,7 @@ def inject_fixture(request, arg, value):
     :param arg: argument name
     :param value: argument value
     """
-
-    fd = FixtureDef(
-        fixturemanager=request._fixturemanager,
-        baseid=None,
-        argname=arg,
-        func=lambda: value,
-        scope="function",
-        params=None,
-    )
-    fd.cached_result = (value, 0, None)
-
-    old_fd = request._fixture_defs.get(arg)
-    add_fixturename = arg not in request.fixturenames
-
-    def fin():
-        request._fixturemanager._arg2fixturedefs[arg].remove(fd)
-        request._fixture_defs[arg] = old_fd
-
-        if add_fixturename:
-            request._pyfuncitem._fixtureinfo.names_closure.remove(arg)
-
-    request.addfinalizer(fin)
-
-    # inject fixture definition
-    request._fixturemanager._arg2fixturedefs.setdefault(arg, []).insert(0, fd)
-    # inject fixture value in request cache
-    request._fixture_defs[arg] = fd
-    if add_fixturename:
-        request._pyfuncitem._fixtureinfo.names_closure.append(arg)
+    FixturesOverlay.get(request).inject(arg, value)
 
 
 def _itemgetter(*items):
@@ -0,0 +1,72 @@
+"""Heuristic parser unit tests."""
+from itertools import product
+
+from pytest_bdd import parsers
+
+
+def match_eagerly(format, name):
+    """Match name by all sub-parsers by priority as heuristic parser did before sub-parsers became lazy"""
+    for parser_type in (parsers.string, parsers.cucumber_expression, parsers.cfparse, parsers.re):
+        try:
+            parser = parser_type(format)
+        except Exception:
+            continue
+        if parser.is_matching(name):
+            return parser.parse_arguments(name, anonymous_group_names=["first", "second"])
+    return None
+
+
+def test_heuristic_parser_matches_same_as_eager_sub_parsers():
+    formats = [
+        "I have a cucumber",
+        "I have {int} cucumbers",
+        "I have {count:d} cucumbers",
+        "I have (\\d+) cucumbers?",
+        "I have a/an cucumber",
+        "I have cucumber(s)",
+        "a cucumber|an apple",
+    ]
+    names = [
+        "I have a cucumber",
+        "i HAVE A CUCUMBER",
+        "I have 5 cucumbers",
+        "I have 5 cucumber",
+        "I have an cucumber",
+        "I have cucumbers",
+        "an apple",
+        "I have {count:d} cucumbers",
+    ]
+    for format, name in product(formats, names):
+        parser = parsers.heuristic(format)
+        expected_arguments = match_eagerly(format, name)
+
+        for _ in range(2):  # Second time sub-parser remembered by the first match is used
+            assert parser.is_matching(name) is (expected_arguments is not None), (format, name)
+            assert parser.parse_arguments(name, anonymous_group_names=["first", "second"]) == expected_arguments
+
+        prefix, is_case_sensitive = parser.get_literal_prefix()
+        if expected_arguments is not None:
+            assert (name if is_case_sensitive else parsers.fold_literal_prefix(name)).startswith(prefix)
+
+
+def test_heuristic_sub_parsers_are_built_lazily():
+    parser = parsers.heuristic("I have a cucumber")
+    assert parser.is_plain_literal
+    assert [*parser.sub_parsers.keys()] == ["string_parser"]
+
+    assert parser.is_matching("I have a cucumber")
+    assert [*parser.sub_parsers.keys()] == ["string_parser"]
+
+    assert parser.is_matching("I have a Cucumber")
+    assert [*parser.sub_parsers.keys()] == ["string_parser", "cfparse_parser"]
+    assert parser.matched_priorities == {"I have a cucumber": 0, "I have a Cucumber": 1}
+
+
+def test_matched_priorities_are_bounded(monkeypatch):
+    parser = parsers.heuristic("I have {count} cucumbers")
+    monkeypatch.setattr(parser, "matched_priorities_maxsize", 2)
+
+    for count in [1, 2, 1, 3]:
+        assert parser.is_matching(f"I have {count} cucumbers")
+    # Least recently matched name is evicted, others are kept
+    assert [*parser.matched_priorities.keys()] == ["I have 1 cucumbers", "I have 3 cucumbers"]
@@ -0,0 +1,55 @@
+"""Tests for sharing of compiled step parsers."""
+import re
+
+from cucumber_expressions.parameter_type_registry import ParameterTypeRegistry
+
+from pytest_bdd import parsers
+from pytest_bdd.parsers import StepParser
+
+
+def test_identical_patterns_share_compiled_parsers():
+    heuristic_parser = StepParser.build("I have {count:d} cucumbers")
+    assert (
+        StepParser.build("I have {count:d} cucumbers").cfparse_parser.parser is heuristic_parser.cfparse_parser.parser
+    )
+    assert (
+        StepParser.build("I have {count:d} apples").cfparse_parser.parser is not heuristic_parser.cfparse_parser.parser
+    )
+    regex_parser = StepParser.build(re.compile(r"I have (\d+)"))
+    assert StepParser.build(re.compile(r"I have (\d+)")) is not regex_parser
+    assert StepParser.build(re.compile(r"I have (\d+)")).regex is regex_parser.regex
+    assert StepParser.build(re.compile(r"I have (\d+)", re.I)).regex is not regex_parser.regex
+
+    assert parsers.re(r"I have (\d+)").regex is parsers.re(r"I have (\d+)").regex
+    assert parsers.parse("I have {count:d}").parser is parsers.parse("I have {count:d}").parser
+    assert parsers.cfparse("I have {count:d}").parser is not parsers.parse("I have {count:d}").parser
+    assert (
+        parsers.cucumber_expression("I have {int}").expression is parsers.cucumber_expression("I have {int}").expression
+    )
+
+
+def test_parameter_type_registries_are_interned_by_identity():
+    registry = ParameterTypeRegistry()
+    other_registry = ParameterTypeRegistry()
+
+    expression = parsers.cucumber_expression("I have {int}", registry).expression
+    assert parsers.cucumber_expression("I have {int}", registry).expression is expression
+    assert parsers.cucumber_expression("I have {int}", other_registry).expression is not expression
+
+
+def test_heuristic_parsers_state_is_not_shared():
+    parser = StepParser.build("I have {count:d} cucumbers")
+    other_parser = StepParser.build("I have {count:d} cucumbers")
+    assert parser is not other_parser
+
+    assert parser.parse_arguments("I have 5 cucumbers") == {"count": 5}
+    assert "I have 5 cucumbers" in parser.matched_priorities
+    assert other_parser.matched_priorities == {}
+
+
+def test_interning_table_is_bounded(monkeypatch):
+    monkeypatch.setattr(parsers, "INTERNED_MAXSIZE", 2)
+    for index in range(3):
+        parsers.get_interned("test_kind", index, factory=lambda index: object())
+    interned_kinds = [key[:2] for key in parsers._interned.keys() if key[0] == "test_kind"]
+    assert interned_kinds == [("test_kind", 1), ("test_kind", 2)]
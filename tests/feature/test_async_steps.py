@@ -0,0 +1,157 @@
+"""Test async step definitions."""
+from pytest import mark
+
+
+def make_async_steps_test(testdir):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        connections="""\
+            Feature: Connections
+                Scenario Outline: Connection is reused
+                    Given I have connection <name>
+                    When I send "<message>"
+                    Then connection received "<message>"
+
+                    Examples:
+                    | name  | message |
+                    | first | ping    |
+                    | other | pong    |
+            """,
+    )
+    testdir.makeconftest(
+        # language=python
+        """\
+        import asyncio
+        from pytest_bdd import given, when, then, parsers
+
+        loops = []
+        closed_connections = []
+
+        def pytest_unconfigure(config):
+            config.loops, config.closed_connections = loops, closed_connections
+
+        @given(parsers.parse("I have connection {name}"), target_fixture="connection")
+        async def connection(name):
+            connection = dict(name=name, messages=[], loop=asyncio.get_running_loop())
+            yield connection
+            await asyncio.sleep(0)
+            closed_connections.append(name)
+
+        @when(parsers.parse('I send "{message}"'))
+        async def send(connection, message):
+            await asyncio.sleep(0)
+            connection["messages"].append(message)
+            loops.append(asyncio.get_running_loop())
+
+        @then(parsers.parse('connection received "{message}"'))
+        async def received(connection, message):
+            assert connection["messages"] == [message]
+            assert connection["loop"] is asyncio.get_running_loop()
+        """
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import scenarios
+
+        test_connections = scenarios("connections.feature")
+        """
+    )
+
+
+@mark.parametrize("scope_args, is_loop_shared", [([], True), (["--bdd-event-loop-scope=scenario"], False)])
+def test_async_steps(testdir, scope_args, is_loop_shared):
+    make_async_steps_test(testdir)
+    result = testdir.inline_run("--disable-feature-autoload", *scope_args)
+    result.assertoutcome(passed=2)
+
+    config = result.getcalls("pytest_unconfigure")[0].config
+    assert config.closed_connections == ["first", "other"]
+    first_loop, other_loop = config.loops
+    assert (first_loop is other_loop) is is_loop_shared
+    assert first_loop.is_closed()
+
+
+def test_async_generator_step_yields_once(testdir):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        steps="""\
+            Feature: Steps
+                Scenario: Step yields twice
+                    Given I yield twice
+            """,
+    )
+    testdir.makeconftest(
+        # language=python
+        """\
+        from pytest_bdd import given
+
+        @given("I yield twice")
+        async def yield_twice():
+            yield
+            yield
+        """
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import scenarios
+
+        test_steps = scenarios("steps.feature")
+        """
+    )
+    result = testdir.runpytest("--disable-feature-autoload")
+    result.assert_outcomes(passed=1, errors=1)
+    result.stdout.fnmatch_lines(["*yield_twice step function has more than one 'yield'*"])
+
+
+def test_async_step_on_running_event_loop(testdir):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        connections="""\
+            Feature: Connections
+                Scenario: Connection is opened
+                    Given I have connection
+            """,
+    )
+    testdir.makeconftest(
+        # language=python
+        """\
+        import asyncio
+        import threading
+
+        import pytest
+        from pytest_bdd import given
+
+        @pytest.fixture
+        def event_loop():
+            # Loop borrowed from other plugin is run by other thread
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever)
+            thread.start()
+            yield loop
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+        @given("I have connection", target_fixture="connection")
+        async def connection():
+            return dict()
+        """
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import scenarios
+
+        test_connections = scenarios("connections.feature")
+        """
+    )
+    result = testdir.runpytest("--disable-feature-autoload")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(
+        ['*AsyncStepError: Async step function "connection" could not be awaited: event loop is already running*']
+    )
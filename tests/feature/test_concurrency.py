@@ -0,0 +1,219 @@
+"""Test concurrent execution of scenarios."""
+from pytest import mark
+
+
+def make_concurrency_test(testdir):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        requests="""\
+            Feature: Requests
+                @thread_safe
+                Scenario Outline: Slow request
+                    Given I request <name>
+                    When request is answered in <delay> seconds
+                    Then <name> is answered
+
+                    Examples:
+                    | name   | delay |
+                    | first  | 0.4   |
+                    | second | 0.4   |
+                    | third  | 0.4   |
+                    | broken | 0.1   |
+
+                Scenario: Sequential request
+                    Given I request sequential
+                    When request is answered in 0.0 seconds
+                    Then sequential is answered
+            """,
+    )
+    testdir.makeconftest(
+        # language=python
+        """\
+        import threading
+        import time
+        import pytest
+        from pytest_bdd import given, when, then, parsers
+
+        replayed_steps = []
+
+        def pytest_bdd_after_step(request, step):
+            replayed_steps.append((request.getfixturevalue("answer")["name"], step.text))
+
+        def pytest_unconfigure(config):
+            config.replayed_steps = replayed_steps
+
+        @pytest.fixture(scope="session")
+        def timeline(pytestconfig):
+            pytestconfig.timeline = timeline = {}
+            return timeline
+
+        @given(parsers.parse("I request {name}"), target_fixture="answer")
+        def request_name(name):
+            return dict(name=name)
+
+        @when(parsers.parse("request is answered in {delay:f} seconds"))
+        def answer_request(answer, delay, timeline):
+            started = time.monotonic()
+            time.sleep(delay)
+            answer["answered"] = True
+            timeline[answer["name"]] = (started, time.monotonic(), threading.current_thread().name)
+
+        @then(parsers.parse("{name} is answered"))
+        def is_answered(answer, name):
+            assert name != "broken"
+            assert answer == dict(name=name, answered=True)
+        """
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import scenarios
+
+        test_requests = scenarios("requests.feature")
+        """
+    )
+
+
+@mark.parametrize("concurrency_args, is_concurrent", [(["--bdd-concurrency=4"], True), ([], False)])
+def test_thread_safe_scenarios_are_executed_concurrently(testdir, concurrency_args, is_concurrent):
+    make_concurrency_test(testdir)
+    result = testdir.inline_run("--disable-feature-autoload", *concurrency_args)
+    result.assertoutcome(passed=4, failed=1)
+
+    reports = [report for report in result.getreports("pytest_runtest_logreport") if report.when == "call"]
+    assert [report.outcome for report in reports] == ["passed", "passed", "passed", "failed", "passed"]
+    assert 'assert name != "broken"' in reports[3].longreprtext
+
+    config = result.getcalls("pytest_unconfigure")[0].config
+    starts, ends, thread_names = zip(*(config.timeline[name] for name in ["first", "second", "third"]))
+    assert (max(starts) < min(ends)) is is_concurrent
+    assert all(name.startswith("pytest-bdd") for name in thread_names) is is_concurrent
+    assert config.timeline["sequential"][2] == "MainThread"
+
+    # Steps hooks are called by the main thread in the order of scenarios
+    assert [name for name, _ in config.replayed_steps] == [
+        *["first"] * 3,
+        *["second"] * 3,
+        *["third"] * 3,
+        *["broken"] * 2,
+        *["sequential"] * 3,
+    ]
+
+
+def test_skipped_scenarios_are_not_executed_concurrently(testdir):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        requests="""\
+            Feature: Requests
+                @thread_safe
+                Scenario: First
+                    Given I request first
+
+                @thread_safe @skip
+                Scenario: Second
+                    Given I request second
+
+                @thread_safe
+                Scenario: Third
+                    Given I request third
+
+                @thread_safe
+                Scenario: Fourth
+                    Given I request fourth
+            """,
+    )
+    testdir.makeconftest(
+        # language=python
+        """\
+        import pytest
+        from pytest_bdd import given, parsers
+
+        requested = []
+
+        def pytest_collection_modifyitems(items):
+            for item in items:
+                if item.name.endswith("Third]"):
+                    item.add_marker(pytest.mark.xfail(run=False, reason="not run"))
+
+        def pytest_unconfigure(config):
+            config.requested = requested
+
+        @given(parsers.parse("I request {name}"))
+        def request_name(name):
+            requested.append(name)
+        """
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import scenarios
+
+        test_requests = scenarios("requests.feature")
+        """
+    )
+    result = testdir.inline_run("--disable-feature-autoload", "--bdd-concurrency=4")
+    result.assertoutcome(passed=2, skipped=2)
+
+    config = result.getcalls("pytest_unconfigure")[0].config
+    assert config.requested == ["first", "fourth"]
+
+
+@mark.parametrize("scope, is_concurrent", [("function", False), ("session", True)])
+def test_autouse_fixtures_of_concurrent_scenarios(testdir, scope, is_concurrent):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        requests="""\
+            Feature: Requests
+                @thread_safe
+                Scenario: First
+                    Given I request first
+
+                @thread_safe
+                Scenario: Second
+                    Given I request second
+            """,
+    )
+    testdir.makeconftest(
+        # language=python
+        f"""\
+        import threading
+        import pytest
+        from pytest_bdd import given, parsers
+
+        requested = []
+        current = dict(node=None)
+
+        @pytest.fixture(scope="{scope}", autouse=True)
+        def current_node(request):
+            current["node"] = request.node.name
+
+        def pytest_unconfigure(config):
+            config.requested = requested
+
+        @given(parsers.parse("I request {{name}}"))
+        def request_name(name):
+            requested.append((name, current["node"], threading.current_thread().name))
+        """
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import scenarios
+
+        test_requests = scenarios("requests.feature")
+        """
+    )
+    result = testdir.inline_run("--disable-feature-autoload", "--bdd-concurrency=2")
+    result.assertoutcome(passed=2)
+
+    config = result.getcalls("pytest_unconfigure")[0].config
+    names, nodes, thread_names = zip(*sorted(config.requested))
+    assert names == ("first", "second")
+    # Session-scoped fixture is set up before scenarios are executed, for the first item
+    assert all(node is not None for node in nodes)
+    assert all(name.startswith("pytest-bdd") for name in thread_names) is is_concurrent
+    if not is_concurrent:
+        assert [node.split("-")[-1] for node in nodes] == ["First]", "Second]"]
@@ -0,0 +1,127 @@
+"""Test discovery of feature files."""
+import json
+import os
+from textwrap import dedent
+
+from pytest import mark
+
+FEATURE = dedent(
+    # language=gherkin
+    """\
+    Feature: {name}
+        Scenario: Scenario of {name}
+            Given I have a bar
+    """
+)
+
+
+def make_features_tree(testdir):
+    for path in [
+        "features/first.feature",
+        "features/nested/second.feature",
+        "features/node_modules/ignored.feature",
+        "features/.hidden/ignored.feature",
+    ]:
+        feature_path = testdir.tmpdir.join(path)
+        feature_path.dirpath().ensure(dir=True)
+        feature_path.write(FEATURE.format(name=feature_path.purebasename))
+    testdir.tmpdir.join("features/notes.txt").write("Not a feature")
+    testdir.makeconftest(
+        # language=python
+        """\
+        from pytest_bdd import given
+
+        @given("I have a bar")
+        def bar():
+            ...
+        """
+    )
+
+
+def test_directory_walk_prunes_ignored_dirs_and_not_collectible_files(testdir):
+    make_features_tree(testdir)
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pathlib import Path
+        from pytest_bdd import scenarios
+
+        test_features = scenarios(Path("features"), features_base_dir=".")
+        """
+    )
+    result = testdir.runpytest("--disable-feature-autoload", "-v")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["*Scenario of first*", "*Scenario of second*"])
+
+
+def test_glob_prunes_ignored_dirs(testdir):
+    make_features_tree(testdir)
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import scenarios
+
+        test_features = scenarios("features/**/*.feature", features_base_dir=".")
+        """
+    )
+    result = testdir.runpytest("--disable-feature-autoload", "-v")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["*Scenario of first*", "*Scenario of second*"])
+
+
+def test_directory_index_is_reused_until_directory_is_changed(testdir):
+    make_features_tree(testdir)
+    testdir.makeini(
+        # language=ini
+        """\
+        [pytest]
+        bdd_discovery_index = true
+        """
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pathlib import Path
+        from pytest_bdd import scenarios
+
+        test_features = scenarios(Path("features"), features_base_dir=".")
+        """
+    )
+    features_dir = testdir.tmpdir.join("features")
+    for dir_path in [features_dir, features_dir.join("nested")]:
+        os.utime(str(dir_path), (0, 0))
+
+    result = testdir.runpytest("--disable-feature-autoload")
+    result.assert_outcomes(passed=2)
+
+    index_path = testdir.tmpdir.join(".pytest_cache", "v", "pytest_bdd", "discovery_index")
+    index = json.loads(index_path.read())
+    assert index[str(features_dir)][1] == ["first.feature", "notes.txt"]
+
+    # Indexed listing is used while directory mtime is unchanged
+    features_dir.join("unindexed.feature").write(FEATURE.format(name="unindexed"))
+    os.utime(str(features_dir), (0, 0))
+    result = testdir.runpytest("--disable-feature-autoload")
+    result.assert_outcomes(passed=2)
+
+    features_dir.join("indexed.feature").write(FEATURE.format(name="indexed"))
+    result = testdir.runpytest("--disable-feature-autoload")
+    result.assert_outcomes(passed=4)
+
+
+@mark.skipif(not hasattr(os, "symlink"), reason="Symlinks are not supported")
+@mark.parametrize("features", ['Path("features")', '"features/**/*.feature"'])
+def test_symlinked_dirs_are_not_followed(testdir, features):
+    make_features_tree(testdir)
+    os.symlink("..", str(testdir.tmpdir.join("features", "nested", "loop")), target_is_directory=True)
+    testdir.makepyfile(
+        # language=python
+        f"""\
+        from pathlib import Path
+        from pytest_bdd import scenarios
+
+        test_features = scenarios({features}, features_base_dir=".")
+        """
+    )
+    result = testdir.runpytest("--disable-feature-autoload", "-v")
+    result.assert_outcomes(passed=2)
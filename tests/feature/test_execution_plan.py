@@ -0,0 +1,98 @@
+"""Test execution plans of scenarios."""
+from pytest import mark
+
+
+def make_cucumbers_test(testdir):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        cucumbers="""\
+            Feature: Cucumbers
+                Scenario Outline: Eat cucumbers
+                    Given there are <start> cucumbers
+                    When I eat <eat> cucumbers
+                    Then I should have <left> cucumbers
+
+                    Examples:
+                    | start | eat | left |
+                    |  12   |  5  |  7   |
+                    |  5    |  4  |  1   |
+            """,
+    )
+    testdir.makeconftest(
+        # language=python
+        """\
+        import pytest
+        from pytest_bdd import given, when, then, parsers
+        from pytest_bdd.execution_plan import get_valid_plan
+
+        conversions = []
+
+        def convert(value):
+            conversions.append(value)
+            return int(value)
+
+        def pytest_collection_finish(session):
+            session.config.conversions_at_collection_finish = len(conversions)
+
+        @pytest.fixture
+        def plan_used():
+            return False
+
+        @given(parsers.parse("there are {start} cucumbers"), target_fixture="cucumbers", converters=dict(start=convert))
+        def start_cucumbers(start):
+            return dict(start=start, eat=0)
+
+        @when(parsers.parse("I eat {eat} cucumbers"), converters=dict(eat=convert))
+        def eat_cucumbers(cucumbers, eat):
+            cucumbers["eat"] += eat
+
+        @then(parsers.parse("I should have {left} cucumbers"), converters=dict(left=convert))
+        def should_have_left_cucumbers(cucumbers, start, left, plan_used, pytestconfig, request):
+            assert cucumbers["start"] - cucumbers["eat"] == left == start - cucumbers["eat"]
+            assert (get_valid_plan(request.node) is not None) is plan_used
+            # Step arguments of planned scenarios are converted when steps are executed
+            assert pytestconfig.conversions_at_collection_finish == 0
+        """
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import scenarios
+
+        test_cucumbers = scenarios("cucumbers.feature")
+        """
+    )
+
+
+@mark.parametrize("plans_args, plan_used", [([], False), (["--bdd-execution-plans"], True)])
+def test_execution_plan(testdir, plans_args, plan_used):
+    make_cucumbers_test(testdir)
+    testdir.makeconftest(
+        testdir.tmpdir.join("conftest.py").read()
+        + f"""
+@pytest.fixture
+def plan_used():
+    return {plan_used}
+"""
+    )
+    result = testdir.runpytest("--disable-feature-autoload", *plans_args)
+    result.assert_outcomes(passed=2)
+
+
+def test_execution_plan_is_invalidated_by_registration(testdir):
+    make_cucumbers_test(testdir)
+    testdir.makeconftest(
+        testdir.tmpdir.join("conftest.py").read()
+        + """
+@pytest.fixture(autouse=True)
+def register_step_definition(step_registry):
+    def unused_step():
+        ...
+
+    given("unused step")(unused_step)
+    step_registry.register_steps([unused_step])
+"""
+    )
+    result = testdir.runpytest("--disable-feature-autoload", "--bdd-execution-plans")
+    result.assert_outcomes(passed=2)
@@ -0,0 +1,129 @@
+"""Test session store of parsed features."""
+from textwrap import dedent
+
+
+def test_feature_is_parsed_once_per_session(testdir):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        shared=dedent(
+            """\
+            Feature: Shared feature
+                Scenario: First
+                    Given I have a bar
+
+                Scenario: Second
+                    Given I have a bar
+            """
+        ),
+    )
+    testdir.makeconftest(
+        # language=python
+        """\
+        from pytest_bdd import given
+
+        @given("I have a bar")
+        def bar():
+            ...
+
+        def pytest_sessionfinish(session):
+            store = session.config.pytest_bdd_feature_store
+            print(f"feature store hits: {store.hits} misses: {store.misses}")
+        """
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import scenario, scenarios
+
+        test_features = scenarios("shared.feature")
+
+        @scenario("shared.feature", "First")
+        def test_first(feature):
+            ...
+
+        @scenario("shared.feature", "Second")
+        def test_second(feature, scenario):
+            ...
+
+        def test_same_feature_instance(request):
+            features = {
+                id(item.callspec.params["feature"])
+                for item in request.session.items
+                if hasattr(item, "callspec") and "feature" in item.callspec.params
+            }
+            assert len(features) == 1
+        """
+    )
+    result = testdir.runpytest("--disable-feature-autoload", "-s")
+    result.assert_outcomes(passed=5)
+    result.stdout.fnmatch_lines(["*feature store hits: 2 misses: 1*"])
+
+
+def test_feature_bound_by_scenario_decorators_is_parsed_once(testdir):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        shared=dedent(
+            """\
+            Feature: Shared feature
+                Scenario: First
+                    Given I have a bar
+
+                Scenario: Second
+                    Given I have a bar
+
+                Scenario Outline: Third <name>
+                    Given I have a bar
+
+                    Examples:
+                    | name |
+                    | one  |
+                    | two  |
+            """
+        ),
+    )
+    testdir.makeconftest(
+        # language=python
+        """\
+        from pytest_bdd import given
+
+        @given("I have a bar")
+        def bar():
+            ...
+
+        def pytest_sessionfinish(session):
+            store = session.config.pytest_bdd_feature_store
+            print(f"feature store hits: {store.hits} misses: {store.misses}")
+        """
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import scenario
+
+        @scenario("shared.feature", "First")
+        def test_first(feature):
+            ...
+
+        @scenario("shared.feature", "Second")
+        def test_second(feature):
+            ...
+
+        @scenario("shared.feature", "Third two")
+        def test_third(feature):
+            ...
+
+        def test_same_feature_instance(request):
+            items = [item for item in request.session.items if item.name != "test_same_feature_instance"]
+            assert len({id(item.callspec.params["feature"]) for item in items}) == 1
+            assert [item.callspec.params["scenario"].name for item in items] == ["First", "Second", "Third two"]
+            # Pickles of other scenarios are compiled once in document order
+            feature = items[0].callspec.params["feature"]
+            assert [pickle.name for pickle in feature.pickles] == ["First", "Second", "Third one", "Third two"]
+            assert items[0].callspec.params["scenario"] is feature.pickles[0]
+        """
+    )
+    result = testdir.runpytest("--disable-feature-autoload", "-s")
+    result.assert_outcomes(passed=4)
+    result.stdout.fnmatch_lines(["*feature store hits: 2 misses: 1*"])
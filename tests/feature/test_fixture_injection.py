@@ -0,0 +1,78 @@
+"""Test injection of step parameters and target fixtures."""
+
+
+def test_injected_fixtures_share_overlay_of_item(testdir):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        cucumbers="""\
+            Feature: Cucumbers
+                Scenario: Eat cucumbers
+                    Given there are 12 cucumbers
+                    When I eat 5 cucumbers
+                    And I eat 3 cucumbers
+                    Then I should have 4 cucumbers
+                    And eaten cucumbers fixture is overridden
+            """,
+    )
+    testdir.makeconftest(
+        # language=python
+        """\
+        import pytest
+        from pytest_bdd import given, when, then, parsers
+        from pytest_bdd.utils import FixturesOverlay
+
+        @pytest.fixture
+        def eat():
+            return "not eaten"
+
+        @pytest.hookimpl(hookwrapper=True)
+        def pytest_runtest_call(item):
+            outcome = yield
+            overlay = getattr(item, FixturesOverlay.ITEM_ATTR)
+            # Fixture definition is created once per injected fixture name
+            assert [*overlay.fixturedefs.keys()] == ["start", "cucumbers", "eat"]
+            assert overlay.values["eat"] == 3
+            assert overlay.added_fixturenames == ["start", "cucumbers"]
+            item.config.eat_fixturedef = overlay.replaced_fixturedefs["eat"]
+
+        @pytest.hookimpl(hookwrapper=True)
+        def pytest_runtest_teardown(item):
+            yield
+            assert not hasattr(item, FixturesOverlay.ITEM_ATTR)
+            assert item._request._fixture_defs["eat"] is item.config.eat_fixturedef
+            assert "cucumbers" not in item._request._fixture_defs
+            assert "cucumbers" not in item._fixtureinfo.names_closure
+
+        @given(parsers.parse("there are {start:d} cucumbers"), target_fixture="cucumbers")
+        def start_cucumbers(start):
+            return dict(start=start, eaten=0)
+
+        @when(parsers.parse("I eat {eat:d} cucumbers"))
+        def eat_cucumbers(cucumbers, eat):
+            cucumbers["eaten"] += eat
+
+        @then(parsers.parse("I should have {left:d} cucumbers"), params_fixtures_mapping=False)
+        def should_have_left_cucumbers(cucumbers, start, left):
+            assert start - cucumbers["eaten"] == left
+
+        @then("eaten cucumbers fixture is overridden")
+        def eaten_cucumbers_fixture_is_overridden(request, eat):
+            assert eat == request.getfixturevalue("eat") == 3
+        """
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        import pytest
+        from pytest_bdd import scenarios
+
+        test_cucumbers = scenarios("cucumbers.feature")
+
+        @pytest.fixture(autouse=True)
+        def request_eat_fixture(eat):
+            assert eat == "not eaten"
+        """
+    )
+    result = testdir.runpytest("--disable-feature-autoload")
+    result.assert_outcomes(passed=1)
@@ -221,3 +221,114 @@ def test_feature_load_by_http_with_base_url_from_ini(testdir, httpserver: HTTPSe
     )
     result = testdir.runpytest_inprocess()
     result.assert_outcomes(passed=1)
+
+
+def test_feature_load_by_http_is_cached(testdir: "Testdir", httpserver: HTTPServer):
+    httpserver.expect_request("/feature", headers={"If-None-Match": '"v1"'}).respond_with_data("", status=304)
+    httpserver.expect_request("/feature").respond_with_data(
+        MINIMAL_FEATURE,
+        content_type=Mimetype.gherkin_plain.value,
+        headers={"ETag": '"v1"'},
+    )
+    testdir.makeconftest(MINIMAL_CONFTEST)
+    testdir.makepyfile(
+        # language=python
+        test_http=f"""\
+            from pytest_bdd import scenarios
+            from pytest_bdd.mimetypes import Mimetype
+
+            test_cuckes = scenarios(
+                f"http://localhost:{httpserver.port}/feature",
+                features_mimetype=Mimetype.gherkin_plain
+            )
+        """
+    )
+
+    def run_and_collect_statuses(*args):
+        httpserver.clear_log()
+        result = testdir.runpytest_inprocess(*args)
+        result.assert_outcomes(passed=1)
+        return [response.status_code for _, response in httpserver.log]
+
+    assert run_and_collect_statuses() == [200]
+    # Cached feature is revalidated by conditional request
+    assert run_and_collect_statuses() == [304]
+    # Fresh and offline cached features are not requested at all
+    assert run_and_collect_statuses("--bdd-http-cache-max-age=3600") == []
+    httpserver.clear_all_handlers()
+    assert run_and_collect_statuses("--bdd-http-offline") == []
+
+
+def test_feature_load_by_http_offline_without_cache(testdir: "Testdir", httpserver: HTTPServer):
+    httpserver.expect_request("/feature").respond_with_data(
+        MINIMAL_FEATURE,
+        content_type=Mimetype.gherkin_plain.value,
+    )
+    testdir.makeconftest(MINIMAL_CONFTEST)
+    testdir.makepyfile(
+        # language=python
+        test_http=f"""\
+            from pytest_bdd import scenarios
+            from pytest_bdd.mimetypes import Mimetype
+
+            test_cuckes = scenarios(
+                f"http://localhost:{httpserver.port}/feature",
+                features_mimetype=Mimetype.gherkin_plain
+            )
+        """
+    )
+    result = testdir.runpytest_inprocess("--bdd-http-offline")
+    result.assert_outcomes(skipped=1)
+    assert httpserver.log == []
+
+
+def test_remote_features_are_fetched_once_by_session_fetcher(testdir: "Testdir", httpserver: HTTPServer):
+    for name in ["first", "second", "third"]:
+        httpserver.expect_request(f"/{name}").respond_with_data(
+            MINIMAL_FEATURE.replace("Feature: minimal", f"Feature: {name}"),
+            content_type=Mimetype.gherkin_plain.value,
+        )
+        testdir.makefile(
+            # language=ini
+            **{
+                f"test_{name}": f"""\
+                    [InternetShortcut]
+                    URL=http://localhost:{httpserver.port}/{name}
+                """
+            },
+            ext=".url",
+        )
+    testdir.makeconftest(
+        MINIMAL_CONFTEST
+        + dedent(
+            # language=python
+            """\
+
+            def pytest_collection_modifyitems(config):
+                # Fetcher is shut down once collection is finished
+                print(f"fetched urls: {len(config.pytest_bdd_feature_fetcher.futures)}")
+            """
+        )
+    )
+    testdir.makepyfile(
+        # language=python
+        test_http=f"""\
+            from pytest_bdd import scenarios
+            from pytest_bdd.mimetypes import Mimetype
+
+            test_first = scenarios(
+                "http://localhost:{httpserver.port}/first",
+                "http://localhost:{httpserver.port}/second",
+                features_mimetype=Mimetype.gherkin_plain
+            )
+
+            test_third = scenarios(
+                "http://localhost:{httpserver.port}/third",
+                features_mimetype=Mimetype.gherkin_plain
+            )
+        """
+    )
+    result = testdir.runpytest_inprocess("-s")
+    result.assert_outcomes(passed=6)
+    result.stdout.fnmatch_lines(["*fetched urls: 3*"])
+    assert sorted(request.path for request, _ in httpserver.log) == ["/first", "/second", "/third"]
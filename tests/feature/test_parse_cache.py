@@ -0,0 +1,101 @@
+"""Test persistent cache of parsed features."""
+import json
+import os
+from collections import Counter
+from textwrap import dedent
+
+from pytest_bdd.parse_cache import CACHE_FILE_SUFFIX, FeatureParseCache, ParseCacheMode
+
+FEATURE = dedent(
+    # language=gherkin
+    """\
+    Feature: Cached feature
+        Scenario Outline: Cached outline
+            Given I have <count> cukes
+
+            Examples:
+            | count |
+            |   1   |
+            |   2   |
+    """
+)
+
+CONFTEST = dedent(
+    # language=python
+    """\
+    from pytest_bdd import given
+
+    @given("I have {count} cukes")
+    def cukes(count):
+        assert count in ("1", "2")
+
+    def pytest_sessionfinish(session):
+        cache = session.config.pytest_bdd_parse_cache
+        print(f"parse cache hits: {cache.hits} misses: {cache.misses}")
+    """
+)
+
+
+def test_features_are_loaded_from_parse_cache(testdir):
+    testdir.makefile(".feature", cached=FEATURE)
+    testdir.makeconftest(CONFTEST)
+
+    result = testdir.runpytest("--bdd-parse-cache=write", "-s")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["*parse cache hits: 0 misses: 1*"])
+
+    result = testdir.runpytest("--bdd-parse-cache=write", "-s")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["*parse cache hits: 1 misses: 0*"])
+
+
+def test_parse_cache_is_not_updated_in_read_mode(testdir):
+    testdir.makefile(".feature", cached=FEATURE)
+    testdir.makeconftest(CONFTEST)
+
+    for _ in range(2):
+        result = testdir.runpytest("--bdd-parse-cache=read", "-s")
+        result.assert_outcomes(passed=2)
+        result.stdout.fnmatch_lines(["*parse cache hits: 0 misses: 1*"])
+
+
+def test_parse_cache_is_invalidated_by_feature_change(testdir):
+    feature_path = testdir.makefile(".feature", cached=FEATURE)
+    testdir.makeconftest(CONFTEST)
+
+    testdir.runpytest("--bdd-parse-cache=write").assert_outcomes(passed=2)
+
+    feature_path.write_text(FEATURE + "            |   2   |\n", encoding="utf-8")
+    result = testdir.runpytest("--bdd-parse-cache=write", "-s")
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(["*parse cache hits: 0 misses: 1*"])
+
+
+def test_cached_features_get_unique_message_ids(testdir, tmp_path):
+    testdir.makefile(".feature", cached=FEATURE, other=FEATURE.replace("Cached feature", "Other feature"))
+    testdir.makeconftest(CONFTEST)
+
+    testdir.runpytest("--bdd-parse-cache=write").assert_outcomes(passed=4)
+
+    messages_path = tmp_path / "messages.ndjson"
+    result = testdir.runpytest("--bdd-parse-cache=write", "-s", f"--messages-ndjson={messages_path}")
+    result.assert_outcomes(passed=4)
+    result.stdout.fnmatch_lines(["*parse cache hits: 2 misses: 0*"])
+
+    messages = [*map(json.loads, messages_path.read_text().splitlines())]
+    pickle_ids = [message["pickle"]["id"] for message in messages if "pickle" in message]
+    assert len(pickle_ids) == 4
+    assert not [id_ for id_, count in Counter(pickle_ids).items() if count > 1]
+    assert len([message for message in messages if "source" in message]) == 2
+
+
+def test_parse_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = FeatureParseCache(cache_dir=tmp_path, mode=ParseCacheMode.WRITE, max_size=10)  # type: ignore[call-arg]
+    for index, mtime in enumerate([3, 1, 2]):
+        entry_path = tmp_path / f"{index}{CACHE_FILE_SUFFIX}"
+        entry_path.write_bytes(b"12345")
+        os.utime(entry_path, (mtime, mtime))
+
+    cache.evict()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [f"0{CACHE_FILE_SUFFIX}", f"2{CACHE_FILE_SUFFIX}"]
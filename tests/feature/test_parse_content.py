@@ -0,0 +1,76 @@
+"""Test parsing of features from memory."""
+import zipfile
+from textwrap import dedent
+
+import pytest
+
+FEATURE = dedent(
+    # language=gherkin
+    """\
+    Feature: Archived
+        Scenario: Archived scenario
+            Given I have a bar
+    """
+)
+
+STRUCT_BDD_FEATURE = dedent(
+    # language=yaml
+    """\
+    Name: Archived struct
+    Steps:
+        - Step:
+            Name: Archived struct scenario
+            Steps:
+                - Given: I have a bar
+    """
+)
+
+
+@pytest.mark.parametrize(
+    "parser_import, feature_content",
+    [
+        ("from pytest_bdd.parser import GherkinParser as Parser", FEATURE),
+        (
+            "from functools import partial; from pytest_bdd.struct_bdd.parser import StructBDDParser;"
+            "Parser = partial(StructBDDParser, kind='yaml')",
+            STRUCT_BDD_FEATURE,
+        ),
+    ],
+)
+def test_custom_locator_parses_features_from_archive(testdir, parser_import, feature_content):
+    with zipfile.ZipFile(testdir.tmpdir.join("features.zip"), "w") as archive:
+        archive.writestr("archived.feature", feature_content.replace("\n", "\r\n"))
+
+    testdir.makepyfile(
+        # language=python
+        f"""\
+        import zipfile
+        from pytest_bdd import given, scenarios
+        {parser_import}
+
+        class ArchiveScenarioLocator:
+            def resolve(self, config):
+                with zipfile.ZipFile("features.zip") as archive:
+                    for name in archive.namelist():
+                        parser = Parser(id_generator=config.pytest_bdd_id_generator)
+                        feature = parser.parse_bytes(config, archive.read(name), f"zip:{{name}}")
+                        for pickle in feature.pickles:
+                            yield feature, pickle
+
+        @given("I have a bar")
+        def bar():
+            ...
+
+        test_archived = scenarios(locators=[ArchiveScenarioLocator()])
+
+        def test_feature_filename(request):
+            filenames = {{
+                item.callspec.params["feature"].filename
+                for item in request.session.items
+                if hasattr(item, "callspec") and "feature" in item.callspec.params
+            }}
+            assert filenames == {{"zip:archived.feature"}}
+        """
+    )
+    result = testdir.runpytest("--disable-feature-autoload")
+    result.assert_outcomes(passed=2)
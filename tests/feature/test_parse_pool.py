@@ -0,0 +1,58 @@
+"""Test parallel parsing of features."""
+import json
+from textwrap import dedent
+
+FEATURE = dedent(
+    # language=gherkin
+    """\
+    Feature: {name}
+        Scenario Outline: Outline of {name}
+            Given I have <count> cukes
+
+            Examples:
+            | count |
+            |   1   |
+            |   2   |
+    """
+)
+
+
+def test_features_are_parsed_by_workers_same_as_in_place(testdir, tmp_path):
+    features_dir = testdir.mkdir("features")
+    for name in ["first", "second", "third"]:
+        features_dir.join(f"{name}.feature").write(FEATURE.format(name=name))
+
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import given, scenarios
+
+        @given("I have {count} cukes")
+        def cukes(count):
+            assert count in ("1", "2")
+
+        test_features = scenarios("features/*.feature", features_base_dir=".")
+        """
+    )
+
+    def run_and_collect_messages(*args):
+        messages_path = tmp_path / "messages.ndjson"
+        if messages_path.exists():
+            messages_path.unlink()
+        result = testdir.runpytest("--disable-feature-autoload", f"--messages-ndjson={messages_path}", *args)
+        result.assert_outcomes(passed=6)
+        return [
+            message
+            for message in map(json.loads, messages_path.read_text().splitlines())
+            if {"source", "gherkin_document", "pickle"} & set(message)
+        ]
+
+    in_place_messages = run_and_collect_messages()
+    worker_messages = run_and_collect_messages("--bdd-parse-workers=2")
+
+    assert len(in_place_messages) == 3 * (1 + 1 + 2)
+    assert worker_messages == in_place_messages
+
+    for _ in range(2):
+        cached_worker_messages = run_and_collect_messages("--bdd-parse-workers=2", "--bdd-parse-cache=write")
+        assert cached_worker_messages == in_place_messages
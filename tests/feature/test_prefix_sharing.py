@@ -0,0 +1,225 @@
+"""Test execution of scenarios sharing leading steps by forked processes."""
+import json
+import sys
+from textwrap import dedent
+
+from pytest import mark
+
+from pytest_bdd.compatibility.pytest import assert_outcomes
+
+
+@mark.skipif(not sys.platform.startswith("linux"), reason="Prefixes are forked only on Linux")
+def test_shared_prefixes_are_executed_once(testdir):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        database="""\
+            Feature: Database
+                Background:
+                    Given database is built
+
+                Scenario Outline: Rows are added
+                    Given row <row> is added
+                    When row <other> is added
+                    Then database has rows <rows>
+
+                    Examples:
+                    | row | other | rows |
+                    | a   | b     | a,b  |
+                    | a   | c     | a,c  |
+                    | d   | e     | d,e  |
+
+                Scenario: Rows are missing
+                    Then database has rows x
+            """,
+    )
+    testdir.makeconftest(
+        # language=python
+        """\
+        import json
+        from pathlib import Path
+
+        import pytest
+        from pytest_bdd import given, when, then, parsers, step
+
+        replayed_steps = []
+        databases = []
+
+        def pytest_bdd_after_step(request, step, step_func_args):
+            replayed_steps.append((step.text, step_func_args))
+
+        def pytest_bdd_after_scenario(request):
+            databases.append(request.getfixturevalue("database"))
+
+        def pytest_unconfigure(config):
+            results_path = Path(str(config.rootdir)) / "results.json"
+            results_path.write_text(json.dumps(dict(replayed_steps=replayed_steps, databases=databases), default=str))
+
+        @pytest.fixture(scope="session")
+        def executions_log(pytestconfig):
+            return Path(str(pytestconfig.rootdir)) / "executions.log"
+
+        def log_execution(executions_log, text):
+            with executions_log.open("a") as log:
+                log.write(f"{text}\\n")
+
+        @given("database is built", target_fixture="database")
+        def database(executions_log):
+            log_execution(executions_log, "build")
+            return []
+
+        @step(parsers.parse("row {row} is added"))
+        def add_row(database, row, executions_log):
+            log_execution(executions_log, row)
+            database.append(row)
+
+        @then(parsers.parse("database has rows {rows}"))
+        def has_rows(database, rows):
+            assert database == rows.split(",")
+        """
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import scenarios
+
+        test_database = scenarios("database.feature")
+        """
+    )
+    # Threads of test session, like ones of http server, are not started by separate pytest process
+    result = testdir.runpytest_subprocess("--disable-feature-autoload", "--bdd-fork-prefixes")
+    assert_outcomes(result, passed=3, failed=1)
+    result.stdout.fnmatch_lines(["*assert [] == ['x']*"])
+
+    executions = (testdir.tmpdir / "executions.log").read_text("utf-8").split()
+    # Background and the first step shared by two outline rows are executed once
+    assert sorted(executions) == sorted(["build", "a", "b", "c", "d", "e"])
+
+    results = json.loads((testdir.tmpdir / "results.json").read_text("utf-8"))
+    replayed_steps = [text for text, _ in results["replayed_steps"]]
+    assert replayed_steps == [
+        *["database is built", "row a is added", "row b is added", "database has rows a,b"],
+        *["database is built", "row a is added", "row c is added", "database has rows a,c"],
+        *["database is built", "row d is added", "row e is added", "database has rows d,e"],
+        "database is built",
+    ]
+
+    # Replayed hooks get all arguments of step functions and fixtures injected by forked steps are injected back
+    executions_log = str(testdir.tmpdir / "executions.log")
+    assert results["replayed_steps"][:3] == [
+        ["database is built", dict(executions_log=executions_log)],
+        # Values injected by forked steps are sent as they were after the step
+        ["row a is added", dict(database=["a"], row="a", executions_log=executions_log)],
+        ["row b is added", dict(database=["a", "b"], row="b", executions_log=executions_log)],
+    ]
+    assert results["databases"] == [["a", "b"], ["a", "c"], ["d", "e"], []]
+
+
+@mark.skipif(not sys.platform.startswith("linux"), reason="Prefixes are forked only on Linux")
+@mark.parametrize(
+    "conftest_extra, args, builds_count, not_forked_count",
+    [
+        ("", [], 1, 0),
+        (
+            # Function-scoped autouse fixture has to be set up for every scenario
+            # language=python
+            """\
+            @pytest.fixture(autouse=True)
+            def function_fixture():
+                ...
+            """,
+            [],
+            2,
+            0,
+        ),
+        (
+            # Only calling thread is copied by fork
+            # language=python
+            """\
+            stopped = threading.Event()
+
+            def pytest_configure(config):
+                threading.Thread(target=stopped.wait, name="waiter", daemon=True).start()
+
+            def pytest_unconfigure(config):
+                stopped.set()
+            """,
+            [],
+            2,
+            2,
+        ),
+        # Parse workers are stopped once collection is finished
+        ("", ["--bdd-parse-workers=2"], 1, 0),
+    ],
+    ids=["shared", "autouse", "threads", "parse-workers"],
+)
+def test_prefixes_are_not_shared_when_not_safe(testdir, conftest_extra, args, builds_count, not_forked_count):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        database="""\
+            Feature: Database
+                Background:
+                    Given database is built
+
+                Scenario Outline: Row is added
+                    Given row <row> is added
+
+                    Examples:
+                    | row |
+                    | a   |
+                    | b   |
+            """,
+        # language=gherkin
+        other="""\
+            Feature: Other
+                Scenario: Nothing is done
+                    Given nothing
+            """,
+    )
+    testdir.makeconftest(
+        # language=python
+        dedent(
+            f"""\
+        import threading
+        from pathlib import Path
+
+        import pytest
+        from pytest_bdd import given, parsers
+
+        @given("database is built", target_fixture="database")
+        def database(pytestconfig):
+            with (Path(str(pytestconfig.rootdir)) / "executions.log").open("a") as log:
+                log.write("build\\n")
+            return []
+
+        @given(parsers.parse("row {{row}} is added"))
+        def add_row(database, row):
+            database.append(row)
+
+        @given("nothing")
+        def nothing():
+            ...
+        """
+        )
+        + dedent(conftest_extra)
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import scenarios
+
+        test_database = scenarios("database.feature", "other.feature")
+        """
+    )
+    result = testdir.runpytest_subprocess("--disable-feature-autoload", "--bdd-fork-prefixes", *args)
+    assert_outcomes(result, passed=3)
+
+    executions = (testdir.tmpdir / "executions.log").read_text("utf-8").split()
+    assert executions == ["build"] * builds_count
+    if not_forked_count:
+        result.stdout.fnmatch_lines(
+            [f"*prefix sharing: {not_forked_count} scenarios were not forked because other threads were alive: waiter*"]
+        )
+    else:
+        result.stdout.no_fnmatch_line("*prefix sharing:*")
@@ -0,0 +1,108 @@
+"""Test declarative scenario filters."""
+import json
+from textwrap import dedent
+
+import pytest
+
+FEATURE = dedent(
+    # language=gherkin
+    """\
+    @feature_tag
+    Feature: Filtered feature
+        Scenario: Plain scenario
+            Given I have a bar
+
+        @smoke
+        Scenario Outline: Outline with <count> cukes
+            Given I have a bar
+
+            Examples:
+            | count |
+            |   1   |
+            |   2   |
+
+            @slow
+            Examples:
+            | count |
+            |   3   |
+
+        Rule: Some rule
+            @smoke
+            Scenario: Ruled scenario
+                Given I have a bar
+    """
+)
+
+INI = dedent(
+    # language=ini
+    """\
+    [pytest]
+    markers =
+        feature_tag
+        smoke
+        slow
+    """
+)
+
+
+@pytest.mark.parametrize(
+    "filter_, expected_names",
+    [
+        ('ScenarioFilter(names=["Plain scenario"])', ["Plain scenario"]),
+        ('ScenarioFilter(names=["Outline with 2 cukes"])', ["Outline with 2 cukes"]),
+        ("ScenarioFilter(lines=[7])", ["Outline with 1 cukes", "Outline with 2 cukes", "Outline with 3 cukes"]),
+        ("ScenarioFilter(lines=[13])", ["Outline with 2 cukes"]),
+        (
+            'ScenarioFilter(tag_expression="smoke and not slow")',
+            ["Outline with 1 cukes", "Outline with 2 cukes", "Ruled scenario"],
+        ),
+        (
+            'ScenarioFilter(tag_expression="feature_tag", names=["Ruled scenario", "Outline with 3 cukes"])',
+            ["Outline with 3 cukes", "Ruled scenario"],
+        ),
+        ('"Ruled scenario"', ["Ruled scenario"]),
+    ],
+)
+def test_only_filtered_pickles_are_compiled(testdir, tmp_path, filter_, expected_names):
+    testdir.makeini(INI)
+    testdir.makefile(".feature", filtered=FEATURE)
+    testdir.makepyfile(
+        # language=python
+        f"""\
+        from pytest_bdd import given, scenarios
+        from pytest_bdd.scenario_filter import ScenarioFilter
+
+        @given("I have a bar")
+        def bar():
+            ...
+
+        test_filtered = scenarios("filtered.feature", filter_={filter_})
+        """
+    )
+    messages_path = tmp_path / "messages.ndjson"
+    result = testdir.runpytest("--disable-feature-autoload", f"--messages-ndjson={messages_path}")
+    result.assert_outcomes(passed=len(expected_names))
+
+    messages = [*map(json.loads, messages_path.read_text().splitlines())]
+    assert sorted(message["pickle"]["name"] for message in messages if "pickle" in message) == expected_names
+
+
+def test_callable_filter_is_still_supported(testdir):
+    testdir.makeini(INI)
+    testdir.makefile(".feature", filtered=FEATURE)
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import given, scenarios
+
+        @given("I have a bar")
+        def bar():
+            ...
+
+        test_filtered = scenarios(
+            "filtered.feature", filter_=lambda config, feature, scenario: scenario.name.startswith("Outline")
+        )
+        """
+    )
+    result = testdir.runpytest("--disable-feature-autoload")
+    result.assert_outcomes(passed=3)
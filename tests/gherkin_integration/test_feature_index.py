@@ -0,0 +1,61 @@
+import json
+from pathlib import Path
+
+from attr.exceptions import FrozenInstanceError
+from pytest import mark, param, raises
+
+from pytest_bdd.model import Feature
+from pytest_bdd.model.messages import PickleStep, Scenario, Step, TableRow
+
+test_data = Path(__file__).parent.parent.parent / "testdata"
+
+
+@mark.parametrize(
+    "ast_path",
+    map(
+        lambda file: param(file, id=file.name),  # type: ignore[no-any-return]
+        (test_data / "good").glob("*.ast.ndjson"),
+    ),
+)
+def test_feature_index_matches_linked_ast_nodes(ast_path: Path):
+    pickles_path = ast_path.with_name(ast_path.name.replace(".ast.", ".pickles."))
+    gherkin_document = Feature.load_gherkin_document(json.loads(ast_path.read_text())["gherkinDocument"])
+    if gherkin_document.feature is None or not pickles_path.exists():
+        return
+    pickles = Feature.load_pickles(
+        [json.loads(line)["pickle"] for line in pickles_path.read_text().splitlines() if line.strip()]
+    )
+    feature = Feature(gherkin_document=gherkin_document, uri=gherkin_document.uri, pickles=pickles, filename="")
+
+    for pickle in feature.pickles:
+        linked_nodes = feature._get_linked_ast_nodes(pickle)
+        assert feature._get_pickle_ast_scenario(pickle) is next(node for node in linked_nodes if type(node) is Scenario)
+        assert feature._get_pickle_ast_table_rows(pickle) == [node for node in linked_nodes if type(node) is TableRow]
+        assert feature._get_pickle_line_number(pickle) == feature._get_pickle_ast_scenario(pickle).location.line
+
+        for pickle_step in pickle.steps:
+            step = next(node for node in feature._get_linked_ast_nodes(pickle_step) if type(node) is Step)
+            assert feature._get_pickle_step_model_step(pickle_step) is step
+            assert feature._get_step_keyword(pickle_step) == step.keyword.strip()
+            assert feature._get_step_line_number(pickle_step) == step.location.line
+            assert feature._get_step_doc_string(pickle_step) is step.doc_string
+            assert feature._get_step_data_table(pickle_step) is step.data_table
+
+        executable_steps = feature.get_executable_steps(pickle)
+        assert feature.get_executable_steps(pickle) == executable_steps
+        for pickle_step, executable_step in zip(pickle.steps, executable_steps):
+            assert feature.get_executable_step(executable_step) is executable_step
+            assert executable_step.pickle_step is pickle_step
+            assert executable_step.ast_step is feature._get_pickle_step_model_step(pickle_step)
+            assert (executable_step.id, executable_step.text, executable_step.type) == (
+                pickle_step.id,
+                pickle_step.text,
+                pickle_step.type,
+            )
+            assert executable_step.keyword == feature._get_step_keyword(pickle_step)
+            assert executable_step.dict() == pickle_step.dict()
+            # Views keep interface of pickle steps passed to hooks before
+            assert isinstance(executable_step, PickleStep)
+            assert executable_step.json() == pickle_step.json()
+            with raises(FrozenInstanceError):
+                executable_step.keyword = "Given"  # type: ignore[misc]
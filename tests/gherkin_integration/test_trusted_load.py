@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+
+from pytest import mark, param
+
+from pytest_bdd.model import loading
+from pytest_bdd.model.loading import construct_model, load_model
+from pytest_bdd.model.messages import GherkinDocument, Pickle
+
+test_data = Path(__file__).parent.parent.parent / "testdata"
+
+
+@mark.parametrize(
+    "model_type, path, key",
+    [
+        *map(
+            lambda file: param(GherkinDocument, file, "gherkinDocument", id=file.name),  # type: ignore[no-any-return]
+            (test_data / "good").glob("*.ast.ndjson"),
+        ),
+        *map(
+            lambda file: param(Pickle, file, "pickle", id=file.name),  # type: ignore[no-any-return]
+            (test_data / "good").glob("*.pickles.ndjson"),
+        ),
+    ],
+)
+def test_trusted_load_is_same_as_validated(model_type, path: Path, key):
+    with path.open(mode="r") as model_file:
+        for model_line in model_file:
+            model_datum = json.loads(model_line)[key]
+            trusted_model = construct_model(model_type, model_datum)
+            validated_model = model_type.parse_obj(model_datum)
+
+            assert trusted_model == validated_model
+            assert trusted_model.json(by_alias=True, exclude_none=True) == validated_model.json(
+                by_alias=True, exclude_none=True
+            )
+
+
+def test_models_are_validated_when_fields_shapes_are_not_supported(monkeypatch):
+    # Fields of pydantic 2 models couldn't be inspected, so models are always validated
+    monkeypatch.setattr(loading, "MODEL_FIELDS_SHAPES_SUPPORTED", False)
+    parsed_models = []
+    monkeypatch.setattr(Pickle, "parse_obj", classmethod(lambda cls, data: parsed_models.append(data) or data))
+
+    pickle_data = dict(id="1", uri="uri", name="name", language="en", steps=[], tags=[], astNodeIds=[])
+    assert load_model(Pickle, pickle_data) is pickle_data
+    assert parsed_models == [pickle_data]
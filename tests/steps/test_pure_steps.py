@@ -0,0 +1,108 @@
+"""Tests for results of pure step definitions cached for the session."""
+from types import SimpleNamespace
+
+from pytest import warns
+
+from pytest_bdd import PytestBDDStepDefinitionWarning, given
+from pytest_bdd.steps import StepHandler
+
+
+def test_pure_step_results_are_cached(testdir):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        models="""\
+            Feature: Models
+                Scenario Outline: Model is trained
+                    Given a trained model of <size> samples
+                    And a fresh model of <size> samples
+                    Then model knows <size> samples
+
+                    Examples:
+                    | size |
+                    | 10   |
+                    | 20   |
+                    | 10   |
+            """,
+    )
+    testdir.makeconftest(
+        # language=python
+        """\
+        import pytest
+        from pytest_bdd import given, then, parsers
+
+        trainings = []
+
+        def pytest_unconfigure(config):
+            config.trainings = trainings
+
+        @pytest.fixture(scope="session")
+        def dataset():
+            return list(range(100))
+
+        @pytest.fixture
+        def optimizer():
+            return dict(name="sgd")
+
+        @given(parsers.parse("a trained model of {size:d} samples"), target_fixture="model", pure=True)
+        def trained_model(dataset, size):
+            trainings.append(("trained", size))
+            return dict(samples=dataset[:size])
+
+        @given(parsers.parse("a fresh model of {size:d} samples"), target_fixture="fresh_model", pure=True)
+        def fresh_model(optimizer, size):
+            # Function-scoped fixture is different object for every scenario, so result is not reused
+            trainings.append(("fresh", size))
+            return dict(samples=size)
+
+        @then(parsers.parse("model knows {size:d} samples"))
+        def model_knows(model, size):
+            assert len(model["samples"]) == size
+        """
+    )
+    testdir.makepyfile(
+        # language=python
+        """\
+        from pytest_bdd import scenarios
+
+        test_models = scenarios("models.feature")
+        """
+    )
+    result = testdir.runpytest("--disable-feature-autoload")
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(["*pure steps cache: 1 hits, 5 misses*"])
+
+
+def test_generator_steps_are_not_pure():
+    with warns(PytestBDDStepDefinitionWarning, match="couldn't be cached"):
+
+        @given("I have a connection", target_fixture="connection", pure=True)
+        def connection():
+            yield object()
+
+    (step_definition,) = connection.__pytest_bdd_step_definitions__
+    assert not step_definition.pure
+
+
+def test_result_cache_keys_arguments_by_type():
+    @given("I have a number", pure=True)
+    def number(value):
+        return value
+
+    (step_definition,) = number.__pytest_bdd_step_definitions__
+    step = SimpleNamespace(text="I have a number", argument=None)
+    result_cache = StepHandler.ResultCache()  # type: ignore[call-arg]
+    keys = {result_cache.get_key(step_definition, step, dict(value=value))[0] for value in [1, 1.0, True]}
+    assert len(keys) == 3
+
+    key, pinned = result_cache.get_key(step_definition, step, dict(value=1))
+    result_cache.put(key, pinned, 1)
+    assert result_cache.get(result_cache.get_key(step_definition, step, dict(value=True))[0]) == (False, None)
+    assert result_cache.get(key) == (True, 1)
+
+
+def test_disabled_result_cache_does_not_count_misses():
+    result_cache = StepHandler.ResultCache(maxsize=0)  # type: ignore[call-arg]
+    result_cache.put(("key",), [], "result")
+    assert result_cache.get(("key",)) == (False, None)
+    assert (result_cache.hits, result_cache.misses) == (0, 0)
@@ -0,0 +1,68 @@
+"""Tests for step function arguments and step parameters fixtures cached by step definition."""
+from pytest import mark
+
+from pytest_bdd import parsers, steps
+from pytest_bdd.model import StepType
+from pytest_bdd.steps import StepHandler
+
+
+def build_definition(func, params_fixtures_mapping=True):
+    return StepHandler.Definition(  # type: ignore[call-arg]
+        func=func,
+        type_=StepType.context,
+        parser=parsers.parse("I have {count} {vegetables}"),
+        anonymous_group_names=None,
+        converters={},
+        params_fixtures_mapping=params_fixtures_mapping,
+        param_defaults={},
+        target_fixtures=[],
+        liberal=None,
+    )
+
+
+def test_step_function_arguments_are_inspected_once(monkeypatch):
+    inspected_funcs = []
+    original_get_args = steps.get_args
+
+    def get_args(func):
+        inspected_funcs.append(func)
+        return original_get_args(func)
+
+    monkeypatch.setattr(steps, "get_args", get_args)
+
+    def step_func(step, count, cucumbers_basket):
+        ...
+
+    step_definition = build_definition(step_func)
+    for _ in range(2):
+        assert step_definition.func_args == ["step", "count", "cucumbers_basket"]
+        assert step_definition.special_args == {"step"}
+    assert inspected_funcs == [step_func]
+
+    def other_step_func(count):
+        ...
+
+    # Step function replaced by plugin is inspected again
+    step_definition.func = other_step_func
+    assert step_definition.func_args == ["count"]
+    assert step_definition.special_args == frozenset()
+    assert inspected_funcs == [step_func, other_step_func]
+
+
+@mark.parametrize(
+    "params_fixtures_mapping, expected_params_fixtures",
+    [
+        (True, dict(count="count", vegetables="vegetables")),
+        (False, {}),
+        ({"count"}, dict(count="count")),
+        ({"count": "cucumbers_count", "fruits": "fruits"}, dict(count="cucumbers_count")),
+        ({"count": None, ...: ...}, dict(vegetables="vegetables")),
+        ({...: lambda param: f"basket_{param}"}, dict(count="basket_count", vegetables="basket_vegetables")),
+    ],
+)
+def test_params_fixtures_are_resolved_once(params_fixtures_mapping, expected_params_fixtures):
+    step_definition = build_definition(lambda: None, params_fixtures_mapping)
+
+    params_fixtures = step_definition.get_params_fixtures(["count", "vegetables"])
+    assert params_fixtures == expected_params_fixtures
+    assert step_definition.get_params_fixtures(["count", "vegetables"]) is params_fixtures
@@ -0,0 +1,199 @@
+"""Tests for the step matcher: index and match cache of step definitions, match results."""
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from types import SimpleNamespace
+
+from pytest import mark, raises
+
+from pytest_bdd import parsers
+from pytest_bdd.model import StepType
+from pytest_bdd.steps import StepHandler
+
+
+def build_definition(step_type, parser, liberal=None):
+    return StepHandler.Definition(  # type: ignore[call-arg]
+        func=lambda: None,
+        type_=step_type,
+        parser=parser,
+        anonymous_group_names=None,
+        converters={},
+        params_fixtures_mapping=True,
+        param_defaults={},
+        target_fixtures=[],
+        liberal=liberal,
+    )
+
+
+def build_registry(*step_definitions, parent=None):
+    registry = StepHandler.Registry()  # type: ignore[call-arg]
+    for step_definition in step_definitions:
+        registry.register_step_definition(step_definition)
+    registry.parent = parent
+    return registry
+
+
+def build_matcher(liberal_steps, match_cache=None):
+    config = SimpleNamespace(
+        option=SimpleNamespace(liberal_steps=liberal_steps),
+        getini=lambda name: False,
+        pytest_bdd_step_match_cache=match_cache,
+    )
+    return StepHandler.Matcher(config)  # type: ignore[call-arg]
+
+
+@mark.parametrize("liberal_steps", [False, True])
+def test_indexed_matches_are_same_as_full_scan(liberal_steps):
+    parent_registry = build_registry(
+        build_definition(StepType.context, parsers.string("I have a cucumber")),
+        build_definition(StepType.outcome, parsers.parse("I have {count:d} cucumbers")),
+        build_definition(StepType.unknown, parsers.re(r".*parent.*")),
+    )
+    registry = build_registry(
+        build_definition(StepType.context, parsers.string("I have a cucumber")),
+        build_definition(StepType.action, parsers.string("I have a cucumber"), liberal=True),
+        build_definition(StepType.context, parsers.parse("I have {count:d} cucumbers")),
+        build_definition(StepType.context, parsers.cfparse("I HAVE {count:d} CUCUMBERS")),
+        build_definition(StepType.action, parsers.re(r"I (eat|have) (?P<count>\d+) cucumbers")),
+        build_definition(StepType.action, parsers.re(re.compile(r"(?i)^i eat \d+ cucumbers"))),
+        build_definition(StepType.outcome, parsers.cucumber_expression("I have {int} cucumber(s)")),
+        build_definition(StepType.outcome, parsers.cucumber_regular_expression(r"^I have (\d+) cucumbers left$")),
+        build_definition(StepType.unknown, parsers.heuristic("I have {int} cucumbers")),
+        build_definition(StepType.unknown, parsers.heuristic("Ⅰ have nothing")),
+        build_definition(StepType.context, parsers.string("K elvin")),
+        build_definition(StepType.context, parsers.cfparse("k elvin")),
+        parent=parent_registry,
+    )
+    texts = [
+        "I have a cucumber",
+        "I have 5 cucumbers",
+        "i have 5 cucumbers",
+        "I have 1 cucumber",
+        "I eat 5 cucumbers",
+        "I EAT 5 cucumbers",
+        "I have 5 cucumbers left",
+        "Ⅰ have nothing",
+        "K elvin",
+        "k elvin",
+        "\u212a elvin",  # Kelvin sign is case-insensitively equal to "k"
+        "the parent step",
+        "unknown step",
+    ]
+    step_types = [StepType.context, StepType.action, StepType.outcome, StepType.unknown]
+
+    for text, step_type in product(texts, step_types):
+        matcher = build_matcher(liberal_steps)
+        matcher.step = SimpleNamespace(text=text, type=step_type)
+        matcher.step_type_context = step_type
+        expected_matches = list(
+            matcher.find_step_definition_matches(
+                registry, (matcher.strict_matcher, matcher.unspecified_matcher, matcher.liberal_matcher)
+            )
+        )
+
+        assert matcher.find_indexed_step_definition_matches(registry) == expected_matches, (text, step_type)
+
+
+def test_index_is_rebuilt_after_registration():
+    registry = build_registry(build_definition(StepType.context, parsers.string("I have a cucumber")))
+    index = registry.get_index()
+    assert registry.get_index() is index
+
+    step_definition = build_definition(StepType.context, parsers.parse("I have {count:d} cucumbers"))
+    registry.register_step_definition(step_definition)
+
+    assert registry.get_index() is not index
+    assert registry.get_index().get_candidates([StepType.context], "I have 5 cucumbers") == [step_definition]
+
+
+def test_match_cache():
+    step_definition = build_definition(StepType.context, parsers.parse("I have {count:d} cucumbers"))
+    registry = build_registry(step_definition)
+    match_cache = StepHandler.MatchCache(maxsize=2)  # type: ignore[call-arg]
+    matcher = build_matcher(False, match_cache=match_cache)
+
+    def match(text, step_type=StepType.context):
+        return matcher(None, None, SimpleNamespace(id="1", text=text, type=step_type), None, registry)
+
+    assert match("I have 5 cucumbers") is step_definition
+    assert match("I have 5 cucumbers") is step_definition
+    assert (match_cache.hits, match_cache.misses) == (1, 1)
+
+    with raises(StepHandler.Matcher.MatchNotFoundError):
+        match("I have 5 cucumbers", StepType.outcome)
+    with raises(StepHandler.Matcher.MatchNotFoundError):
+        match("I have 5 cucumbers", StepType.outcome)
+    assert (match_cache.hits, match_cache.misses) == (2, 2)
+
+    # Least recently used entry is evicted
+    match("I have 6 cucumbers")
+    assert len(match_cache.entries) == 2
+    match("I have 5 cucumbers")
+    assert (match_cache.hits, match_cache.misses) == (2, 4)
+
+    # Cache is cleared after registration
+    other_step_definition = build_definition(StepType.outcome, parsers.string("I have 5 cucumbers"))
+    registry.register_step_definition(other_step_definition)
+    assert match("I have 5 cucumbers", StepType.outcome) is other_step_definition
+    assert (match_cache.hits, match_cache.misses) == (2, 5)
+
+
+def test_step_text_is_matched_once():
+    class CountingParser(parsers.re):
+        match_calls = 0
+
+        def match(self, name):
+            CountingParser.match_calls += 1
+            return super().match(name)
+
+    step_definition = build_definition(
+        StepType.context, CountingParser(r"I have (\d+) (?P<vegetables>\w+)"), liberal=False
+    )
+    step_definition.anonymous_group_names = ["count"]
+    registry = build_registry(step_definition)
+    matcher = build_matcher(False)
+    step = SimpleNamespace(id="1", text="I have 5 cucumbers", type=StepType.context)
+
+    assert matcher(None, None, step, None, registry) is step_definition
+    match_result = matcher.get_last_match_result(step, step_definition)
+    assert step_definition.get_parameters(step, match_result=match_result) == dict(count="5", vegetables="cucumbers")
+    assert CountingParser.match_calls == 1
+
+
+def test_flat_index_is_built_once_per_registry_scope():
+    plugin_step_definition = build_definition(StepType.context, parsers.string("I have a cucumber"))
+    conftest_step_definition = build_definition(StepType.unknown, parsers.string("I have a cucumber"))
+    plugin_registry = build_registry(plugin_step_definition)
+    conftest_registry = build_registry(conftest_step_definition, parent=plugin_registry)
+    module_registry = build_registry(parent=conftest_registry)
+
+    flat_index = module_registry.get_flat_index()
+    assert flat_index.definitions == [conftest_step_definition, plugin_step_definition]
+    assert module_registry.get_flat_index() is flat_index
+
+    # Unspecified step definition of nearer registry takes precedence over strictly matched one of farther registry
+    matcher = build_matcher(False)
+    step = SimpleNamespace(id="1", text="I have a cucumber", type=StepType.context)
+    assert matcher(None, None, step, None, module_registry) is conftest_step_definition
+
+    other_step_definition = build_definition(StepType.context, parsers.string("I have an apple"))
+    plugin_registry.register_step_definition(other_step_definition)
+    assert module_registry.get_flat_index() is not flat_index
+    assert module_registry.get_flat_index().definitions[-1] is other_step_definition
+
+
+def test_matcher_is_reentrant():
+    cucumbers_definition = build_definition(StepType.context, parsers.parse("I have {count:d} cucumbers"))
+    apples_definition = build_definition(StepType.context, parsers.parse("I have {count:d} apples"))
+    registry = build_registry(cucumbers_definition, apples_definition)
+    matcher = build_matcher(False)
+
+    def match(index):
+        step_definition, vegetables = [(cucumbers_definition, "cucumbers"), (apples_definition, "apples")][index % 2]
+        step = SimpleNamespace(id=str(index), text=f"I have {index} {vegetables}", type=StepType.context)
+        assert matcher(None, None, step, None, registry) is step_definition
+        match_result = matcher.get_last_match_result(step, step_definition)
+        return step_definition.get_parameters(step, match_result=match_result)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert [*executor.map(match, range(200))] == [dict(count=index) for index in range(200)]
@@ -1,4 +1,5 @@
 import textwrap
+from types import SimpleNamespace
 
 
 def test_hooks(testdir):
@@ -64,3 +65,77 @@ def test_item_collection_does_not_break_on_non_function_items(testdir):
 
     result = testdir.runpytest()
     result.assert_outcomes(passed=1)
+
+
+def test_hook_dispatcher_calls_single_hookimpl_directly():
+    from pytest_bdd import hooks
+    from pytest_bdd.compatibility.pytest import PytestPluginManager
+    from pytest_bdd.runner import ScenarioRunner
+
+    plugin_manager = PytestPluginManager()
+    plugin_manager.add_hookspecs(hooks)
+    runner = ScenarioRunner()
+    plugin_manager.register(runner)
+    dispatcher = runner.get_hook_dispatcher(SimpleNamespace(pluginmanager=plugin_manager))
+    dispatcher.build()
+    hook_kwargs = dict(request=None, feature=None, scenario=None, step="step", step_func=None)
+
+    assert dispatcher("pytest_bdd_before_step", hook_kwargs) == []
+
+    class Plugin:
+        calls: list = []
+
+        def pytest_bdd_before_step(self, step):
+            self.calls.append(step)
+            return step
+
+    plugin = Plugin()
+    plugin_manager.register(plugin)
+    assert dispatcher("pytest_bdd_before_step", hook_kwargs) == ["step"]
+    # Single implementation is called directly
+    assert dispatcher.get_caller("pytest_bdd_before_step").__name__ == "call_single_hookimpl"
+
+    monitored_calls = []
+    undo_monitoring = plugin_manager.add_hookcall_monitoring(
+        before=lambda hook_name, *_: monitored_calls.append(hook_name), after=lambda *_: None
+    )
+    # Hook is dispatched by pluggy as soon as hook calls become monitored
+    assert dispatcher("pytest_bdd_before_step", hook_kwargs) == ["step"]
+    assert (Plugin.calls, monitored_calls) == (["step", "step"], ["pytest_bdd_before_step"])
+    undo_monitoring()
+
+    assert dispatcher("pytest_bdd_before_step", hook_kwargs) == ["step"]
+    assert (Plugin.calls, monitored_calls) == (["step", "step", "step"], ["pytest_bdd_before_step"])
+
+    plugin_manager.unregister(plugin)
+    assert dispatcher("pytest_bdd_before_step", hook_kwargs) == []
+    assert Plugin.calls == ["step", "step", "step"]
+
+
+def test_disabled_reporters_are_not_registered(testdir):
+    testdir.makefile(
+        ".feature",
+        # language=gherkin
+        steps="""\
+            Feature: Steps
+                Scenario: Step
+                    Given I have a step
+            """,
+    )
+    testdir.makeconftest(
+        # language=python
+        """\
+        from pytest_bdd import given
+
+        @given("I have a step")
+        def step(pytestconfig):
+            assert pytestconfig.pluginmanager.has_plugin("pytest_bdd_messages") is (
+                pytestconfig.option.messages_ndjson_path is not None
+            )
+        """
+    )
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
+
+    result = testdir.runpytest("--messages-ndjson", "messages.ndjson")
+    result.assert_outcomes(passed=1)